@@ -9,88 +9,186 @@ yt is a toolkit for analyzing and visualizing volumetric data.
 """
 
 from ._version import __version__, version_info  # isort: skip
-import yt.units as units
-import yt.utilities.physical_constants as physical_constants
-from yt.data_objects.api import (
-    DatasetSeries,
-    ImageArray,
-    ParticleProfile,
-    Profile1D,
-    Profile2D,
-    Profile3D,
-    add_particle_filter,
-    create_profile,
-    particle_filter,
-)
-from yt.fields.api import (
-    DerivedField,
-    FieldDetector,
-    FieldInfoContainer,
-    ValidateDataField,
-    ValidateGridType,
-    ValidateParameter,
-    ValidateProperty,
-    ValidateSpatial,
-    add_field,
-    add_xray_emissivity_field,
-    derived_field,
-    field_plugins,
-)
-from yt.funcs import (
-    enable_plugins,
-    get_memory_usage,
-    get_pbar,
-    get_version_stack,
-    get_yt_version,
-    insert_ipython,
-    is_root,
-    is_sequence,
-    memory_checker,
-    only_on_root,
-    parallel_profile,
-    print_tb,
-    rootonly,
-    toggle_interactivity,
-)
-from yt.units import (
-    YTArray,
-    YTQuantity,
-    display_ytarray,
-    loadtxt,
-    savetxt,
-    uconcatenate,
-    ucross,
-    udot,
-    uhstack,
-    uintersect1d,
-    unorm,
-    ustack,
-    uunion1d,
-    uvstack,
-)
-from yt.units.unit_object import define_unit  # type: ignore
+from importlib import import_module as _import_module
+
 from yt.utilities.logger import set_log_level, ytLogger as mylog
 
-from yt import frontends
-
-import yt.visualization.volume_rendering.api as volume_rendering
-from yt.frontends.stream.api import hexahedral_connectivity
-from yt.frontends.ytdata.api import save_as_dataset
-from yt.loaders import (
-    load,
-    load_amr_grids,
-    load_archive,
-    load_hdf5_file,
-    load_hexahedral_mesh,
-    load_octree,
-    load_particles,
-    load_sample,
-    load_simulation,
-    load_uniform_grid,
-    load_unstructured_mesh,
+# The public API is imported lazily: each of the names below is imported from
+# its module the first time it is accessed, so that e.g. loading a dataset does
+# not require importing the visualization machinery (and matplotlib).
+_lazy_imports: dict[str, tuple[str, ...]] = {
+    "yt.data_objects.api": (
+        "DatasetSeries",
+        "ImageArray",
+        "ParticleProfile",
+        "Profile1D",
+        "Profile2D",
+        "Profile3D",
+        "add_particle_filter",
+        "create_profile",
+        "particle_filter",
+    ),
+    "yt.fields.api": (
+        "DerivedField",
+        "FieldDetector",
+        "FieldInfoContainer",
+        "ValidateDataField",
+        "ValidateGridType",
+        "ValidateParameter",
+        "ValidateProperty",
+        "ValidateSpatial",
+        "add_field",
+        "add_xray_emissivity_field",
+        "derived_field",
+        "field_plugins",
+    ),
+    "yt.funcs": (
+        "enable_plugins",
+        "get_memory_usage",
+        "get_pbar",
+        "get_version_stack",
+        "get_yt_version",
+        "insert_ipython",
+        "is_root",
+        "is_sequence",
+        "memory_checker",
+        "only_on_root",
+        "parallel_profile",
+        "print_tb",
+        "rootonly",
+        "toggle_interactivity",
+    ),
+    "yt.units": (
+        "YTArray",
+        "YTQuantity",
+        "display_ytarray",
+        "loadtxt",
+        "savetxt",
+        "uconcatenate",
+        "ucross",
+        "udot",
+        "uhstack",
+        "uintersect1d",
+        "unorm",
+        "ustack",
+        "uunion1d",
+        "uvstack",
+    ),
+    "yt.units.unit_object": ("define_unit",),
+    "yt.frontends.stream.api": ("hexahedral_connectivity",),
+    "yt.frontends.ytdata.api": ("save_as_dataset",),
+    "yt.loaders": (
+        "load",
+        "load_amr_grids",
+        "load_archive",
+        "load_hdf5_file",
+        "load_hexahedral_mesh",
+        "load_octree",
+        "load_particles",
+        "load_sample",
+        "load_simulation",
+        "load_uniform_grid",
+        "load_unstructured_mesh",
+    ),
+    "yt.units.unit_systems": ("UnitSystem", "unit_system_registry"),
+    "yt.utilities.math_utils": ("ortho_find", "periodic_position", "quartiles"),
+    "yt.utilities.parallel_tools.parallel_analysis_interface": (
+        "communication_system",
+        "enable_parallelism",
+        "parallel_objects",
+    ),
+    "yt.visualization.api": (
+        "AxisAlignedProjectionPlot",
+        "AxisAlignedSlicePlot",
+        "FITSImageData",
+        "FITSOffAxisProjection",
+        "FITSOffAxisSlice",
+        "FITSParticleOffAxisProjection",
+        "FITSParticleProjection",
+        "FITSProjection",
+        "FITSSlice",
+        "FixedResolutionBuffer",
+        "LineBuffer",
+        "LinePlot",
+        "OffAxisProjectionPlot",
+        "OffAxisSlicePlot",
+        "ParticleImageBuffer",
+        "ParticlePhasePlot",
+        "ParticlePlot",
+        "ParticleProjectionPlot",
+        "PhasePlot",
+        "ProfilePlot",
+        "ProjectionPlot",
+        "SlicePlot",
+        "add_colormap",
+        "apply_colormap",
+        "make_colormap",
+        "plot_2d",
+        "scale_image",
+        "show_colormaps",
+        "write_bitmap",
+        "write_image",
+        "write_projection",
+    ),
+    "yt.visualization.volume_rendering.api": (
+        "ColorTransferFunction",
+        "TransferFunction",
+        "create_scene",
+        "off_axis_projection",
+        "volume_render",
+    ),
+}
+
+# modules exposed under a different name
+_lazy_modules = {
+    "units": "yt.units",
+    "physical_constants": "yt.utilities.physical_constants",
+    "volume_rendering": "yt.visualization.volume_rendering.api",
+}
+
+_lazy_attrs = {
+    name: module for module, names in _lazy_imports.items() for name in names
+}
+
+__all__ = sorted(
+    [
+        "__version__",
+        "version_info",
+        "frontends",
+        "mylog",
+        "run_nose",
+        "set_log_level",
+        *_lazy_attrs,
+        *_lazy_modules,
+    ]
 )
 
 
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in _lazy_attrs:
+        value = getattr(_import_module(_lazy_attrs[name]), name)
+    elif name in _lazy_modules:
+        value = _import_module(_lazy_modules[name])
+    else:
+        # subpackages and modules, such as yt.frontends or yt.visualization
+        try:
+            value = _import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 def run_nose(*args, **kwargs):
     # we hide this function behind a closure so we
     # don't make pytest a hard dependency for end users
@@ -101,61 +199,6 @@ def run_nose(*args, **kwargs):
 
 
 from yt.config import _setup_postinit_configuration
-from yt.units.unit_systems import UnitSystem, unit_system_registry  # type: ignore
-
-# Import some helpful math utilities
-from yt.utilities.math_utils import ortho_find, periodic_position, quartiles
-from yt.utilities.parallel_tools.parallel_analysis_interface import (
-    communication_system,
-    enable_parallelism,
-    parallel_objects,
-)
-
-# Now individual component imports from the visualization API
-from yt.visualization.api import (
-    AxisAlignedProjectionPlot,
-    AxisAlignedSlicePlot,
-    FITSImageData,
-    FITSOffAxisProjection,
-    FITSOffAxisSlice,
-    FITSParticleOffAxisProjection,
-    FITSParticleProjection,
-    FITSProjection,
-    FITSSlice,
-    FixedResolutionBuffer,
-    LineBuffer,
-    LinePlot,
-    OffAxisProjectionPlot,
-    OffAxisSlicePlot,
-    ParticleImageBuffer,
-    ParticlePhasePlot,
-    ParticlePlot,
-    ParticleProjectionPlot,
-    PhasePlot,
-    ProfilePlot,
-    ProjectionPlot,
-    SlicePlot,
-    add_colormap,
-    apply_colormap,
-    make_colormap,
-    plot_2d,
-    scale_image,
-    show_colormaps,
-    write_bitmap,
-    write_image,
-    write_projection,
-)
-from yt.visualization.volume_rendering.api import (
-    ColorTransferFunction,
-    TransferFunction,
-    create_scene,
-    off_axis_projection,
-    volume_render,
-)
-
-#    TransferFunctionHelper, MultiVariateTransferFunction
-#    off_axis_projection
-
 
 # run configuration callbacks
 _setup_postinit_configuration()
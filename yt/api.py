@@ -1,6 +1,17 @@
 """
 API for yt
 
-
+The public API is the one of the yt package, and is imported lazily on
+attribute access in the same way.
 
 """
+
+import yt
+
+
+def __getattr__(name):
+    return getattr(yt, name)
+
+
+def __dir__():
+    return dir(yt)
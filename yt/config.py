@@ -1,6 +1,10 @@
 import os
 
-from yt.utilities.configure import YTConfig, config_dir, configuration_callbacks
+from yt.utilities.configure import (
+    YTConfig,
+    config_dir,
+    run_configuration_callbacks,
+)
 
 ytcfg_defaults = {}
 
@@ -36,9 +40,21 @@ ytcfg_defaults["yt"] = {
     "imagebin_upload_url": "https://api.imgur.com/3/image",
     "imagebin_delete_url": "https://api.imgur.com/3/image/{delete_hash}",
     "curldrop_upload_url": "http://use.yt/upload",
-    "thread_field_detection": False,
+    "field_detection_cache": False,
     "ignore_invalid_unit_operation_errors": False,
     "chunk_size": 1000,
+    "io_threads": 0,
+    "max_open_files": 64,
+    "memory_map_particle_files": False,
+    "two_pass_particle_reads": False,
+    "field_cache_size": 0,
+    "derived_field_cache": False,
+    "grid_hierarchy_cache": False,
+    "octree_cache": False,
+    "index_processes": 0,
+    "particle_type_indexes": False,
+    "preload_buffer_size": 134217728,
+    "preload_in_background": False,
     "xray_data_dir": "/does/not/exist",
     "supp_data_dir": "/does/not/exist",
     "default_colormap": "cmyt.arbre",
@@ -76,5 +92,4 @@ elif os.path.exists(_global_config_file):
 
 def _setup_postinit_configuration():
     """This is meant to be run last in yt.__init__"""
-    for callback in configuration_callbacks:
-        callback(ytcfg)
+    run_configuration_callbacks(ytcfg)
@@ -73,6 +73,7 @@ class YTDataContainer(abc.ABC):
     _tds_fields: tuple[str, ...] = ()
     _field_cache = None
     _index = None
+    _float64_requests = 0
     _key_fields: list[str]
 
     def __init__(self, ds: Optional["Dataset"], field_parameters) -> None:
@@ -242,6 +243,9 @@ class YTDataContainer(abc.ABC):
         except KeyError:
             fi = self.ds._get_field_info(f)
             rv = self.ds.arr(self.field_data[key], fi.units)
+        if self._float64_requests and rv.dtype.kind == "f" and rv.dtype.itemsize < 8:
+            # a derived field that requires float64 inputs is being computed
+            rv = rv.astype("float64")
         return rv
 
     def _ipython_key_completions_(self):
@@ -316,8 +320,12 @@ class YTDataContainer(abc.ABC):
                         outputs.append(rv)
                         ind = 0  # Does this work with mesh?
                     with o._activate_cache():
+                        data = self.index._get_cached_field(o, field)
+                        if data is None:
+                            data = self[field]
+                            self.index._store_cached_field(o, field, data)
                         ind += o.select(
-                            self.selector, source=self[field], dest=rv, offset=ind
+                            self.selector, source=data, dest=rv, offset=ind
                         )
         else:
             chunks = self.index._chunk(self, "spatial", ngz=ngz)
@@ -331,9 +339,13 @@ class YTDataContainer(abc.ABC):
                             np.empty(wogz.ires.size, dtype="float64"), units
                         )
                         outputs.append(rv)
+                    data = self.index._get_cached_field(wogz, field)
+                    if data is None:
+                        data = gz[field][ngz:-ngz, ngz:-ngz, ngz:-ngz]
+                        self.index._store_cached_field(wogz, field, data)
                     ind += wogz.select(
                         self.selector,
-                        source=gz[field][ngz:-ngz, ngz:-ngz, ngz:-ngz],
+                        source=data,
                         dest=rv,
                         offset=ind,
                     )
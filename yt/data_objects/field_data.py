@@ -1,6 +1,65 @@
+from collections import OrderedDict
+
+
 class YTFieldData(dict):
     """
     A Container object for field data, instead of just having it be a dict.
     """
 
     pass
+
+
+class FieldDataCache:
+    """
+    A least-recently-used cache of field data read from disk, shared between
+    all the data containers of a dataset.
+
+    Entries are keyed on the selector hash, the field key and the field
+    parameters of the data container that read them, and the total size of
+    the cached arrays is kept under *max_bytes*.  A *max_bytes* of 0 disables
+    the cache.
+    """
+
+    def __init__(self, max_bytes=0):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({len(self)} entries, {self.nbytes} bytes, "
+            f"{self.hits} hits, {self.misses} misses)"
+        )
+
+    def get(self, key):
+        if key not in self._data:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def store(self, key, data):
+        if data.nbytes > self.max_bytes:
+            return
+        if key in self._data:
+            self.nbytes -= self._data.pop(key).nbytes
+        self._data[key] = data
+        self.nbytes += data.nbytes
+        while self.nbytes > self.max_bytes:
+            _, old_data = self._data.popitem(last=False)
+            self.nbytes -= old_data.nbytes
+
+    def clear(self):
+        self._data.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
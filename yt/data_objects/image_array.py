@@ -2,7 +2,6 @@ import numpy as np
 from unyt import unyt_array
 
 from yt.config import ytcfg
-from yt.visualization.image_writer import write_bitmap, write_image
 
 
 class ImageArray(unyt_array):
@@ -309,6 +308,8 @@ class ImageArray(unyt_array):
         else:
             out = scaled
 
+        from yt.visualization.image_writer import write_bitmap
+
         if filename is not None and filename[-4:] != ".png":
             filename += ".png"
 
@@ -372,6 +373,8 @@ class ImageArray(unyt_array):
         >>> im_arr.write_image("test_ImageArray.png")
 
         """
+        from yt.visualization.image_writer import write_image
+
         if cmap_name is None:
             cmap_name = ytcfg.get("yt", "default_colormap")
         if filename is not None and filename[-4:] != ".png":
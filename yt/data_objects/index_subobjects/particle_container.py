@@ -24,6 +24,9 @@ class ParticleContainer(YTSelectionContainer):
     _type_name = "particle_container"
     _skip_add = True
     _con_args = ("base_region", "base_selector", "data_files", "overlap_files")
+    # the particle types to read from the data files, as selected by the per
+    # particle type bitmap indexes (None for all of them)
+    ptypes = None
 
     def __init__(
         self, base_region, base_selector, data_files, overlap_files=None, domain_id=-1
@@ -8,7 +8,6 @@ from yt.utilities.exceptions import (
     YTFieldNotFound,
     YTFieldNotParseable,
 )
-from yt.visualization.line_plot import LineBuffer
 
 from .data_containers import _get_ipython_key_completion
 
@@ -179,6 +178,8 @@ class RegionExpression:
         start_point = [self._spec_to_value(v) for v in ray_slice.start]
         end_point = [self._spec_to_value(v) for v in ray_slice.stop]
         if getattr(ray_slice.step, "imag", 0.0) != 0.0:
+            from yt.visualization.line_plot import LineBuffer
+
             return LineBuffer(self.ds, start_point, end_point, int(ray_slice.step.imag))
         else:
             return self.ds.ray(start_point, end_point)
@@ -211,6 +212,8 @@ class RegionExpression:
                     axis = ax
                     new_slice.append(v)
         if npoints > 0:
+            from yt.visualization.line_plot import LineBuffer
+
             ray = LineBuffer(self.ds, start_point, end_point, npoints)
         else:
             if axis == 1:
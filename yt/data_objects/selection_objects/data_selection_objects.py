@@ -15,8 +15,10 @@ from yt.data_objects.data_containers import YTDataContainer
 from yt.data_objects.derived_quantities import DerivedQuantityCollection
 from yt.data_objects.field_data import YTFieldData
 from yt.fields.field_exceptions import NeedsGridType
+from yt.fields.field_plan import FieldPlan
 from yt.funcs import fix_axis, is_sequence, iter_fields, validate_width_tuple
 from yt.geometry.api import Geometry
+from yt.geometry.geometry_handler import YTDataChunk
 from yt.geometry.selection_routines import compose_selector
 from yt.units import YTArray
 from yt.utilities.exceptions import (
@@ -108,6 +110,121 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
                 # NOTE: we yield before releasing the context
                 yield self
 
+    def iter_chunks(self, fields, max_bytes=268435456, style="io"):
+        r"""Iterate over the selection in batches of bounded memory.
+
+        This yields dictionaries mapping each of the requested fields to its
+        values, with units, over a part of the selection.  Concatenating the
+        values yielded for a field gives the values of ``self[field]`` (in the
+        same order for the "io" style), but only one batch is held in memory at
+        a time.
+
+        Parameters
+        ----------
+        fields : field key or list of field keys
+            The fields to read or generate for each batch.
+        max_bytes : int, optional
+            The approximate maximum number of bytes used by the fields of a
+            batch.  Defaults to 256 MiB.
+        style : "io" or "spatial", optional
+            The chunking the batches are built from.  "io" groups data by the
+            file it is stored in, while "spatial" follows the order of the
+            index objects (e.g., grids).
+
+        Notes
+        -----
+        Batches are made of index objects: small objects are merged together,
+        chunks of many objects are split, and the selection of a grid larger
+        than *max_bytes* is split in slabs along its first axis.  For indexes
+        whose objects can't report the size of their selection up front
+        (octree and particle datasets), each chunk is yielded as is, which may
+        exceed *max_bytes*; a warning is issued in this case.
+
+        Examples
+        --------
+
+        >>> ds = yt.load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> sp = ds.sphere("c", (100, "kpc"))
+        >>> total_mass = ds.quan(0.0, "Msun")
+        >>> for data in sp.iter_chunks(("gas", "cell_mass"), max_bytes=2**26):
+        ...     total_mass += data["gas", "cell_mass"].sum()
+        """
+        if style not in ("io", "spatial"):
+            raise ValueError(f"Expected style to be 'io' or 'spatial', got {style!r}")
+        fields = self._determine_fields(list(iter_fields(fields)))
+        max_values = max_bytes // (8 * max(len(fields), 1))
+        self.get_data()  # Ensure we have built ourselves
+        batch = []
+        batch_size = 0
+        warned = False
+        for chunk in self.index._chunk(self, style):
+            counts = None
+            if chunk.data_size is not None:
+                counts = [obj.count(self.selector) for obj in chunk.objs]
+            if counts is None or any(count < 0 for count in counts):
+                if not warned:
+                    mylog.warning(
+                        "The size of the chunks of %s cannot be known before "
+                        "they are read: they are yielded whole, and may exceed "
+                        "max_bytes.",
+                        self.ds,
+                    )
+                    warned = True
+                if len(batch) > 0:
+                    yield self._read_batch(batch, batch_size, fields)
+                    batch = []
+                    batch_size = 0
+                yield self._read_chunk_fields(chunk, fields)
+                continue
+            for obj, count in zip(chunk.objs, counts, strict=True):
+                if count == 0:
+                    continue
+                if len(batch) > 0 and batch_size + count > max_values:
+                    yield self._read_batch(batch, batch_size, fields)
+                    batch = []
+                    batch_size = 0
+                if count > max_values and hasattr(obj, "ActiveDimensions"):
+                    yield from self._read_slabs(obj, max_values, fields)
+                    continue
+                batch.append(obj)
+                batch_size += count
+        if len(batch) > 0:
+            yield self._read_batch(batch, batch_size, fields)
+
+    def _read_slabs(self, grid, max_values, fields):
+        # Read the selection of a grid in slabs of cells along its first axis,
+        # which keeps the order of the values of the whole grid.
+        plane = int(np.prod(grid.ActiveDimensions[1:]))
+        if plane > max_values:
+            mylog.warning(
+                "A single plane of %s is larger than max_bytes, which is exceeded.",
+                grid,
+            )
+        step = max(max_values // plane, 1)
+        nx = int(grid.ActiveDimensions[0])
+        for start in range(0, nx, step):
+            stop = min(start + step, nx)
+            left = self.ds.domain_left_edge.copy()
+            right = self.ds.domain_right_edge.copy()
+            left[0] = grid.LeftEdge[0] + start * grid.dds[0]
+            right[0] = grid.LeftEdge[0] + stop * grid.dds[0]
+            center = self.center if self.center is not None else (left + right) / 2
+            slab = self.ds.region(center, left, right, data_source=self)
+            count = grid.count(slab.selector)
+            if count == 0:
+                continue
+            chunk = YTDataChunk(slab, "io", [grid], count, cache=False)
+            yield slab._read_chunk_fields(chunk, fields)
+
+    def _read_batch(self, objs, size, fields):
+        chunk = YTDataChunk(self, "io", objs, size, cache=False)
+        return self._read_chunk_fields(chunk, fields)
+
+    def _read_chunk_fields(self, chunk, fields):
+        with self._chunked_read(chunk):
+            self.get_data(fields)
+            return {field: self[field] for field in fields}
+
     def _identify_dependencies(self, fields_to_get, spatial=False):
         inspected = 0
         fields_to_get = fields_to_get[:]
@@ -134,6 +251,34 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
             fields_to_get += deps
         return sorted(fields_to_get)
 
+    def plan_fields(self, fields):
+        """
+        Return the plan used to generate a set of derived fields.
+
+        The plan lists the fields that will be generated, in order, each after
+        the fields it depends on, along with the fields that are read from
+        disk (or already available), the intermediate fields that are shared
+        between several consumers and when each intermediate field can be
+        released.
+
+        Parameters
+        ----------
+        fields : field key or list of field keys
+            The fields to plan for.
+
+        Examples
+        --------
+        >>> ds = yt.load("IsolatedGalaxy/galaxy0030/galaxy0030")
+        >>> ad = ds.all_data()
+        >>> print(
+        ...     ad.plan_fields(
+        ...         [("gas", "kinetic_energy_density"), ("gas", "mach_number")]
+        ...     )
+        ... )
+        """
+        fields = self._determine_fields(list(iter_fields(fields)))
+        return FieldPlan(self.ds, fields, self.field_data.keys())
+
     def get_data(self, fields=None):
         if self._current_chunk is None:
             self.index._identify_base_chunk(self)
@@ -201,15 +346,15 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
         # The _read method will figure out which fields it needs to get from
         # disk, and return a dict of those fields along with the fields that
         # need to be generated.
-        read_fluids, gen_fluids = self.index._read_fluid_fields(
-            fluids, self, self._current_chunk
+        read_fluids, gen_fluids = self._read_cached_fields(
+            self.index._read_fluid_fields, fluids
         )
         for f, v in read_fluids.items():
             self.field_data[f] = self.ds.arr(v, units=finfos[f].units)
             self.field_data[f].convert_to_units(finfos[f].output_units)
 
-        read_particles, gen_particles = self.index._read_particle_fields(
-            particles, self, self._current_chunk
+        read_particles, gen_particles = self._read_cached_fields(
+            self.index._read_particle_fields, particles
         )
 
         for f, v in read_particles.items():
@@ -217,12 +362,47 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
             self.field_data[f].convert_to_units(finfos[f].output_units)
 
         fields_to_generate += gen_fluids + gen_particles
-        self._generate_fields(fields_to_generate)
+        self._generate_fields(fields_to_generate, keep=ofields)
         for field in list(self.field_data.keys()):
             if field not in ofields:
                 self.field_data.pop(field)
 
-    def _generate_fields(self, fields_to_generate):
+    def _field_parameter_key(self):
+        key = []
+        for name, val in sorted(self.field_parameters.items()):
+            if isinstance(val, np.ndarray):
+                val = (str(getattr(val, "units", "")), val.dtype.str, val.tobytes())
+            else:
+                val = repr(val)
+            key.append((name, val))
+        return tuple(key)
+
+    def _read_cached_fields(self, read_method, fields):
+        # On-disk fields are shared with other data containers through the
+        # dataset's field cache when it is enabled, but only when we are
+        # reading our whole selection rather than one of its chunks.
+        cache = self.ds.field_cache
+        chunk = self._current_chunk
+        if cache.max_bytes <= 0 or (chunk is not None and chunk.chunk_type != "all"):
+            return read_method(fields, self, chunk)
+        fields_to_read, _ = self.index._split_fields(fields)
+        sel_hash = hash(self.selector)
+        fp_key = self._field_parameter_key()
+        keys = {field: (sel_hash, field, fp_key) for field in fields_to_read}
+        rv = {}
+        for field, key in keys.items():
+            data = cache.get(key)
+            if data is not None:
+                rv[field] = data.copy()
+        read_fields, gen_fields = read_method(
+            [field for field in fields if field not in rv], self, chunk
+        )
+        for field, data in read_fields.items():
+            cache.store(keys[field], data.copy())
+        rv.update(read_fields)
+        return rv, gen_fields
+
+    def _generate_fields(self, fields_to_generate, keep=None):
         index = 0
 
         def dimensions_compare_equal(a, b, /) -> bool:
@@ -242,10 +422,23 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
             # fields have a spatial requirement.  This will be checked inside
             # _generate_field, at which point additional dependencies may
             # actually be noted.
-            while any(f not in self.field_data for f in fields_to_generate):
+            # The fields are generated in the order of their dependency graph,
+            # so that intermediate fields are generated once, before their
+            # consumers, and, if we know which fields to keep, released right
+            # after their last consumer.
+            plan = FieldPlan(self.ds, fields_to_generate, self.field_data.keys())
+            intermediates = set(plan.steps).difference(fields_to_generate)
+            fields_to_generate = plan.steps + [
+                f for f in fields_to_generate if f not in plan.dependencies
+            ]
+            released = set()
+            while any(
+                f not in self.field_data and f not in released
+                for f in fields_to_generate
+            ):
                 field = fields_to_generate[index % len(fields_to_generate)]
                 index += 1
-                if field in self.field_data:
+                if field in self.field_data or field in released:
                     continue
                 fi = self.ds._get_field_info(field)
                 try:
@@ -298,10 +491,24 @@ class YTSelectionContainer(YTDataContainer, ParallelAnalysisInterface, abc.ABC):
                     except UnitParseError as e:
                         raise YTFieldUnitParseError(fi) from e
                     self.field_data[field] = fd
+                    if keep is not None:
+                        for f in plan.releasable_after(field):
+                            if f in plan.dependencies and f not in keep:
+                                del self.field_data[f]
+                                released.add(f)
                 except GenerationInProgress as gip:
                     for f in gip.fields:
+                        released.discard(f)
                         if f not in fields_to_generate:
                             fields_to_generate.append(f)
+                except Exception:
+                    # Intermediate fields are only generated ahead of time as
+                    # an optimization; if one can't be generated on its own,
+                    # we leave it to its consumers to ask for it.
+                    if field not in intermediates:
+                        raise
+                    intermediates.discard(field)
+                    released.add(field)
 
     def __or__(self, other):
         if not isinstance(other, YTSelectionContainer):
@@ -5,7 +5,6 @@ from yt.data_objects.selection_objects.data_selection_objects import (
     YTSelectionContainer1D,
 )
 from yt.data_objects.static_output import Dataset
-from yt.frontends.sph.data_structures import SPHDataset
 from yt.funcs import (
     fix_axis,
     validate_3d_array,
@@ -186,6 +185,9 @@ class YTRay(YTSelectionContainer1D):
         self._dts, self._ts = None, None
 
     def _generate_container_field(self, field):
+        # imported here, as the SPH frontend imports the data objects
+        from yt.frontends.sph.data_structures import SPHDataset
+
         # What should we do with `ParticleDataset`?
         if isinstance(self.ds, SPHDataset):
             return self._generate_container_field_sph(field)
@@ -32,6 +32,7 @@ from yt._typing import (
     ParticleType,
 )
 from yt.config import ytcfg
+from yt.data_objects.field_data import FieldDataCache
 from yt.data_objects.particle_filters import ParticleFilter, filter_registry
 from yt.data_objects.region_expression import RegionExpression
 from yt.data_objects.unions import ParticleUnion
@@ -60,7 +61,7 @@ from yt.units.unit_systems import (  # type: ignore
     unit_system_registry,
 )
 from yt.units.yt_array import YTArray, YTQuantity
-from yt.utilities.configure import YTConfig, configuration_callbacks
+from yt.utilities.configure import YTConfig, register_configuration_callback
 from yt.utilities.cosmology import Cosmology
 from yt.utilities.exceptions import (
     YTFieldNotFound,
@@ -90,6 +91,41 @@ else:
 
 _cached_datasets: MutableMapping[int | str, "Dataset"] = weakref.WeakValueDictionary()
 
+
+def _dataset_cache_key(filename, args, kwargs):
+    apath = os.path.abspath(os.path.expanduser(filename))
+    return (apath, pickle.dumps(args), pickle.dumps(kwargs))
+
+
+def _load_dataset(cls, filename, args, kwargs, preserve_dtype=False):
+    """
+    Instantiate *cls* as ``cls(filename, *args, **kwargs)`` does, with the
+    given value of preserve_dtype.
+
+    Since preserve_dtype changes the dtype of the fields read from disk, it is
+    part of the key of the dataset cache: a dataset loaded with one value is
+    never returned, nor modified, by a load with the other one.
+    """
+    if not preserve_dtype:
+        return cls(filename, *args, **kwargs)
+    if cls.__new__ is not Dataset.__new__:
+        # e.g. datasets that are returned as a series, which are not cached
+        ds = cls(filename, *args, **kwargs)
+        ds.preserve_dtype = True
+        return ds
+    cache_key = None
+    if isinstance(filename, str) and not ytcfg.get("yt", "skip_dataset_cache"):
+        cache_key = (*_dataset_cache_key(filename, args, kwargs), "preserve_dtype")
+        if cache_key in _cached_datasets:
+            return _cached_datasets[cache_key]
+    ds = object.__new__(cls)
+    # set before the index and its IO handler are created
+    ds.preserve_dtype = True
+    ds.__init__(filename, *args, **kwargs)
+    if cache_key is not None and not ds._skip_cache:
+        _cached_datasets[cache_key] = ds
+    return ds
+
 # we set this global to None as a place holder
 # its actual instantiation is delayed until after yt.__init__
 # is completed because we need yt.config.ytcfg to be instantiated first
@@ -102,7 +138,7 @@ def _setup_ds_store(ytcfg: YTConfig) -> None:
     _ds_store = ParameterFileStore()
 
 
-configuration_callbacks.append(_setup_ds_store)
+register_configuration_callback(_setup_ds_store)
 
 
 def _unsupported_object(ds, obj_name):
@@ -180,6 +216,9 @@ class Dataset(abc.ABC):
     _ionization_label_format = "roman_numeral"
     _determined_fields: dict[str, list[FieldKey]] | None = None
     fields_detected = False
+    # set by yt.load(..., preserve_dtype=True) to skip the float64 upcast of
+    # floating point data read from disk
+    preserve_dtype = False
 
     # these are set in self._parse_parameter_file()
     domain_left_edge = MutableAttribute(True)
@@ -206,8 +245,7 @@ class Dataset(abc.ABC):
             if not is_stream:
                 obj.__init__(filename, *args, **kwargs)
             return obj
-        apath = os.path.abspath(os.path.expanduser(filename))
-        cache_key = (apath, pickle.dumps(args), pickle.dumps(kwargs))
+        cache_key = _dataset_cache_key(filename, args, kwargs)
         if ytcfg.get("yt", "skip_dataset_cache"):
             obj = object.__new__(cls)
         elif cache_key not in _cached_datasets:
@@ -434,6 +472,17 @@ class Dataset(abc.ABC):
         s = f"{self.basename};{self.current_time};{self.unique_identifier}"
         return hashlib.md5(s.encode("utf-8")).hexdigest()
 
+    @cached_property
+    def field_cache(self):
+        """
+        A cache of field data read from disk, shared between all the data
+        containers of this dataset.  Its size in bytes is initialized from the
+        ``field_cache_size`` configuration option (0 disables it) and can be
+        changed by setting ``ds.field_cache.max_bytes``.  The ``hits`` and
+        ``misses`` attributes count cache lookups.
+        """
+        return FieldDataCache(ytcfg.get("yt", "field_cache_size"))
+
     @cached_property
     def checksum(self):
         """
@@ -656,6 +705,7 @@ class Dataset(abc.ABC):
 
     def create_field_info(self):
         self.field_dependencies = {}
+        self._field_graph = {}
         self.derived_field_list = []
         self.filtered_particle_types = []
         self.field_info = self._field_info_class(self, self.field_list)
@@ -1047,6 +1097,10 @@ class Dataset(abc.ABC):
 
     def _setup_classes(self):
         # Called by subclass
+        # data object classes register themselves when their module is
+        # imported, which "import yt" no longer does
+        import yt.data_objects.api  # noqa: F401
+
         self.object_types = []
         self.objects = []
         self.plots = []
@@ -1154,18 +1208,29 @@ class Dataset(abc.ABC):
         else:
             return ret
 
-    def find_field_values_at_points(self, fields, coords):
+    def find_field_values_at_points(self, fields, coords, interpolation="nearest"):
         """
         Returns the values [field1, field2,...] of the fields at the given
         [(x1, y1, z2), (x2, y2, z2),...] points.  Returns a list of field
         values in the same order as the input *fields*.
 
+        Grid and octree datasets locate all the points at once and read each
+        grid or domain containing points only once. With
+        interpolation="trilinear", values are interpolated between the
+        centers of the cells surrounding each point instead of being the
+        values of the cells containing them (grid datasets only).
+
         """
         # If an optimized version exists on the Index object we'll use that
-        try:
-            return self.index._find_field_values_at_points(fields, coords)
-        except AttributeError:
-            pass
+        if hasattr(self.index, "_find_field_values_at_points"):
+            return self.index._find_field_values_at_points(
+                fields, coords, interpolation=interpolation
+            )
+        if interpolation != "nearest":
+            raise NotImplementedError(
+                f"Interpolation {interpolation!r} is not implemented "
+                f"for {type(self.index).__name__}."
+            )
 
         fields = list(iter_fields(fields))
         out = []
@@ -1775,6 +1840,9 @@ class Dataset(abc.ABC):
         self.field_info._show_field_errors.append(name)
         deps, _ = self.field_info.check_derived_fields([name])
         self.field_dependencies.update(deps)
+        self._field_graph.pop(name, None)
+        # the definition of the fields depending on this one may have changed
+        self.index._field_cache_nodes.clear()
 
     def add_mesh_sampling_particle_field(self, sample_field, ptype="all"):
         """Add a new mesh sampling particle field
@@ -1,3 +1,4 @@
+import numpy as np
 from numpy.testing import assert_equal
 
 from yt.testing import fake_random_ds
@@ -58,3 +59,41 @@ def test_ds_hold():
     assert dd.ds.__hash__() == ds1.__hash__()
     assert dd.index is ds1.index
     assert_equal(dd["index", "ones"].size, 64**3)
+
+
+def test_iter_chunks():
+    ds = fake_random_ds(32, nprocs=64)
+    sp = ds.sphere(ds.domain_center, 0.4)
+    fields = [("gas", "density"), ("gas", "velocity_magnitude")]
+    ref = {field: sp[field] for field in fields}
+    max_bytes = 8 * len(fields) * ref[fields[0]].size // 4
+    for style in ("io", "spatial"):
+        batches = list(sp.iter_chunks(fields, max_bytes=max_bytes, style=style))
+        assert len(batches) >= 4
+        for field in fields:
+            data = uconcatenate([batch[field] for batch in batches])
+            assert_equal(data.units, ref[field].units)
+            assert_equal(np.sort(data), np.sort(ref[field]))
+            if style == "io":
+                assert_equal(data, ref[field])
+        for batch in batches[:-1]:
+            assert batch[fields[0]].nbytes * len(fields) <= max_bytes
+    # a budget larger than the selection yields a single batch
+    batches = list(sp.iter_chunks(fields[0]))
+    assert len(batches) == 1
+    assert_equal(batches[0][fields[0]], ref[fields[0]])
+
+
+def test_iter_chunks_split_grids():
+    # a single grid, larger than max_bytes, is split in slabs
+    ds = fake_random_ds(32, nprocs=1)
+    sp = ds.sphere(ds.domain_center, 0.4)
+    fields = [("gas", "density"), ("index", "radius")]
+    ref = {field: sp[field] for field in fields}
+    max_bytes = 8 * len(fields) * ref[fields[0]].size // 4
+    batches = list(sp.iter_chunks(fields, max_bytes=max_bytes))
+    assert len(batches) >= 4
+    for field in fields:
+        assert_equal(uconcatenate([batch[field] for batch in batches]), ref[field])
+    for batch in batches:
+        assert batch[fields[0]].nbytes * len(fields) <= max_bytes
@@ -0,0 +1,116 @@
+import os
+import shutil
+import tempfile
+
+from numpy.testing import assert_allclose, assert_equal
+
+from yt.config import ytcfg
+from yt.testing import fake_random_ds, requires_module
+
+
+def test_field_cache():
+    ds = fake_random_ds(16, nprocs=4)
+    assert ds.field_cache.max_bytes == 0
+    ds.field_cache.max_bytes = 2**20
+    field = ("gas", "density")
+
+    sp1 = ds.sphere(ds.domain_center, 0.25)
+    ref = sp1[field].copy()
+    assert ds.field_cache.misses > 0
+    assert ds.field_cache.hits == 0
+
+    # a new container with the same selection reuses the cached read
+    sp2 = ds.sphere(ds.domain_center, 0.25)
+    assert_equal(sp2[field], ref)
+    assert ds.field_cache.hits > 0
+
+    # modifying the returned array must not affect the cache
+    sp2[field][:] = 0
+    sp3 = ds.sphere(ds.domain_center, 0.25)
+    assert_equal(sp3[field], ref)
+
+    # a different selection does not hit the cached entry
+    hits = ds.field_cache.hits
+    sp4 = ds.sphere(ds.domain_center, 0.3)
+    assert sp4[field].size > ref.size
+    assert ds.field_cache.hits == hits
+
+    # chunked reads bypass the cache
+    misses = ds.field_cache.misses
+    for chunk in sp4.chunks([field], "io"):
+        chunk[field]
+    assert ds.field_cache.hits == hits
+    assert ds.field_cache.misses == misses
+
+
+def test_field_cache_eviction():
+    ds = fake_random_ds(16)
+    field = ("gas", "density")
+    ds.field_cache.max_bytes = 2 * 8 * 16**3
+    for i in range(6):
+        ds.r[:, :, 0.1 * i :][field]
+        assert ds.field_cache.nbytes <= ds.field_cache.max_bytes
+    assert 0 < len(ds.field_cache) < 6
+    ds.field_cache.clear()
+    assert len(ds.field_cache) == 0
+    assert ds.field_cache.nbytes == 0
+
+
+@requires_module("h5py")
+def test_derived_field_cache():
+    tmpdir = tempfile.mkdtemp()
+    old_cache = ytcfg.get("yt", "derived_field_cache")
+    ytcfg["yt", "derived_field_cache"] = True
+    try:
+        ds = fake_random_ds(16, nprocs=8)
+        # in-memory datasets have no checksum and are not cached by default
+        ds.checksum = "fake_checksum"
+        ds.storage_filename = os.path.join(tmpdir, "fake_random_ds.yt")
+        grad_fields = ds.add_gradient_fields(("gas", "density"))
+        field = grad_fields[0]
+        ad = ds.all_data()
+        ref = ad[field].copy()
+        cache_group = ds.index._data_file["derived_field_cache"]
+        assert len(cache_group) == 1
+        node = next(iter(cache_group.values()))
+        assert len(node) == len(ds.index.grids)
+
+        # values are read back from the data file rather than regenerated
+        for dset in node.values():
+            dset[...] = 2 * dset[...]
+        ad = ds.all_data()
+        assert_equal(ad[field], 2 * ref)
+
+        # a different field definition gets its own entry
+        ad[grad_fields[1]]
+        assert len(cache_group) == 2
+
+        # and so does a field whose dependencies were redefined
+        def _density(field, data):
+            return 3 * data["stream", "density"]
+
+        ds.add_field(
+            ("gas", "density"),
+            _density,
+            sampling_type="local",
+            units="g/cm**3",
+            force_override=True,
+        )
+        ad = ds.all_data()
+        assert_allclose(ad[field], 3 * ref)
+        assert len(cache_group) == 3
+        ds.index._close_data_file()
+    finally:
+        ytcfg["yt", "derived_field_cache"] = old_cache
+        shutil.rmtree(tmpdir)
+
+
+def test_definition_hash():
+    # the hash of a field does not depend on the session that defined it
+    ds1 = fake_random_ds(16)
+    ds2 = fake_random_ds(16)
+    for field in (("gas", "number_density"), ("gas", "dynamical_time")):
+        assert (
+            ds1._get_field_info(field)._get_definition_hash()
+            == ds2._get_field_info(field)._get_definition_hash()
+        )
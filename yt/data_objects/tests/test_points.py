@@ -1,8 +1,9 @@
 import numpy as np
-from numpy.testing import assert_equal
+import pytest
+from numpy.testing import assert_allclose, assert_equal
 
 import yt
-from yt.testing import fake_random_ds
+from yt.testing import fake_octree_ds, fake_random_ds
 
 
 def setup_module():
@@ -78,3 +79,53 @@ def test_fast_find_field_values_at_points():
     assert_equal(len(ppos_den_vel), 2)
     assert_equal(ppos_den_vel[0], ppos_den)
     assert_equal(ppos_den_vel[1], ppos_vel)
+
+
+def test_find_field_values_at_points_matches_points():
+    ds = fake_random_ds(16, nprocs=8)
+    rng = np.random.default_rng(0x4D3D3D3)
+    ppos = ds.arr(rng.random((50, 3)), "code_length")
+    vals = ds.find_field_values_at_points(("gas", "density"), ppos)
+    ref = [ds.point(p)["gas", "density"][0] for p in ppos]
+    assert_equal(vals.d, np.array([r.d for r in ref]))
+    assert vals.units == ref[0].units
+
+
+def test_find_field_values_at_points_trilinear():
+    ds = fake_random_ds(16, nprocs=8)
+    rng = np.random.default_rng(0x4D3D3D3)
+    # stay half a cell away from the domain boundaries, where no ghost zones
+    # can be interpolated from
+    ppos = ds.arr(1 / 32 + rng.random((50, 3)) * 15 / 16, "code_length")
+    x, y = ds.find_field_values_at_points(
+        [("index", "x"), ("index", "y")], ppos, interpolation="trilinear"
+    )
+    # linear fields are exactly reproduced
+    assert_allclose(x.to("code_length").d, ppos[:, 0].d)
+    assert_allclose(y.to("code_length").d, ppos[:, 1].d)
+
+    with pytest.raises(ValueError):
+        ds.find_field_values_at_points(("gas", "density"), ppos, interpolation="cubic")
+
+
+def test_find_field_values_at_points_octree():
+    ds = fake_octree_ds()
+    rng = np.random.default_rng(0x4D3D3D3)
+    ppos = ds.arr(rng.random((20, 3)), "code_length")
+    vals = ds.find_field_values_at_points(("gas", "density"), ppos)
+    ref = [ds.point(p)["gas", "density"][0] for p in ppos]
+    assert_equal(vals.d, np.array([r.d for r in ref]))
+
+
+def test_find_field_values_at_points_octree_domains():
+    # points assigned to the wrong domain are looked up in the others
+    ds = fake_octree_ds()
+    rng = np.random.default_rng(0x4D3D3D3)
+    ppos = ds.arr(rng.random((20, 3)), "code_length")
+    ref = ds.find_field_values_at_points(("gas", "density"), ppos)
+    for domain_id in (1, 2):
+        ds.index._locate_point_domains = lambda coords, i=domain_id: np.full(
+            len(coords), i
+        )
+        vals = ds.find_field_values_at_points(("gas", "density"), ppos)
+        assert_equal(vals.d, ref.d)
@@ -373,10 +373,12 @@ class DatasetSeries:
         return obj
 
     def _load(self, output_fn, *, hint: str | None = None, **kwargs):
+        from yt.data_objects.static_output import _load_dataset
         from yt.loaders import load
 
         if self._dataset_cls is not None:
-            return self._dataset_cls(output_fn, **kwargs)
+            preserve_dtype = kwargs.pop("preserve_dtype", False)
+            return _load_dataset(self._dataset_cls, output_fn, (), kwargs, preserve_dtype)
         elif self._mixed_dataset_types:
             return load(output_fn, hint=hint, **kwargs)
         ds = load(output_fn, hint=hint, **kwargs)
@@ -1,4 +1,5 @@
 import contextlib
+import hashlib
 import inspect
 import re
 from collections.abc import Iterable
@@ -13,7 +14,6 @@ from yt.funcs import iter_fields, validate_field_key
 from yt.units.unit_object import Unit  # type: ignore
 from yt.utilities.exceptions import YTFieldNotFound
 from yt.utilities.logger import ytLogger as mylog
-from yt.visualization._commons import _get_units_label
 
 from .field_detector import FieldDetector
 from .field_exceptions import (
@@ -106,6 +106,11 @@ class DerivedField:
        middle of the 2 x-faces of each cell. nodal_flag = [0, 1, 1] would mean the
        that the field defined at the centers of the 4 edges that are normal to the
        x axis, while nodal_flag = [1, 1, 1] would be defined at the 8 cell corners.
+    requires_float64 : bool
+       If True, the fields this field depends on are upcast to float64 before
+       being handed to its function, even when the dataset was loaded with
+       ``preserve_dtype=True``. Set this for fields that lose precision when
+       computed in single precision, such as differences of large coordinates.
     """
 
     _inherited_particle_filter = False
@@ -128,6 +133,7 @@ class DerivedField:
         nodal_flag=None,
         *,
         alias: Optional["DerivedField"] = None,
+        requires_float64=False,
     ):
         validate_field_key(name)
         self.name = name
@@ -137,6 +143,7 @@ class DerivedField:
         self.display_field = display_field
         self.sampling_type = sampling_type
         self.vector_field = vector_field
+        self.requires_float64 = requires_float64
         self.ds = ds
 
         if self.ds is not None:
@@ -193,6 +200,7 @@ class DerivedField:
         dd["display_field"] = True
         dd["not_in_all"] = self.not_in_all
         dd["display_name"] = self.display_name
+        dd["requires_float64"] = self.requires_float64
         return dd
 
     @property
@@ -281,13 +289,53 @@ class DerivedField:
                 "Something has gone terribly wrong, _function is NullFunc "
                 + f"for {self.name}"
             )
-        with self.unit_registry(data):
+        with self.unit_registry(data), self._float64_inputs(data):
             dd = self._function(self, data)
         for field_name in data.keys():
             if field_name not in original_fields:
                 del data[field_name]
         return dd
 
+    @contextlib.contextmanager
+    def _float64_inputs(self, data):
+        # While the function of a field that requires float64 runs, the data
+        # object hands out single precision fields upcast to float64.
+        ds = getattr(data, "ds", None)
+        if not (self.requires_float64 and getattr(ds, "preserve_dtype", False)):
+            yield
+            return
+        data._float64_requests = getattr(data, "_float64_requests", 0) + 1
+        try:
+            yield
+        finally:
+            data._float64_requests -= 1
+
+    def _get_definition_hash(self):
+        # A hash of what defines the values of this field: its name, units and
+        # function, including the values captured in the function's closure
+        # (as for fields generated by factories, e.g. gradient fields).
+        func = self._function
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            source = repr(getattr(getattr(func, "__code__", None), "co_code", func))
+        m = hashlib.md5()
+        m.update(f"{self.name};{self.units};{self.sampling_type}".encode())
+        m.update(source.encode("utf-8"))
+        for cell in getattr(func, "__closure__", None) or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:
+                continue
+            if callable(value):
+                value = getattr(value, "__qualname__", type(value).__name__)
+            elif type(value).__repr__ is object.__repr__:
+                # the default repr holds the address of the object, which
+                # changes from one session to the next
+                value = type(value).__qualname__
+            m.update(repr(value).encode("utf-8"))
+        return m.hexdigest()
+
     def get_source(self):
         """
         Return a string containing the source of the function (if possible.)
@@ -298,6 +346,8 @@ class DerivedField:
         """
         Return a data label for the given field, including units.
         """
+        from yt.visualization._commons import _get_units_label
+
         name = self.name[1]
         if self.display_name is not None:
             name = self.display_name
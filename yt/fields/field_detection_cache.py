@@ -0,0 +1,136 @@
+import hashlib
+import json
+import os
+
+from yt._version import __version__
+from yt.config import ytcfg
+from yt.funcs import get_hash
+from yt.utilities.configure import config_dir
+from yt.utilities.logger import ytLogger as mylog
+
+# bump this whenever the layout of the cache files changes
+_CACHE_VERSION = 2
+
+
+class CachedFieldDependencies:
+    """
+    The dependencies of a derived field, as recorded by a FieldDetector and
+    restored from the field detection cache.
+    """
+
+    def __init__(self, requested, requested_parameters):
+        self.requested = set(requested)
+        self.requested_parameters = list(requested_parameters)
+
+    def __repr__(self):
+        return f"CachedFieldDependencies({sorted(self.requested)!r})"
+
+
+def get_cache_dir():
+    cache_root = os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(cache_root, "yt", "field_detection")
+
+
+def _get_plugin_file_hash():
+    # The plugin file may define new derived fields, so its content is part
+    # of the cache key.
+    fn = ytcfg.get("yt", "plugin_filename")
+    for base_prefix in ("", config_dir()):
+        path = os.path.join(base_prefix, fn)
+        if os.path.isfile(path):
+            return get_hash(path)
+    return ""
+
+
+def _as_key(field):
+    # json turns tuples into lists
+    if isinstance(field, list):
+        return tuple(field)
+    return field
+
+
+def get_cache_key(ds, candidates) -> str:
+    """
+    Return the key under which the results of the detection of the derived
+    fields in *candidates* (a mapping of field names to DerivedField objects)
+    for *ds* are stored.
+
+    The key covers the frontend, the yt version, the plugin file, the on-disk
+    fields, the definition of each candidate derived field, the unit system
+    and the dataset properties that field validators depend on.
+    """
+    cls = type(ds)
+    unit_system = ds.unit_system
+    key = [
+        _CACHE_VERSION,
+        f"{cls.__module__}.{cls.__qualname__}",
+        __version__,
+        _get_plugin_file_hash(),
+        sorted(map(str, ds.field_list)),
+        sorted(
+            (str(field), fi._get_definition_hash()) for field, fi in candidates.items()
+        ),
+        str(unit_system),
+        sorted((str(dim), str(unit)) for dim, unit in unit_system.units_map.items()),
+        str(ds.geometry),
+        int(ds.dimensionality),
+        int(bool(getattr(ds, "cosmological_simulation", 0))),
+        sorted(ds.particle_types),
+        str(ds.default_fluid_type),
+    ]
+    return hashlib.md5(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+def load_detection_results(key):
+    """
+    Return the available fields, the unavailable fields and the dependencies
+    stored under *key*, or None if there is no such entry.
+    """
+    fn = os.path.join(get_cache_dir(), f"{key}.json")
+    if not os.path.isfile(fn):
+        return None
+    try:
+        with open(fn) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        mylog.debug("Could not read field detection cache file %s", fn)
+        return None
+    available = [_as_key(field) for field in data["available"]]
+    unavailable = [_as_key(field) for field in data["unavailable"]]
+    deps = {}
+    for field, requested, requested_parameters in data["dependencies"]:
+        deps[_as_key(field)] = CachedFieldDependencies(
+            (_as_key(f) for f in requested), requested_parameters
+        )
+    mylog.debug("Loaded field detection results from %s", fn)
+    return available, unavailable, deps
+
+
+def save_detection_results(key, available, unavailable, deps):
+    """Store the results of a field detection under *key*."""
+    cache_dir = get_cache_dir()
+    fn = os.path.join(cache_dir, f"{key}.json")
+    data = {
+        "available": list(available),
+        "unavailable": list(unavailable),
+        "dependencies": [
+            (
+                field,
+                sorted(fd.requested, key=str),
+                list(fd.requested_parameters),
+            )
+            for field, fd in deps.items()
+        ],
+    }
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so that concurrent processes never
+        # read a partially written file
+        tmp_fn = f"{fn}.{os.getpid()}.tmp"
+        with open(tmp_fn, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_fn, fn)
+    except OSError as e:
+        mylog.debug("Could not write field detection cache file %s: %s", fn, e)
@@ -128,12 +128,7 @@ class FieldDetector(defaultdict):
                     vv = finfo(self)
             except NeedsGridType as exc:
                 ngz = exc.ghost_zones
-                nfd = FieldDetector(
-                    self.nd + ngz * 2,
-                    ds=self.ds,
-                    field_parameters=self.field_parameters.copy(),
-                )
-                nfd._num_ghost_zones = ngz
+                nfd = self._ghost_zone_detector(ngz)
                 vv = finfo(nfd)
                 if ngz > 0:
                     vv = vv[ngz:-ngz, ngz:-ngz, ngz:-ngz]
@@ -183,6 +178,16 @@ class FieldDetector(defaultdict):
             self[_item] = self._read_data(_item)
         return self[_item]
 
+    def _ghost_zone_detector(self, ngz):
+        # the detector handed to the functions of fields needing ghost zones
+        nfd = FieldDetector(
+            self.nd + ngz * 2,
+            ds=self.ds,
+            field_parameters=self.field_parameters.copy(),
+        )
+        nfd._num_ghost_zones = ngz
+        return nfd
+
     def _debug(self):
         # We allow this to pass through.
         return
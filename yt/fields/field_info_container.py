@@ -19,6 +19,11 @@ from yt.utilities.exceptions import (
 )
 
 from .derived_field import DeprecatedFieldFunc, DerivedField, NullFunc, TranslationFunc
+from .field_detection_cache import (
+    get_cache_key,
+    load_detection_results,
+    save_detection_results,
+)
 from .field_plugin_registry import FunctionName, field_plugins
 from .particle_fields import (
     add_union_field,
@@ -35,6 +40,12 @@ else:
     from typing_extensions import assert_never
 
 
+def _import_field_plugins():
+    # field plugins are registered when the modules defining them are
+    # imported, which yt.fields.api does (yt itself imports it lazily)
+    import yt.fields.api  # noqa: F401
+
+
 class FieldInfoContainer(UserDict):
     """
     This is a generic field container.  It contains a list of potential derived
@@ -410,6 +421,7 @@ class FieldInfoContainer(UserDict):
         if ftype is None:
             return
         mylog.debug("Loading field plugins for field type: %s.", ftype)
+        _import_field_plugins()
         loaded = []
         for n in sorted(field_plugins):
             loaded += self.load_plugin(n, ftype)
@@ -422,6 +434,7 @@ class FieldInfoContainer(UserDict):
         ftype: FieldType = "gas",
         skip_check: bool = False,
     ):
+        _import_field_plugins()
         f = field_plugins[plugin_name]
         orig = set(self.items())
         f(self, ftype, slice_info=self.slice_info)
@@ -635,7 +648,26 @@ class FieldInfoContainer(UserDict):
 
         deps = {}
         unavailable = []
+        # The results of a full detection can be cached on disk.
+        cache_key = None
+        if (
+            fields_to_check is None
+            and ytcfg.get("yt", "field_detection_cache")
+            and not hasattr(self.ds, "_field_test_dataset")
+        ):
+            cache_key = get_cache_key(self.ds, self)
         fields_to_check = fields_to_check or list(self.keys())
+        cached = None
+        if cache_key is not None:
+            cached = load_detection_results(cache_key)
+        if cached is not None:
+            available, unavailable, deps = cached
+            available = set(available)
+            for field in fields_to_check:
+                if field not in available:
+                    self.pop(field)
+            fields_to_check = []
+
         for field in fields_to_check:
             fi = self[field]
             try:
@@ -668,6 +700,9 @@ class FieldInfoContainer(UserDict):
             deps[field] = fd
             mylog.debug("Succeeded with %s (needs %s)", field, fd.requested)
 
+        if cache_key is not None and cached is None:
+            save_detection_results(cache_key, deps.keys(), unavailable, deps)
+
         # now populate the derived field list with results
         # this violates isolation principles and should be refactored
         dfl = set(self.ds.derived_field_list).union(deps.keys())
@@ -0,0 +1,213 @@
+from collections import defaultdict
+
+from yt._typing import FieldKey
+from yt.utilities.exceptions import YTFieldNotFound
+
+from .derived_field import NullFunc
+from .field_detector import FieldDetector
+
+
+class _DependencyRecorder(FieldDetector):
+    # A FieldDetector that records which fields each derived field accesses
+    # directly, where the FieldDetector only keeps track of the fields that
+    # are eventually read from disk.
+    def __init__(self, *args, ghost_zones=False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.edges: defaultdict[FieldKey, list[FieldKey]] = defaultdict(list)
+        self._stack: list[FieldKey | None] = []
+        # whether to record the fields accessed with ghost zones, which are
+        # computed on other data containers than the field itself
+        self._ghost_zones = ghost_zones
+
+    def _resolve(self, item):
+        try:
+            return self.ds._get_field_info(item).name
+        except YTFieldNotFound:
+            return None
+
+    def __getitem__(self, item):
+        if self._stack and self._stack[-1] is not None:
+            parent = self._stack[-1]
+            name = self._resolve(item)
+            if name is not None and name != parent and name not in self.edges[parent]:
+                self.edges[parent].append(name)
+        return super().__getitem__(item)
+
+    def _ghost_zone_detector(self, ngz):
+        if not self._ghost_zones:
+            return super()._ghost_zone_detector(ngz)
+        nfd = _DependencyRecorder(
+            self.nd + ngz * 2,
+            ds=self.ds,
+            field_parameters=self.field_parameters.copy(),
+            ghost_zones=True,
+        )
+        nfd._num_ghost_zones = ngz
+        nfd.edges = self.edges
+        nfd._stack = self._stack
+        return nfd
+
+    def __missing__(self, item):
+        name = self._resolve(item)
+        if name is not None:
+            # make sure fields without dependencies get an entry as well
+            self.edges[name]
+        self._stack.append(name)
+        try:
+            return super().__missing__(item)
+        finally:
+            self._stack.pop()
+
+
+def get_direct_dependencies(ds, field: FieldKey) -> tuple[FieldKey, ...] | None:
+    """
+    Return the fields that the function of *field* accesses directly, or None
+    if they could not be determined.  The results are cached on the dataset.
+    """
+    finfo = ds._get_field_info(field)
+    graph = ds._field_graph
+    if field in graph:
+        return graph[field]
+    if finfo._function is NullFunc:
+        graph[field] = ()
+        return graph[field]
+    recorder = _DependencyRecorder(ds=ds)
+    try:
+        recorder[field]
+    except Exception:
+        graph[field] = None
+        return None
+    for name, deps in recorder.edges.items():
+        graph.setdefault(name, tuple(deps))
+    return graph.setdefault(field, ())
+
+
+def get_dependency_graph(ds, field: FieldKey) -> dict | None:
+    """
+    Return the fields that *field* and all the fields it depends on access
+    directly, including through ghost zones, as a dict mapping each of them
+    to its direct dependencies, or None if they could not be determined.
+    """
+    recorder = _DependencyRecorder(ds=ds, ghost_zones=True)
+    try:
+        recorder[field]
+    except Exception:
+        return None
+    return {name: tuple(deps) for name, deps in recorder.edges.items()}
+
+
+class FieldPlan:
+    """
+    An evaluation plan for a set of derived fields.
+
+    The plan is a topologically sorted list of the fields to compute, built
+    from the dependency graph of the requested fields, so that every
+    intermediate field is computed once, before all of its consumers, and can
+    be released as soon as its last consumer has been computed.
+
+    Parameters
+    ----------
+    ds : Dataset
+        The dataset the fields belong to.
+    fields : list of field keys
+        The fields to compute.
+    available : iterable of field keys, optional
+        Fields that are already available, which are used as inputs rather
+        than computed.
+
+    Attributes
+    ----------
+    steps : list of field keys
+        The fields to compute, in order.
+    inputs : list of field keys
+        The fields that are used as inputs (available or on-disk fields).
+    dependencies : dict
+        The direct dependencies of each step.
+    complete : bool
+        Whether the dependencies of every step could be determined.  If not,
+        the order of the steps is still valid for the known dependencies, but
+        no field should be released early.
+    """
+
+    def __init__(self, ds, fields, available=()):
+        self.ds = ds
+        self.fields = list(fields)
+        self.steps: list[FieldKey] = []
+        self.inputs: list[FieldKey] = []
+        self.dependencies: dict[FieldKey, tuple[FieldKey, ...]] = {}
+        self.complete = True
+        available = set(available)
+        visited: set[FieldKey] = set()
+
+        def visit(field):
+            if field in visited:
+                return
+            visited.add(field)
+            if field in available:
+                self.inputs.append(field)
+                return
+            deps = get_direct_dependencies(ds, field)
+            if deps is None:
+                self.complete = False
+                deps = ()
+            elif ds._get_field_info(field)._function is NullFunc:
+                self.inputs.append(field)
+                return
+            for dep in deps:
+                visit(dep)
+            self.dependencies[field] = deps
+            self.steps.append(field)
+
+        for field in self.fields:
+            visit(field)
+
+        self._last_use: dict[FieldKey, int] = {}
+        for i, field in enumerate(self.steps):
+            for dep in self.dependencies[field]:
+                self._last_use[dep] = i
+
+    @property
+    def shared(self) -> list[FieldKey]:
+        """The fields consumed by more than one step."""
+        counts: defaultdict[FieldKey, int] = defaultdict(int)
+        for deps in self.dependencies.values():
+            for dep in deps:
+                counts[dep] += 1
+        return [field for field, count in counts.items() if count > 1]
+
+    def releasable_after(self, field: FieldKey) -> list[FieldKey]:
+        """
+        Return the fields whose last consumer is *field*, i.e. that are not
+        needed anymore once *field* has been computed.
+        """
+        if not self.complete or field not in self.dependencies:
+            return []
+        i = self.steps.index(field)
+        return [dep for dep in self.dependencies[field] if self._last_use[dep] == i]
+
+    def report(self) -> str:
+        """Return a human readable description of the plan."""
+        lines = [f"Plan for {len(self.fields)} field(s), {len(self.steps)} step(s)"]
+        if self.inputs:
+            lines.append("inputs: " + ", ".join(str(f) for f in self.inputs))
+        shared = set(self.shared)
+        for i, field in enumerate(self.steps):
+            line = f"{i + 1:>3}. compute {field}"
+            if field in shared:
+                line += " (shared)"
+            deps = self.dependencies[field]
+            if deps:
+                line += " from " + ", ".join(str(f) for f in deps)
+            released = self.releasable_after(field)
+            if released:
+                line += "; release " + ", ".join(str(f) for f in released)
+            lines.append(line)
+        if not self.complete:
+            lines.append("some dependencies are unknown, no field is released early")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+    def __repr__(self):
+        return f"FieldPlan({self.fields!r})"
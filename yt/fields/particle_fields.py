@@ -427,6 +427,7 @@ def standard_particle_fields(
         function=_particle_radius,
         units=unit_system["length"],
         validators=[ValidateParameter("center")],
+        requires_float64=True,
     )
 
     def _relative_particle_position(field, data):
@@ -445,6 +446,7 @@ def standard_particle_fields(
         function=_relative_particle_position,
         units=unit_system["length"],
         validators=[ValidateParameter("normal"), ValidateParameter("center")],
+        requires_float64=True,
     )
 
     def _relative_particle_velocity(field, data):
@@ -464,6 +466,7 @@ def standard_particle_fields(
         function=_relative_particle_velocity,
         units=unit_system["velocity"],
         validators=[ValidateParameter("normal"), ValidateParameter("center")],
+        requires_float64=True,
     )
 
     def _get_coord_funcs_relative(axi, _ptype):
@@ -510,6 +513,7 @@ def standard_particle_fields(
         function=_particle_radius,
         units=unit_system["length"],
         validators=[ValidateParameter("normal"), ValidateParameter("center")],
+        requires_float64=True,
     )
 
     def _particle_position_spherical_theta(field, data):
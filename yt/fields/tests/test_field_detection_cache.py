@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+
+from yt.config import ytcfg
+from yt.fields.field_detection_cache import get_cache_key
+from yt.testing import fake_random_ds
+
+
+def _detect(**options):
+    old_options = {key: ytcfg.get("yt", key) for key in options}
+    try:
+        for key, value in options.items():
+            ytcfg["yt", key] = value
+        ds = fake_random_ds(16, particles=16)
+        ds.index
+    finally:
+        for key, value in old_options.items():
+            ytcfg["yt", key] = value
+    return ds
+
+
+def test_field_detection_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_dir = tmp_path / "yt" / "field_detection"
+    ref = _detect(field_detection_cache=False)
+    assert not cache_dir.exists()
+
+    cold = _detect(field_detection_cache=True)
+    assert len(os.listdir(cache_dir)) == 1
+    warm = _detect(field_detection_cache=True)
+    assert len(os.listdir(cache_dir)) == 1
+
+    for ds in (cold, warm):
+        assert ds.derived_field_list == ref.derived_field_list
+        assert sorted(ds.field_info.keys()) == sorted(ref.field_info.keys())
+        for field, fd in ref.field_dependencies.items():
+            assert ds.field_dependencies[field].requested == fd.requested
+            assert ds.field_dependencies[field].requested_parameters == (
+                fd.requested_parameters
+            )
+
+    # derived fields work the same with restored dependencies
+    ad = warm.all_data()
+    assert (ad["gas", "cell_mass"] == ref.all_data()["gas", "cell_mass"]).all()
+
+
+def test_field_detection_cache_key():
+    ds = fake_random_ds(16)
+    ds.index
+    key = get_cache_key(ds, ds.field_info)
+    ds2 = fake_random_ds(16)
+    ds2.index
+    assert get_cache_key(ds2, ds2.field_info) == key
+
+    # the key changes with the definition of any candidate field
+    def _density_squared(field, data):
+        return data["gas", "density"] ** 2
+
+    ds.add_field(
+        ("gas", "density_squared"),
+        _density_squared,
+        sampling_type="cell",
+        units="g**2/cm**6",
+    )
+    new_key = get_cache_key(ds, ds.field_info)
+    assert new_key != key
+
+    def _density_squared(field, data):
+        return np.square(data["gas", "density"])
+
+    ds.add_field(
+        ("gas", "density_squared"),
+        _density_squared,
+        sampling_type="cell",
+        units="g**2/cm**6",
+        force_override=True,
+    )
+    assert get_cache_key(ds, ds.field_info) not in (key, new_key)
+
+    # and with the unit system
+    mks_ds = fake_random_ds(16, unit_system="mks")
+    mks_ds.index
+    assert get_cache_key(mks_ds, mks_ds.field_info) != key
@@ -0,0 +1,61 @@
+from numpy.testing import assert_equal
+
+from yt.testing import assert_allclose_units, fake_random_ds
+
+FIELDS = ("density", "velocity_x", "velocity_y", "velocity_z")
+UNITS = ("g/cm**3", "cm/s", "cm/s", "cm/s")
+
+
+def test_field_plan():
+    ds = fake_random_ds(16, fields=FIELDS, units=UNITS)
+    ncalls = []
+
+    def _speed_squared(field, data):
+        ncalls.append(1)
+        return data["gas", "velocity_magnitude"] ** 2
+
+    def _specific_energy(field, data):
+        return 0.5 * data["gas", "speed_squared"]
+
+    def _energy_density(field, data):
+        return data["gas", "density"] * data["gas", "speed_squared"] / 2
+
+    ds.add_field(
+        ("gas", "speed_squared"), _speed_squared, sampling_type="cell", units="cm**2/s**2"
+    )
+    ds.add_field(
+        ("gas", "specific_energy_test"),
+        _specific_energy,
+        sampling_type="cell",
+        units="erg/g",
+    )
+    ds.add_field(
+        ("gas", "energy_density_test"),
+        _energy_density,
+        sampling_type="cell",
+        units="erg/cm**3",
+    )
+    fields = [("gas", "specific_energy_test"), ("gas", "energy_density_test")]
+
+    ad = ds.all_data()
+    plan = ad.plan_fields(fields)
+    assert plan.complete
+    # every step comes after the fields it depends on
+    for i, field in enumerate(plan.steps):
+        for dep in plan.dependencies[field]:
+            assert dep in plan.inputs or plan.steps.index(dep) < i
+    assert ("gas", "speed_squared") in plan.shared
+    assert_equal(plan.steps.count(("gas", "speed_squared")), 1)
+    assert_equal(
+        plan.releasable_after(("gas", "energy_density_test")),
+        [("gas", "density"), ("gas", "speed_squared")],
+    )
+    assert "compute ('gas', 'speed_squared') (shared)" in plan.report()
+
+    # the shared intermediate is generated once and not kept around
+    ncalls.clear()
+    ad.get_data(fields)
+    assert_equal(len(ncalls), 1)
+    assert_equal(sorted(ad.field_data.keys()), sorted(fields))
+    for field in fields:
+        assert_allclose_units(ds.all_data()[field], ad[field])
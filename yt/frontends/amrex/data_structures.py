@@ -1,7 +1,7 @@
 import glob
 import os
 import re
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from functools import cached_property
 from stat import ST_CTIME
 
@@ -57,6 +57,26 @@ _header_pattern = [
 ]
 
 
+def _fab_data_offsets(filenames, offsets):
+    """
+    Return the offsets of the data of the FABs starting at *offsets* in
+    *filenames*, which follow the line of text of their header. Each file is
+    opened once, and its headers are read in the order they are stored.
+    """
+    data_offsets = np.empty(len(offsets), dtype="int64")
+    fabs_by_file = defaultdict(list)
+    for i, filename in enumerate(filenames):
+        fabs_by_file[filename].append(i)
+    for filename, fabs in fabs_by_file.items():
+        fabs.sort(key=lambda i: offsets[i])
+        with open(filename, "rb") as f:
+            for i in fabs:
+                f.seek(offsets[i], os.SEEK_SET)
+                f.readline()
+                data_offsets[i] = f.tell()
+    return data_offsets
+
+
 class BoxlibGrid(AMRGridPatch):
     _id_offset = 0
     _offset = -1
@@ -91,15 +111,6 @@ class BoxlibGrid(AMRGridPatch):
     def Children(self):
         return [self.index.grids[cid - self._id_offset] for cid in self._children_ids]
 
-    def _get_offset(self, f):
-        # This will either seek to the _offset or figure out the correct
-        # _offset.
-        if self._offset == -1:
-            f.seek(self._base_offset, os.SEEK_SET)
-            f.readline()
-            self._offset = f.tell()
-        return self._offset
-
     # We override here because we can have varying refinement levels
     def select_ires(self, dobj):
         mask = self._get_selector_mask(dobj.selector)
@@ -344,6 +355,7 @@ class BoxlibHierarchy(GridIndex):
 
         GridIndex.__init__(self, ds, dataset_type)
         self._cache_endianness(self.grids[-1])
+        self._index_fab_offsets()
 
     def _parse_index(self):
         """
@@ -497,6 +509,16 @@ class BoxlibHierarchy(GridIndex):
         mylog.debug("FAB header suggests dtype of %s", dtype)
         self._dtype = np.dtype(dtype)
 
+    def _index_fab_offsets(self):
+        # Find where the data of each grid start once and for all, so that
+        # reads do not have to parse the headers of the FABs.
+        grids = [g for g in self.grids if g.filename is not None]
+        data_offsets = _fab_data_offsets(
+            [g.filename for g in grids], [g._base_offset for g in grids]
+        )
+        for grid, offset in zip(grids, data_offsets, strict=True):
+            grid._offset = int(offset)
+
     def _populate_grid_objects(self):
         mylog.debug("Creating grid objects")
         self.grids = np.array(self.grids, dtype="object")
@@ -558,6 +580,7 @@ class BoxlibHierarchy(GridIndex):
         self._parallel_locking = False
         self._data_file = None
         self._data_mode = None
+        self._field_cache_nodes = {}
 
     def _detect_output_fields(self):
         # This is all done in _parse_header_file
@@ -1516,6 +1539,27 @@ class WarpXHierarchy(BoxlibHierarchy):
             self.raw_field_map[field_name] = (boxes, file_names, offsets)
             self.raw_field_nghost[field_name] = nghost
             self.ds.nodal_flags[field_name] = np.array(boxes[0][2])
+        self.raw_field_files = {}
+        self.raw_field_data_offsets = {}
+
+    def _get_raw_field_location(self, field_name, grid_id):
+        # Return the file holding the data of a raw field for a grid and where
+        # they start. The FAB headers of a raw field are only parsed on its
+        # first read.
+        if field_name not in self.raw_field_data_offsets:
+            _, file_names, offsets = self.raw_field_map[field_name]
+            filenames = [
+                os.path.join(self.raw_file, f"Level_{level}", fn)
+                for level, fn in zip(self.grid_levels[:, 0], file_names, strict=True)
+            ]
+            self.raw_field_files[field_name] = filenames
+            self.raw_field_data_offsets[field_name] = _fab_data_offsets(
+                filenames, offsets
+            )
+        return (
+            self.raw_field_files[field_name][grid_id],
+            self.raw_field_data_offsets[field_name][grid_id],
+        )
 
 
 def _skip_line(line):
@@ -1,11 +1,12 @@
 import os
-from collections import defaultdict
 
 import numpy as np
 
+from yt.config import ytcfg
 from yt.frontends.chombo.io import parse_orion_sinks
 from yt.funcs import mylog
 from yt.geometry.selection_routines import GridSelector
+from yt.utilities.file_handler import MappedFilePool
 from yt.utilities.io_handler import BaseIOHandler
 
 
@@ -21,6 +22,7 @@ class IOHandlerBoxlib(BaseIOHandler):
 
     def __init__(self, ds, *args, **kwargs):
         super().__init__(ds)
+        self._mapped_files = MappedFilePool(ytcfg.get("yt", "max_open_files"))
 
     def _read_fluid_selection(self, chunks, selector, fields, size):
         chunks = list(chunks)
@@ -28,6 +30,7 @@ class IOHandlerBoxlib(BaseIOHandler):
             raise NotImplementedError
         rv = {}
         raw_fields = []
+        dtype = self._output_dtype(self.ds.index._dtype)
         for field in fields:
             if field[0] == "raw":
                 nodal_flag = self.ds.nodal_flags[field[1]]
@@ -35,7 +38,7 @@ class IOHandlerBoxlib(BaseIOHandler):
                 rv[field] = np.empty((size, num_nodes), dtype="float64")
                 raw_fields.append(field)
             else:
-                rv[field] = np.empty(size, dtype="float64")
+                rv[field] = np.empty(size, dtype=dtype)
         centered_fields = _remove_raw(fields, raw_fields)
         ng = sum(len(c.objs) for c in chunks)
         mylog.debug(
@@ -60,26 +63,16 @@ class IOHandlerBoxlib(BaseIOHandler):
 
     def _read_raw_field(self, grid, field):
         field_name = field[1]
-        base_dir = self.ds.index.raw_file
+        index = self.ds.index
 
-        nghost = self.ds.index.raw_field_nghost[field_name]
-        box_list = self.ds.index.raw_field_map[field_name][0]
-        fn_list = self.ds.index.raw_field_map[field_name][1]
-        offset_list = self.ds.index.raw_field_map[field_name][2]
-
-        lev = grid.Level
-        filename = os.path.join(base_dir, f"Level_{lev}", fn_list[grid.id])
-        offset = offset_list[grid.id]
-        box = box_list[grid.id]
+        nghost = index.raw_field_nghost[field_name]
+        box = index.raw_field_map[field_name][0][grid.id]
+        filename, offset = index._get_raw_field_location(field_name, grid.id)
 
         lo = box[0] - nghost
         hi = box[1] + nghost
         shape = hi - lo + 1
-        with open(filename, "rb") as f:
-            f.seek(offset)
-            f.readline()  # always skip the first line
-            arr = np.fromfile(f, "float64", np.prod(shape))
-            arr = arr.reshape(shape, order="F")
+        arr = self._mapped_files.view(filename, "float64", shape, offset, order="F")
         return arr[
             tuple(
                 slice(None) if (nghost[dim] == 0) else slice(nghost[dim], -nghost[dim])
@@ -88,36 +81,28 @@ class IOHandlerBoxlib(BaseIOHandler):
         ]
 
     def _read_chunk_data(self, chunk, fields):
+        # The fields of each grid are stored one after the other after the
+        # header of its FAB, at an offset found when building the index. They
+        # are returned as views of the memory-mapped files.
         data = {}
-        grids_by_file = defaultdict(list)
         if len(chunk.objs) == 0:
             return data
-        for g in chunk.objs:
-            if g.filename is None:
-                continue
-            grids_by_file[g.filename].append(g)
         dtype = self.ds.index._dtype
-        bpr = dtype.itemsize
-        for filename in grids_by_file:
-            grids = grids_by_file[filename]
-            grids.sort(key=lambda a: a._offset)
-            f = open(filename, "rb")
-            for grid in grids:
-                data[grid.id] = {}
-                local_offset = grid._get_offset(f) - f.tell()
-                count = grid.ActiveDimensions.prod()
-                size = count * bpr
-                for field in self.ds.index.field_order:
-                    if field in fields:
-                        # We read it ...
-                        f.seek(local_offset, os.SEEK_CUR)
-                        v = np.fromfile(f, dtype=dtype, count=count)
-                        v = v.reshape(grid.ActiveDimensions, order="F")
-                        data[grid.id][field] = v
-                        local_offset = 0
-                    else:
-                        local_offset += size
-            f.close()
+        field_order = self.ds.index.field_order
+        for grid in chunk.objs:
+            if grid.filename is None:
+                continue
+            data[grid.id] = {}
+            size = int(grid.ActiveDimensions.prod()) * dtype.itemsize
+            for i, field in enumerate(field_order):
+                if field in fields:
+                    data[grid.id][field] = self._mapped_files.view(
+                        grid.filename,
+                        dtype,
+                        grid.ActiveDimensions,
+                        grid._offset + i * size,
+                        order="F",
+                    )
         return data
 
     def _read_particle_coords(self, chunks, ptf):
@@ -0,0 +1,167 @@
+import os
+import time
+
+import numpy as np
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.frontends.amrex.api import BoxlibDataset
+from yt.utilities.logger import ytLogger as mylog
+
+_fields = ("density", "temperature")
+
+
+def _fake_plotfile(output_dir, dtype="<f8", num_files=3, num_cells=32, block=8):
+    # Write a single level plotfile whose domain is split in blocks of
+    # block**3 cells, spread over num_files FAB files.
+    os.makedirs(os.path.join(output_dir, "Level_0"))
+    dtype = np.dtype(dtype)
+    nb = num_cells // block
+    dx = 1.0 / num_cells
+    bpr = dtype.itemsize
+    order = " ".join(map(str, range(1, bpr + 1)))
+    if dtype.byteorder != ">":
+        order = order[::-1]
+    real = "64 11 52 0 1 12 0 1023" if bpr == 8 else "32 8 23 0 1 9 0 127"
+    rng = np.random.default_rng(0)
+
+    boxes = []
+    fabs = []
+    offsets = [0] * num_files
+    for i, j, k in np.ndindex(nb, nb, nb):
+        start = np.array([i, j, k]) * block
+        stop = start + block - 1
+        box = f"(({','.join(map(str, start))}) ({','.join(map(str, stop))}) (0,0,0))"
+        ifile = len(boxes) % num_files
+        data = rng.random((len(_fields), block, block, block))
+        header = f"FAB ((8, ({real})),({bpr}, ({order})))"
+        header = f"{header}{box} {len(_fields)}\n".encode("ascii")
+        fn = os.path.join(output_dir, "Level_0", f"Cell_D_{ifile:05d}")
+        with open(fn, "ab") as f:
+            f.write(header)
+            for values in data:
+                f.write(values.astype(dtype).tobytes(order="F"))
+        fabs.append((ifile, offsets[ifile], start, data))
+        offsets[ifile] += len(header) + data.size * dtype.itemsize
+        boxes.append(box)
+
+    with open(os.path.join(output_dir, "Header"), "w") as f:
+        f.write("HyperCLaw-V1.1\n")
+        f.write(f"{len(_fields)}\n")
+        f.writelines(f"{field}\n" for field in _fields)
+        f.write("3\n0.0\n0\n0.0 0.0 0.0\n1.0 1.0 1.0\n\n")
+        end = ",".join([str(num_cells - 1)] * 3)
+        f.write(f"((0,0,0) ({end}) (0,0,0))\n")
+        f.write("0\n")
+        f.write(f"{dx} {dx} {dx}\n")
+        f.write("0\n0\n")
+        f.write(f"0 {len(boxes)} 0.0\n0\n")
+        for _, _, start, _ in fabs:
+            for d in range(3):
+                f.write(f"{start[d] * dx} {(start[d] + block) * dx}\n")
+        f.write("Level_0/Cell\n")
+
+    with open(os.path.join(output_dir, "Level_0", "Cell_H"), "w") as f:
+        f.write(f"1\n0\n{len(_fields)}\n0\n({len(boxes)} 0\n")
+        f.writelines(f"{box}\n" for box in boxes)
+        f.write(f")\n{len(boxes)}\n")
+        for ifile, offset, _, _ in fabs:
+            f.write(f"FabOnDisk: Cell_D_{ifile:05d} {offset}\n")
+    return fabs
+
+
+def _read_grid_data(grid, dtype, fields):
+    # the reading of a grid before its offsets were indexed: the FAB header is
+    # skipped and the data read from the file for each grid
+    data = {}
+    with open(grid.filename, "rb") as f:
+        f.seek(grid._base_offset)
+        f.readline()
+        count = grid.ActiveDimensions.prod()
+        for field in fields:
+            v = np.fromfile(f, dtype=dtype, count=count)
+            data[field] = v.reshape(grid.ActiveDimensions, order="F")
+    return data
+
+
+def test_fab_offsets(tmp_path):
+    for dtype in ("<f8", ">f8"):
+        output_dir = str(tmp_path / f"plt{dtype[0] == '>':d}")
+        fabs = _fake_plotfile(output_dir, dtype=dtype)
+        ds = BoxlibDataset(output_dir)
+        assert ds.index._dtype == np.dtype(dtype)
+        for grid, (ifile, offset, start, data) in zip(
+            ds.index.grids, fabs, strict=True
+        ):
+            assert grid.filename.endswith(f"Cell_D_{ifile:05d}")
+            assert grid._base_offset == offset
+            assert_equal(grid.get_global_startindex(), start)
+            for i, field in enumerate(_fields):
+                assert_equal(grid["boxlib", field], data[i])
+
+        ad = ds.all_data()
+        total = sum(data[0].sum() for _, _, _, data in fabs)
+        np.testing.assert_allclose(ad["boxlib", "density"].sum(), total)
+
+
+def test_preserve_dtype(tmp_path):
+    output_dir = str(tmp_path / "plt")
+    fabs = _fake_plotfile(output_dir, dtype="<f4")
+    ref = BoxlibDataset(output_dir)
+    ds = BoxlibDataset(output_dir)
+    ds.preserve_dtype = True
+    density = ds.all_data()["boxlib", "density"]
+    assert density.dtype == np.float32
+    assert ref.all_data()["boxlib", "density"].dtype == np.float64
+    assert_equal(density, ref.all_data()["boxlib", "density"].astype("float32"))
+    grid = ds.index.grids[0]
+    assert_equal(grid["boxlib", "density"], fabs[0][3][0].astype("float32"))
+
+
+def test_mapped_files_limit(tmp_path):
+    output_dir = str(tmp_path / "plt")
+    _fake_plotfile(output_dir, num_files=4)
+    old_value = ytcfg.get("yt", "max_open_files")
+    try:
+        ytcfg["yt", "max_open_files"] = 2
+        ds = BoxlibDataset(output_dir)
+        ad = ds.all_data()
+        ad["boxlib", "temperature"]
+        assert len(ds.index.io._mapped_files) == 2
+    finally:
+        ytcfg["yt", "max_open_files"] = old_value
+
+
+def test_fab_read_speed(tmp_path):
+    # Benchmark the reading of all the grids of a plotfile, one file access
+    # per grid against views of the memory-mapped files.
+    output_dir = str(tmp_path / "plt")
+    _fake_plotfile(output_dir, num_files=4, num_cells=64)
+    ds = BoxlibDataset(output_dir)
+    index = ds.index
+    fields = list(index.field_order)
+
+    class _Chunk:
+        objs = index.grids
+
+    t0 = time.perf_counter()
+    reference = {
+        grid.id: _read_grid_data(grid, index._dtype, fields) for grid in index.grids
+    }
+    t1 = time.perf_counter()
+    data = index.io._read_chunk_data(_Chunk, fields)
+    for grid_data in data.values():
+        for v in grid_data.values():
+            v.sum()
+    t2 = time.perf_counter()
+    for grid in index.grids:
+        for field in fields:
+            assert_equal(data[grid.id][field], reference[grid.id][field])
+
+    mylog.info(
+        "Reading %s grids of %s fields: %.3fs (per-grid reads), %.3fs (memory maps)",
+        len(index.grids),
+        len(fields),
+        t1 - t0,
+        t2 - t1,
+    )
@@ -2,6 +2,7 @@ import numpy as np
 
 from yt.frontends.gadget.api import GadgetHDF5Dataset
 from yt.funcs import mylog
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 from .fields import ArepoFieldInfo
@@ -53,18 +54,17 @@ class ArepoHDF5Dataset(GadgetHDF5Dataset):
         veto_groups = ["FOF", "Group", "Subhalo"]
         valid = True
         try:
-            fh = h5py.File(filename, mode="r")
-            valid = (
-                all(ng in fh["/"] for ng in need_groups)
-                and not any(vg in fh["/"] for vg in veto_groups)
-                and (
-                    "VORONOI" in fh["/Config"].attrs.keys()
-                    or "AMR" in fh["/Config"].attrs.keys()
+            with get_file_signature(filename).open_hdf5() as fh:
+                valid = (
+                    all(ng in fh["/"] for ng in need_groups)
+                    and not any(vg in fh["/"] for vg in veto_groups)
+                    and (
+                        "VORONOI" in fh["/Config"].attrs.keys()
+                        or "AMR" in fh["/Config"].attrs.keys()
+                    )
+                    # Datasets with GFM_ fields present are AREPO
+                    or any(field.startswith("GFM_") for field in fh["/PartType0"])
                 )
-                # Datasets with GFM_ fields present are AREPO
-                or any(field.startswith("GFM_") for field in fh["/PartType0"])
-            )
-            fh.close()
         except Exception:
             valid = False
         return valid
@@ -8,6 +8,7 @@ from yt.data_objects.static_output import Dataset
 from yt.funcs import setdefaultattr
 from yt.geometry.api import Geometry
 from yt.geometry.grid_geometry_handler import GridIndex
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 from .fields import ChollaFieldInfo
@@ -153,20 +154,9 @@ class ChollaDataset(Dataset):
         if cls._missing_load_requirements():
             return False
 
-        try:
-            fileh = h5py.File(filename, mode="r")
-        except OSError:
-            return False
-
-        try:
-            attrs = fileh.attrs
-        except AttributeError:
-            return False
-        else:
-            return (
-                "bounds" in attrs
-                and "domain" in attrs
-                and attrs.get("data_type") != "yt_light_ray"
-            )
-        finally:
-            fileh.close()
+        attrs = get_file_signature(filename).hdf5_attrs
+        return (
+            "bounds" in attrs
+            and "domain" in attrs
+            and attrs.get("data_type") != "yt_light_ray"
+        )
@@ -116,14 +116,16 @@ class IOHandlerChomboHDF5(BaseIOHandler):
                 raise RuntimeError
             grid = chunks[0].objs[0]
             for ftype, fname in fields:
-                rv[ftype, fname] = self._read_data(grid, fname)
+                data = self._read_data(grid, fname)
+                rv[ftype, fname] = data.astype(self._output_dtype(data.dtype))
             return rv
         if size is None:
             size = sum(g.count(selector) for chunk in chunks for g in chunk.objs)
+        dtype = self._output_dtype(self._handle["level_0"][self._data_string].dtype)
         for field in fields:
             ftype, fname = field
             fsize = size
-            rv[field] = np.empty(fsize, dtype="float64")
+            rv[field] = np.empty(fsize, dtype=dtype)
         ng = sum(len(c.objs) for c in chunks)
         mylog.debug(
             "Reading %s cells of %s fields in %s grids",
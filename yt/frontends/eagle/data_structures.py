@@ -4,7 +4,7 @@ import yt.units
 from yt.fields.field_info_container import FieldInfoContainer
 from yt.frontends.gadget.data_structures import GadgetHDF5Dataset
 from yt.frontends.owls.fields import OWLSFieldInfo
-from yt.utilities.on_demand_imports import _h5py as h5py
+from yt.utilities.file_handler import get_file_signature
 
 from .fields import EagleNetworkFieldInfo
 
@@ -57,14 +57,13 @@ class EagleDataset(GadgetHDF5Dataset):
         ]
         valid = True
         try:
-            fileh = h5py.File(filename, mode="r")
-            for ng in need_groups:
-                if ng not in fileh["/"]:
-                    valid = False
-            for vg in veto_groups:
-                if vg in fileh["/"]:
-                    valid = False
-            fileh.close()
+            with get_file_signature(filename).open_hdf5() as fileh:
+                for ng in need_groups:
+                    if ng not in fileh["/"]:
+                        valid = False
+                for vg in veto_groups:
+                    if vg in fileh["/"]:
+                        valid = False
         except Exception:
             valid = False
             pass
@@ -83,19 +82,17 @@ class EagleNetworkDataset(EagleDataset):
             return False
 
         try:
-            fileh = h5py.File(filename, mode="r")
-            if (
-                "Constants" in fileh["/"].keys()
-                and "Header" in fileh["/"].keys()
-                and "SUBFIND" not in fileh["/"].keys()
-                and (
-                    "ChemistryAbundances" in fileh["PartType0"].keys()
-                    or "ChemicalAbundances" in fileh["PartType0"].keys()
-                )
-            ):
-                fileh.close()
-                return True
-            fileh.close()
+            with get_file_signature(filename).open_hdf5() as fileh:
+                if (
+                    "Constants" in fileh["/"].keys()
+                    and "Header" in fileh["/"].keys()
+                    and "SUBFIND" not in fileh["/"].keys()
+                    and (
+                        "ChemistryAbundances" in fileh["PartType0"].keys()
+                        or "ChemicalAbundances" in fileh["PartType0"].keys()
+                    )
+                ):
+                    return True
         except Exception:
             pass
         return False
@@ -20,6 +20,7 @@ from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py, _libconf as libconf
 
 from .fields import EnzoFieldInfo
+from .io import IOHandlerPackedHDF5
 
 
 class EnzoGrid(AMRGridPatch):
@@ -143,6 +144,7 @@ class EnzoHierarchy(GridIndex):
     _strip_path = False
     grid = EnzoGrid
     _preload_implemented = True
+    _lazy_grids = True
 
     def __init__(self, ds, dataset_type):
         self.dataset_type = dataset_type
@@ -349,6 +351,34 @@ class EnzoHierarchy(GridIndex):
         del self.filenames  # No longer needed.
         self.max_level = self.grid_levels.max()
 
+    def _create_grid(self, i):
+        g = self.grid(i + 1, self)
+        g.Level = int(self.grid_levels[i, 0])
+        if self._grid_parents[i] != -1:
+            g._parent_id = int(self._grid_parents[i]) + 1
+        g._children_ids = [int(c) + 1 for c in self._get_grid_children(i)]
+        g._prepare_grid()
+        g._setup_dx()
+        g.set_filename(self._get_grid_filename(i))
+        return g
+
+    def _get_grid_hierarchy_arrays(self):
+        arrays = super()._get_grid_hierarchy_arrays()
+        for ptype, counts in getattr(self, "grid_active_particle_count", {}).items():
+            arrays[f"grid_active_particle_count/{ptype}"] = counts
+        return arrays
+
+    def _set_grid_hierarchy_arrays(self, arrays):
+        super()._set_grid_hierarchy_arrays(arrays)
+        prefix = "grid_active_particle_count/"
+        gac = {
+            name.removeprefix(prefix): counts
+            for name, counts in arrays.items()
+            if name.startswith(prefix)
+        }
+        if gac:
+            self.grid_active_particle_count = gac
+
     def _detect_active_particle_fields(self):
         ap_list = self.dataset["AppendActiveParticleType"]
         _fields = {ap: [] for ap in ap_list}
@@ -533,6 +563,7 @@ class EnzoHierarchy(GridIndex):
 
 class EnzoHierarchyInMemory(EnzoHierarchy):
     grid = EnzoGridInMemory
+    _lazy_grids = False
 
     @cached_property
     def enzo(self):
@@ -982,6 +1013,12 @@ class EnzoDataset(Dataset):
         magnetic_unit = np.float64(magnetic_unit.in_cgs())
         setdefaultattr(self, "magnetic_unit", self.quan(magnetic_unit, "gauss"))
 
+    def close(self):
+        if self._instantiated_index is not None:
+            io = self._instantiated_index.io
+            if isinstance(io, IOHandlerPackedHDF5):
+                io.close()
+
     @classmethod
     def _is_valid(cls, filename: str, *args, **kwargs) -> bool:
         return filename.endswith(".hierarchy") or os.path.exists(
@@ -1,5 +1,9 @@
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
+from yt.config import ytcfg
 from yt.geometry.selection_routines import GridSelector
 from yt.utilities.io_handler import BaseIOHandler
 from yt.utilities.logger import ytLogger as mylog
@@ -15,6 +19,13 @@ class IOHandlerPackedHDF5(BaseIOHandler):
     _base = slice(None)
     _field_dtype = "float64"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # filename -> (file ID, {dataset path: dataset ID}) for the most
+        # recently read files, so that datasets are only opened once
+        self._open_datasets = OrderedDict()
+        self._open_datasets_lock = threading.Lock()
+
     def _read_field_names(self, grid):
         if grid.filename is None:
             return []
@@ -112,66 +123,114 @@ class IOHandlerPackedHDF5(BaseIOHandler):
                     if mask is None:
                         continue
                     for field in field_list:
-                        data = np.asarray(pds.get(field)[()], "=f8")
+                        dset = pds.get(field)
+                        data = np.asarray(dset[()], self._output_dtype(dset.dtype))
                         if field in _convert_mass:
                             data *= g.dds.prod(dtype="f8")
                         yield (ptype, field), data[mask]
             if f:
                 f.close()
 
+    def _get_dataset(self, filename, node):
+        # Return the low-level ID of the dataset *node* of *filename*. Files
+        # and datasets stay open between reads, for at most max_open_files
+        # files, or are closed once read if it is 0. Raises KeyError if the
+        # dataset does not exist.
+        maxsize = ytcfg.get("yt", "max_open_files")
+        if maxsize <= 0:
+            # the file is closed along with the dataset
+            fid = h5py.h5f.open(filename.encode("latin-1"), h5py.h5f.ACC_RDONLY)
+            return h5py.h5d.open(fid, node.encode("latin-1"))
+        with self._open_datasets_lock:
+            if filename in self._open_datasets:
+                self._open_datasets.move_to_end(filename)
+                fid, dsids = self._open_datasets[filename]
+            else:
+                fid = h5py.h5f.open(filename.encode("latin-1"), h5py.h5f.ACC_RDONLY)
+                dsids = {}
+                self._open_datasets[filename] = (fid, dsids)
+                while len(self._open_datasets) > maxsize:
+                    # IDs are closed when they are no longer referenced
+                    self._open_datasets.popitem(last=False)
+            if node not in dsids:
+                dsids[node] = h5py.h5d.open(fid, node.encode("latin-1"))
+            return dsids[node]
+
+    def close(self):
+        """Close the files and datasets kept open between reads."""
+        with self._open_datasets_lock:
+            self._open_datasets.clear()
+
     def io_iter(self, chunks, fields):
-        h5_dtype = self._field_dtype
         for chunk in chunks:
-            fid = None
-            filename = -1
+            # the grids of a run sharing the same file are read at once, and
+            # are handed out in the order of the chunk
+            run = []
             for obj in chunk.objs:
                 if obj.filename is None:
                     continue
-                if obj.filename != filename:
-                    # Note one really important thing here: even if we do
-                    # implement LRU caching in the _read_obj_field function,
-                    # we'll still be doing file opening and whatnot.  This is a
-                    # problem, but one we can return to.
-                    if fid is not None:
-                        fid.close()
-                    fid = h5py.h5f.open(
-                        obj.filename.encode("latin-1"), h5py.h5f.ACC_RDONLY
-                    )
-                    filename = obj.filename
-                for field in fields:
-                    nodal_flag = self.ds.field_info[field].nodal_flag
-                    dims = obj.ActiveDimensions[::-1] + nodal_flag[::-1]
-                    data = np.empty(dims, dtype=h5_dtype)
-                    yield field, obj, self._read_obj_field(obj, field, (fid, data))
-        if fid is not None:
-            fid.close()
+                if run and obj.filename != run[0].filename:
+                    yield from self._read_grid_run(run, fields)
+                    run = []
+                run.append(obj)
+            if run:
+                yield from self._read_grid_run(run, fields)
+
+    def _read_grid_run(self, objs, fields):
+        # Read the fields of grids stored in the same file into a single
+        # buffer, and yield views of it. Views are only valid until the next
+        # run is read.
+        h5_dtype = np.dtype(self._field_dtype)
+        reads = []
+        size = 0
+        for obj in objs:
+            for field in fields:
+                node = "/Grid%08i/%s" % (obj.id, field[1])
+                try:
+                    dsid = self._get_dataset(obj.filename, node)
+                except KeyError:
+                    if field[1] != "Dark_Matter_Density":
+                        raise
+                    reads.append((None, obj.ActiveDimensions[::-1], size))
+                    size += int(obj.ActiveDimensions.prod())
+                    continue
+                reads.append((dsid, dsid.shape, size))
+                size += int(np.prod(dsid.shape))
+        buffer = np.empty(size, dtype=h5_dtype)
+        views = []
+        for dsid, shape, offset in reads:
+            data = buffer[offset : offset + int(np.prod(shape))].reshape(shape)
+            if dsid is None:
+                data[:] = 0
+            else:
+                dsid.read(h5py.h5s.ALL, h5py.h5s.ALL, data)
+            views.append(data.T[self._base])
+        views = iter(views)
+        for obj in objs:
+            for field in fields:
+                yield field, obj, next(views)
 
     def _read_obj_field(self, obj, field, fid_data):
         if fid_data is None:
             fid_data = (None, None)
         fid, data = fid_data
-        if fid is None:
-            close = True
-            fid = h5py.h5f.open(obj.filename.encode("latin-1"), h5py.h5f.ACC_RDONLY)
-        else:
-            close = False
-        if data is None:
-            data = np.empty(obj.ActiveDimensions[::-1], dtype=self._field_dtype)
         ftype, fname = field
+        node = "/Grid%08i/%s" % (obj.id, fname)
         try:
-            node = "/Grid%08i/%s" % (obj.id, fname)
-            dg = h5py.h5d.open(fid, node.encode("latin-1"))
+            if fid is None:
+                dg = self._get_dataset(obj.filename, node)
+            else:
+                dg = h5py.h5d.open(fid, node.encode("latin-1"))
         except KeyError:
+            if data is None:
+                data = np.empty(obj.ActiveDimensions[::-1], dtype=self._field_dtype)
             if fname == "Dark_Matter_Density":
                 data[:] = 0
                 return data.T
             raise
+        if data is None:
+            data = np.empty(dg.shape, dtype=self._field_dtype)
         dg.read(h5py.h5s.ALL, h5py.h5s.ALL, data)
-        # I don't know why, but on some installations of h5py this works, but
-        # on others, nope.  Doesn't seem to be a version thing.
-        # dg.close()
-        if close:
-            fid.close()
         return data.T
 
 
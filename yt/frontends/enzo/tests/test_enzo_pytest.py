@@ -0,0 +1,61 @@
+import numpy as np
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.loaders import load
+from yt.testing import requires_file, requires_module
+from yt.utilities.on_demand_imports import _h5py as h5py
+
+m7 = "DD0010/moving7_0010"
+
+
+@requires_module("h5py")
+@requires_file(m7)
+def test_batched_grid_reads():
+    ds = load(m7)
+    io = ds.index.io
+    fields = [("enzo", "Density"), ("enzo", "x-velocity")]
+    ad = ds.all_data()
+    for field in fields:
+        values = []
+        for g in ds.index.grids:
+            with h5py.File(g.filename, mode="r") as f:
+                data = f["Grid%08i" % g.id][field[1]][()].T
+            values.append(data[g.child_mask])
+        assert_equal(ad[field], np.concatenate(values).astype("float64"))
+
+    # datasets are opened once and reused by later reads
+    dsids = {fn: dict(d) for fn, (_, d) in io._open_datasets.items()}
+    assert sum(len(d) for d in dsids.values()) == 2 * ds.index.num_grids
+    sp = ds.sphere("c", 0.2)
+    sp[fields[0]]
+    for fn, (_, d) in io._open_datasets.items():
+        for node, dsid in dsids[fn].items():
+            assert d[node] is dsid
+
+    # a single grid is read the same way
+    g = ds.index.grids[-1]
+    with h5py.File(g.filename, mode="r") as f:
+        assert_equal(g[fields[0]], f["Grid%08i" % g.id]["Density"][()].T)
+
+
+@requires_module("h5py")
+@requires_file(m7)
+def test_open_datasets_limit():
+    old_value = ytcfg.get("yt", "max_open_files")
+    try:
+        ytcfg["yt", "max_open_files"] = 1
+        ds = load(m7)
+        ad = ds.all_data()
+        ref = ad["enzo", "Density"]
+        assert len(ds.index.io._open_datasets) <= 1
+        ds.close()
+        assert len(ds.index.io._open_datasets) == 0
+
+        # files are not kept open at all
+        ytcfg["yt", "max_open_files"] = 0
+        ds = load(m7)
+        assert_equal(ds.all_data()["enzo", "Density"], ref)
+        assert len(ds.index.io._open_datasets) == 0
+    finally:
+        ytcfg["yt", "max_open_files"] = old_value
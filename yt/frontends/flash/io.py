@@ -52,6 +52,11 @@ class IOHandlerFLASH(BaseIOHandler):
         self._handle = ds._handle
         self._particle_handle = ds._particle_handle
         self._particle_fields = determine_particle_fields(self._particle_handle)
+        # FLASH writes all the fluid fields with the same precision
+        names = self._handle["/unknown names"][:].ravel()
+        if len(names) > 0:
+            fname = names[0].decode("ascii", "ignore")
+            self._field_dtype = self._handle[f"/{fname}"].dtype
 
     def _read_particles(
         self, fields_to_read, type, args, grid_list, count_list, conv_factors
@@ -181,7 +186,7 @@ class IOHandlerFLASH(BaseIOHandler):
             data = ds[obj.id - obj._id_offset, :, :, :].transpose()
         else:
             data = ds[offset, :, :, :].transpose()
-        return data.astype("=f8")
+        return data.astype(self._output_dtype(data.dtype))
 
     def _read_chunk_data(self, chunk, fields):
         f = self._handle
@@ -207,8 +212,9 @@ class IOHandlerFLASH(BaseIOHandler):
                 start = gs[0].id - gs[0]._id_offset
                 end = gs[-1].id - gs[-1]._id_offset + 1
                 data = ds[start:end, :, :, :].transpose()
+                dtype = self._output_dtype(data.dtype)
                 for i, g in enumerate(gs):
-                    rv[g.id][field] = np.asarray(data[..., i], "=f8")
+                    rv[g.id][field] = np.asarray(data[..., i], dtype)
         return rv
 
 
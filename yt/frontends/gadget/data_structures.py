@@ -10,6 +10,7 @@ from yt.funcs import only_on_root
 from yt.geometry.geometry_handler import Index
 from yt.utilities.chemical_formulas import compute_mu
 from yt.utilities.cosmology import Cosmology
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.fortran_utils import read_record
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
@@ -697,19 +698,17 @@ class GadgetHDF5Dataset(GadgetDataset):
         veto_groups = ["FOF", "Group", "Subhalo"]
         valid = True
         try:
-            fh = h5py.File(filename, mode="r")
-            valid = all(ng in fh["/"] for ng in need_groups) and not any(
-                vg in fh["/"] for vg in veto_groups
-            )
-            fh.close()
+            with get_file_signature(filename).open_hdf5() as fh:
+                valid = all(ng in fh["/"] for ng in need_groups) and not any(
+                    vg in fh["/"] for vg in veto_groups
+                )
         except Exception:
             valid = False
             pass
 
         try:
-            fh = h5py.File(filename, mode="r")
-            valid = fh["Header"].attrs["Code"].decode("utf-8") != "SWIFT"
-            fh.close()
+            with get_file_signature(filename).open_hdf5() as fh:
+                valid = fh["Header"].attrs["Code"].decode("utf-8") != "SWIFT"
         except (OSError, KeyError):
             pass
 
@@ -196,25 +196,37 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                     data[:] = self.ds["Massarr"][ind]
                 elif field in self._element_names:
                     rfield = "ElementAbundance/" + field
-                    data = g[rfield][si:ei][mask, ...]
+                    data = self._read_selected_rows(g[rfield], si, ei, mask)
                 elif field.startswith("Metallicity_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["Metallicity"][si:ei, col][mask]
+                    data = self._read_selected_rows(
+                        g["Metallicity"], si, ei, mask, column=col
+                    )
                 elif field.startswith("GFM_Metals_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["GFM_Metals"][si:ei, col][mask]
+                    data = self._read_selected_rows(
+                        g["GFM_Metals"], si, ei, mask, column=col
+                    )
                 elif field.startswith("Chemistry_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["ChemistryAbundances"][si:ei, col][mask]
+                    data = self._read_selected_rows(
+                        g["ChemistryAbundances"], si, ei, mask, column=col
+                    )
                 elif field.startswith("PassiveScalars_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["PassiveScalars"][si:ei, col][mask]
+                    data = self._read_selected_rows(
+                        g["PassiveScalars"], si, ei, mask, column=col
+                    )
                 elif field.startswith("GFM_StellarPhotometrics_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["GFM_StellarPhotometrics"][si:ei, col][mask]
+                    data = self._read_selected_rows(
+                        g["GFM_StellarPhotometrics"], si, ei, mask, column=col
+                    )
                 elif field.startswith("MetalMasses_"):
                     col = int(field.rsplit("_", 1)[-1])
-                    data = g["Mass of Metals"][si:ei, col][mask]
+                    data = self._read_selected_rows(
+                        g["Mass of Metals"], si, ei, mask, column=col
+                    )
                 elif field == "smoothing_length":
                     # This is for frontends which do not store
                     # the smoothing length on-disk, so we do not
@@ -228,7 +240,7 @@ class IOHandlerGadgetHDF5(IOHandlerSPH):
                         ).astype("float64")
                     data = hsmls[mask]
                 else:
-                    data = g[field][si:ei][mask, ...]
+                    data = self._read_selected_rows(g[field], si, ei, mask)
 
                 data_return[ptype, field] = data
 
@@ -371,39 +383,34 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
             for obj in chunk.objs:
                 data_files.update(obj.data_files)
         for data_file in sorted(data_files, key=lambda x: (x.filename, x.start)):
-            poff = data_file.field_offsets
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            f = self._open_data_file(data_file)
             for ptype in ptf:
                 if tp[ptype] == 0:
                     # skip if there are no particles
                     continue
-                f.seek(poff[ptype, "Coordinates"], os.SEEK_SET)
-                pos = self._read_field_from_file(f, tp[ptype], "Coordinates")
+                pos = self._read_native(f, data_file, ptype, "Coordinates")
                 if ptype == self.ds._sph_ptypes[0]:
-                    f.seek(poff[ptype, "SmoothingLength"], os.SEEK_SET)
-                    hsml = self._read_field_from_file(f, tp[ptype], "SmoothingLength")
+                    hsml = self._read_native(f, data_file, ptype, "SmoothingLength")
                 else:
                     hsml = 0.0
                 yield ptype, (pos[:, 0], pos[:, 1], pos[:, 2]), hsml
-            f.close()
+            if f is not None:
+                f.close()
 
     def _read_particle_data_file(self, data_file, ptf, selector=None):
         return_data = {}
-        poff = data_file.field_offsets
         tp = data_file.total_particles
-        f = open(data_file.filename, "rb")
+        f = self._open_data_file(data_file)
         for ptype, field_list in sorted(ptf.items()):
             if tp[ptype] == 0:
                 continue
             if selector is None or getattr(selector, "is_all_data", False):
                 mask = slice(None, None, None)
             else:
-                f.seek(poff[ptype, "Coordinates"], os.SEEK_SET)
-                pos = self._read_field_from_file(f, tp[ptype], "Coordinates")
+                pos = self._read_native(f, data_file, ptype, "Coordinates")
                 if ptype == self.ds._sph_ptypes[0]:
-                    f.seek(poff[ptype, "SmoothingLength"], os.SEEK_SET)
-                    hsml = self._read_field_from_file(f, tp[ptype], "SmoothingLength")
+                    hsml = self._read_native(f, data_file, ptype, "SmoothingLength")
                 else:
                     hsml = 0.0
                 mask = selector.select_points(pos[:, 0], pos[:, 1], pos[:, 2], hsml)
@@ -421,21 +428,59 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
                     m = self.ds.parameters["Massarr"][self._ptypes.index(ptype)]
                     data[:] = m
                 else:
-                    f.seek(poff[ptype, field], os.SEEK_SET)
-                    data = self._read_field_from_file(f, tp[ptype], field)
+                    data = self._read_field(f, data_file, ptype, field)
+                    # with memory mapping, only the selected values are
+                    # copied out of the mapped file
                     data = data[mask, ...]
+                    if f is None:
+                        data = data.astype(
+                            data.dtype.newbyteorder("N"),
+                            copy=isinstance(mask, slice),
+                        )
                 return_data[ptype, field] = data
-        f.close()
+        if f is not None:
+            f.close()
         return return_data
 
-    def _read_field_from_file(self, f, count, name):
-        if count == 0:
-            return
+    def _open_data_file(self, data_file):
+        # the file is only read through its memory map if enabled
+        if self._memory_map:
+            return None
+        return open(data_file.filename, "rb")
+
+    def _field_dtype(self, name):
         if name == "ParticleIDs":
             dt = self._endian + self.ds._id_dtype
         else:
             dt = self._endian + self._float_type
-        dt = np.dtype(dt)
+        return np.dtype(dt)
+
+    def _read_field(self, f, data_file, ptype, name):
+        # Read the values of the field *name* of *ptype* in *data_file*, from
+        # the open file *f*, or as a view of the memory-mapped file, which is
+        # not necessarily in native byte order.
+        offset = data_file.field_offsets[ptype, name]
+        count = data_file.total_particles[ptype]
+        if f is None:
+            shape = (self._vector_fields[name],) if name in self._vector_fields else ()
+            return self._map_records(
+                data_file.filename, self._field_dtype(name), count, offset, shape
+            )
+        f.seek(offset, os.SEEK_SET)
+        return self._read_field_from_file(f, count, name)
+
+    def _read_native(self, f, data_file, ptype, name):
+        # Same as _read_field, with the values copied out of the memory map
+        # in native byte order, as expected by the selectors.
+        data = self._read_field(f, data_file, ptype, name)
+        if f is None:
+            data = data.astype(data.dtype.newbyteorder("N"))
+        return data
+
+    def _read_field_from_file(self, f, count, name):
+        if count == 0:
+            return
+        dt = self._field_dtype(name)
         if name in self._vector_fields:
             count *= self._vector_fields[name]
         arr = np.fromfile(f, dtype=dt, count=count)
@@ -479,11 +524,10 @@ class IOHandlerGadgetBinary(IOHandlerSPH):
         return ret
 
     def _get_field(self, data_file, field, ptype):
-        poff = data_file.field_offsets
-        tp = data_file.total_particles
-        with open(data_file.filename, "rb") as f:
-            f.seek(poff[ptype, field], os.SEEK_SET)
-            pp = self._read_field_from_file(f, tp[ptype], field)
+        f = self._open_data_file(data_file)
+        pp = self._read_native(f, data_file, ptype, field)
+        if f is not None:
+            f.close()
         return pp
 
     def _count_particles(self, data_file):
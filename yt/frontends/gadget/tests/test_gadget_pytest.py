@@ -32,3 +32,78 @@ def test_gadget_header_array_reduction(tmp_path):
     for attr in ("Redshift", "Omega0"):
         assert hvals[attr] == hvals_orig[attr]
         assert isinstance(hvals[attr], np.ndarray) is False
+
+
+@requires_module("h5py")
+def test_read_selected_rows(tmp_path):
+    from yt.frontends.sph.io import IOHandlerSPH
+
+    prng = np.random.RandomState(0x4D3D3D3)
+    io = IOHandlerSPH.__new__(IOHandlerSPH)
+    with h5py.File(tmp_path / "data.h5", mode="w") as f:
+        dsets = [
+            f.create_dataset("scalar", data=prng.random_sample(10000).astype("f4")),
+            f.create_dataset(
+                "vector", data=prng.random_sample((10000, 3)), chunks=(128, 3)
+            ),
+        ]
+        for density in (0.0, 1e-3, 1e-2, 0.5):
+            mask = prng.random_sample(6000) < density
+            for dset, column in ((dsets[0], None), (dsets[1], None), (dsets[1], 2)):
+                data = dset[1000:7000] if column is None else dset[1000:7000, column]
+                rows = io._read_selected_rows(dset, 1000, 7000, mask, column=column)
+                assert rows.dtype == data.dtype
+                np.testing.assert_equal(rows, data[mask])
+
+
+@requires_module("h5py")
+def test_sparse_particle_reads(tmp_path, monkeypatch):
+    from yt.frontends.sph.io import IOHandlerSPH
+    from yt.testing import fake_gadget_hdf5_ds
+
+    ds = fake_gadget_hdf5_ds(tmp_path, npart=8192)
+    sp = ds.sphere([0.3, 0.5, 0.5], 0.05)
+    fields = [("PartType0", "Density"), ("PartType1", "Velocities")]
+    data = {field: sp[field] for field in fields}
+
+    # read whole data files and mask them
+    monkeypatch.setattr(IOHandlerSPH, "_sparse_read_max_runs", -1)
+    sp = ds.sphere([0.3, 0.5, 0.5], 0.05)
+    for field in fields:
+        assert data[field].size > 0
+        np.testing.assert_equal(data[field], sp[field])
+
+
+@requires_module("h5py")
+def test_memory_mapped_binary_reads(tmp_path):
+    from numpy.testing import assert_equal
+
+    from yt.config import ytcfg
+    from yt.frontends.gadget.testing import fake_gadget_binary
+
+    fields = [
+        ("Gas", "Coordinates"),
+        ("Gas", "Density"),
+        ("Halo", "ParticleIDs"),
+        ("Stars", "Velocities"),
+        ("all", "Mass"),
+    ]
+    old_value = ytcfg.get("yt", "memory_map_particle_files")
+    for endian in "<>":
+        fn = fake_gadget_binary(str(tmp_path / f"snap_{endian == '<'}"), endian=endian)
+        values = []
+        try:
+            for memory_map in (False, True):
+                ytcfg["yt", "memory_map_particle_files"] = memory_map
+                ds = yt.load(fn)
+                assert ds.index.io._memory_map is memory_map
+                ad = ds.all_data()
+                sp = ds.sphere([0.5, 0.5, 0.5], 0.25)
+                values.append([ad[field] for field in fields])
+                values[-1] += [sp[field] for field in fields]
+        finally:
+            ytcfg["yt", "memory_map_particle_files"] = old_value
+        for v1, v2 in zip(*values, strict=True):
+            assert v1.size > 0
+            assert v2.dtype.isnative
+            assert_equal(v1, v2)
@@ -15,6 +15,7 @@ from yt.frontends.halo_catalog.data_structures import HaloCatalogFile, HaloDatas
 from yt.funcs import only_on_root, setdefaultattr
 from yt.geometry.particle_geometry_handler import ParticleIndex
 from yt.utilities.cosmology import Cosmology
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -300,11 +301,10 @@ class GadgetFOFDataset(ParticleDataset):
         veto_groups = ["FOF"]
         valid = True
         try:
-            fh = h5py.File(filename, mode="r")
-            valid = all(ng in fh["/"] for ng in need_groups) and not any(
-                vg in fh["/"] for vg in veto_groups
-            )
-            fh.close()
+            with get_file_signature(filename).open_hdf5() as fh:
+                valid = all(ng in fh["/"] for ng in need_groups) and not any(
+                    vg in fh["/"] for vg in veto_groups
+                )
         except Exception:
             valid = False
             pass
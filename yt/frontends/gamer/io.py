@@ -99,7 +99,8 @@ class IOHandlerGAMER(BaseIOHandler):
 
         rv = {}
         for field in fields:
-            rv[field] = np.empty(size, dtype=self._field_dtype)
+            dtype = self._output_dtype(self._group_grid[field[1]].dtype)
+            rv[field] = np.empty(size, dtype=dtype)
 
         ng = sum(len(c.objs) for c in chunks)  # c.objs is a list of grids
         mylog.debug(
@@ -115,6 +116,7 @@ class IOHandlerGAMER(BaseIOHandler):
 
         for field in fields:
             ds = self._group_grid[field[1]]
+            dtype = rv[field].dtype
             offset = 0
             for chunk in chunks:
                 for gs in grid_sequences(chunk.objs):
@@ -122,7 +124,7 @@ class IOHandlerGAMER(BaseIOHandler):
                     end = (gs[-1].id + 1) * self.pgroup
                     buf = ds[start:end, :, :, :]
                     ngrid = len(gs)
-                    data = np.empty((ngrid, ps2, ps2, ps2), dtype=self._field_dtype)
+                    data = np.empty((ngrid, ps2, ps2, ps2), dtype=dtype)
 
                     for g in range(ngrid):
                         pid0 = g * self.pgroup
@@ -171,13 +173,14 @@ class IOHandlerGAMER(BaseIOHandler):
 
         for field in fluid_fields:
             ds = self._group_grid[field[1]]
+            dtype = self._output_dtype(ds.dtype)
 
             for gs in grid_sequences(chunk.objs):
                 start = (gs[0].id) * self.pgroup
                 end = (gs[-1].id + 1) * self.pgroup
                 buf = ds[start:end, :, :, :]
                 ngrid = len(gs)
-                data = np.empty((ngrid, ps2, ps2, ps2), dtype=self._field_dtype)
+                data = np.empty((ngrid, ps2, ps2, ps2), dtype=dtype)
 
                 for g in range(ngrid):
                     pid0 = g * self.pgroup
@@ -13,6 +13,7 @@ from yt.units.dimensions import dimensionless as sympy_one  # type: ignore
 from yt.units.unit_object import Unit  # type: ignore
 from yt.units.unit_systems import unit_system_registry  # type: ignore
 from yt.utilities.exceptions import YTGDFUnknownGeometry
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.lib.misc_utilities import get_box_grids_level
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
@@ -290,15 +291,7 @@ class GDFDataset(Dataset):
         if cls._missing_load_requirements():
             return False
 
-        try:
-            fileh = h5py.File(filename, mode="r")
-            if "gridded_data_format" in fileh:
-                fileh.close()
-                return True
-            fileh.close()
-        except Exception:
-            pass
-        return False
+        return "gridded_data_format" in get_file_signature(filename).hdf5_keys
 
     def __str__(self):
         return self.basename.rsplit(".", 1)[0]
@@ -4,8 +4,8 @@ import numpy as np
 
 from yt.frontends.gadget.data_structures import GadgetHDF5Dataset
 from yt.utilities.cosmology import Cosmology
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.logger import ytLogger as mylog
-from yt.utilities.on_demand_imports import _h5py as h5py
 
 from .fields import GizmoFieldInfo
 
@@ -42,21 +42,20 @@ class GizmoDataset(GadgetHDF5Dataset):
             else:
                 valid_fname = valid_files[0]
         try:
-            fh = h5py.File(valid_fname, mode="r")
-            valid = all(ng in fh["/"] for ng in need_groups) and not any(
-                vg in fh["/"] for vg in veto_groups
-            )
-            # From Apr 2021, 7f1f06f, public gizmo includes a header variable
-            # GIZMO_version, which is set to the year of the most recent commit
-            # We should prefer this to checking the metallicity, which might
-            # not exist
-            if "GIZMO_version" not in fh["/Header"].attrs:
-                dmetal = "/PartType0/Metallicity"
-                if dmetal not in fh or (
-                    fh[dmetal].ndim > 1 and fh[dmetal].shape[1] < 11
-                ):
-                    valid = False
-            fh.close()
+            with get_file_signature(valid_fname).open_hdf5() as fh:
+                valid = all(ng in fh["/"] for ng in need_groups) and not any(
+                    vg in fh["/"] for vg in veto_groups
+                )
+                # From Apr 2021, 7f1f06f, public gizmo includes a header variable
+                # GIZMO_version, which is set to the year of the most recent commit
+                # We should prefer this to checking the metallicity, which might
+                # not exist
+                if "GIZMO_version" not in fh["/Header"].attrs:
+                    dmetal = "/PartType0/Metallicity"
+                    if dmetal not in fh or (
+                        fh[dmetal].ndim > 1 and fh[dmetal].shape[1] < 11
+                    ):
+                        valid = False
         except Exception:
             valid = False
         return valid
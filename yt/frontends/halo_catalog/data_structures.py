@@ -15,6 +15,7 @@ from yt.data_objects.static_output import (
 from yt.frontends.ytdata.data_structures import SavedDataset
 from yt.funcs import parse_h5_attr
 from yt.geometry.particle_geometry_handler import ParticleIndex
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 from .fields import YTHaloCatalogFieldInfo, YTHaloCatalogHaloFieldInfo
@@ -170,7 +171,7 @@ class YTHaloCatalogDataset(SavedDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             if (
                 "data_type" in f.attrs
                 and parse_h5_attr(f, "data_type") == "halo_catalog"
@@ -13,7 +13,11 @@ from yt.frontends.open_pmd.fields import OpenPMDFieldInfo
 from yt.frontends.open_pmd.misc import get_component, is_const_component
 from yt.funcs import setdefaultattr
 from yt.geometry.grid_geometry_handler import GridIndex
-from yt.utilities.file_handler import HDF5FileHandler, valid_hdf5_signature
+from yt.utilities.file_handler import (
+    HDF5FileHandler,
+    get_file_signature,
+    valid_hdf5_signature,
+)
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -610,7 +614,7 @@ class OpenPMDDataset(Dataset):
             return False
 
         try:
-            with h5py.File(filename, mode="r") as f:
+            with get_file_signature(filename).open_hdf5() as f:
                 attrs = list(f["/"].attrs.keys())
                 for i in opmd_required_attributes:
                     if i not in attrs:
@@ -679,7 +683,7 @@ class OpenPMDGroupBasedDataset(Dataset):
             return False
 
         try:
-            with h5py.File(filename, mode="r") as f:
+            with get_file_signature(filename).open_hdf5() as f:
                 attrs = list(f["/"].attrs.keys())
                 for i in opmd_required_attributes:
                     if i not in attrs:
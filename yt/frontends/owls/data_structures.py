@@ -3,7 +3,7 @@ import os
 import yt.units
 from yt.frontends.gadget.data_structures import GadgetHDF5Dataset
 from yt.utilities.definitions import sec_conversion
-from yt.utilities.on_demand_imports import _h5py as h5py
+from yt.utilities.file_handler import get_file_signature
 
 from .fields import OWLSFieldInfo
 
@@ -65,14 +65,13 @@ class OWLSDataset(GadgetHDF5Dataset):
             else:
                 valid_fname = valid_files[0]
         try:
-            fileh = h5py.File(valid_fname, mode="r")
-            for ng in need_groups:
-                if ng not in fileh["/"]:
-                    valid = False
-            for vg in veto_groups:
-                if vg in fileh["/"]:
-                    valid = False
-            fileh.close()
+            with get_file_signature(valid_fname).open_hdf5() as fileh:
+                for ng in need_groups:
+                    if ng not in fileh["/"]:
+                        valid = False
+                for vg in veto_groups:
+                    if vg in fileh["/"]:
+                        valid = False
         except Exception:
             valid = False
         return valid
@@ -9,6 +9,7 @@ from yt.frontends.gadget.data_structures import _fix_unit_ordering
 from yt.funcs import only_on_root, setdefaultattr
 from yt.geometry.particle_geometry_handler import ParticleIndex
 from yt.utilities.exceptions import YTException
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -210,9 +211,8 @@ class OWLSSubfindDataset(ParticleDataset):
         need_groups = ["Constants", "Header", "Parameters", "Units", "FOF"]
         valid = True
         try:
-            fh = h5py.File(filename, mode="r")
-            valid = all(ng in fh["/"] for ng in need_groups)
-            fh.close()
+            with get_file_signature(filename).open_hdf5() as fh:
+                valid = all(ng in fh["/"] for ng in need_groups)
         except Exception:
             valid = False
         return valid
@@ -8,14 +8,17 @@ from pathlib import Path
 import numpy as np
 
 from yt.arraytypes import blankRecordArray
+from yt.config import ytcfg
 from yt.data_objects.index_subobjects.octree_subset import OctreeSubset
 from yt.data_objects.particle_filters import add_particle_filter
 from yt.data_objects.static_output import Dataset
 from yt.funcs import mylog, setdefaultattr
 from yt.geometry.geometry_handler import YTDataChunk
+from yt.geometry.grid_hierarchy_cache import read_grid_hierarchy, write_grid_hierarchy
 from yt.geometry.oct_container import RAMSESOctreeContainer
 from yt.geometry.oct_geometry_handler import OctreeIndex
 from yt.utilities.cython_fortran_utils import FortranFile as fpu
+from yt.utilities.file_handler import FileHandlePool
 from yt.utilities.lib.cosmology_time import t_frw, tau_frw
 from yt.utilities.on_demand_imports import _f90nml as f90nml
 from yt.utilities.physical_constants import kb, mp
@@ -30,8 +33,8 @@ from .definitions import (
 )
 from .field_handlers import get_field_handlers
 from .fields import _X, RAMSESFieldInfo
-from .hilbert import get_intersecting_cpus
-from .io_utils import fill_hydro, read_amr
+from .hilbert import get_cpu_list_points, get_intersecting_cpus
+from .io_utils import add_amr_positions, fill_hydro, read_amr, read_amr_positions
 from .particle_handlers import get_particle_handlers
 
 
@@ -334,6 +337,48 @@ class RAMSESDomainFile:
         self._read_amr_header()
         return self._amr_header
 
+    @property
+    def _octree_filename(self):
+        return f"{self.amr_fn}.octree"
+
+    def _get_octree_metadata(self):
+        # The stored positions are only valid for the very AMR file they were
+        # read from, and with the levels that were read.
+        st = os.stat(self.amr_fn)
+        return {
+            "amr_mtime_ns": st.st_mtime_ns,
+            "amr_size": st.st_size,
+            "min_level": int(self.ds.min_level),
+            "nlevelmax": int(self.amr_header["nlevelmax"]),
+        }
+
+    def _get_amr_positions(self):
+        # The positions of the octs are read from a sidecar file next to the
+        # AMR file, which is written the first time they are read from it.
+        fn = self._octree_filename
+        metadata = self._get_octree_metadata()
+        if os.path.isfile(fn):
+            try:
+                stored_metadata, arrays = read_grid_hierarchy(fn)
+            except (OSError, ValueError, KeyError) as e:
+                mylog.debug("Could not read the octree from %s: %s", fn, e)
+            else:
+                if stored_metadata == metadata:
+                    return arrays
+                mylog.debug("The octree in %s is out of date.", fn)
+
+        with self.amr_file as f:
+            f.seek(self.amr_offset)
+            arrays = read_amr_positions(
+                f, self.amr_header, self.ngridbound, self.ds.min_level
+            )
+        if os.access(os.path.dirname(os.path.abspath(fn)), os.W_OK):
+            try:
+                write_grid_hierarchy(fn, arrays, metadata)
+            except OSError as e:
+                mylog.debug("Could not write the octree to %s: %s", fn, e)
+        return arrays
+
     @cached_property
     def oct_handler(self):
         """Open the oct file, read in octs level-by-level.
@@ -357,15 +402,18 @@ class RAMSESDomainFile:
             self.ngridbound.sum(),
         )
 
-        with self.amr_file as f:
-            f.seek(self.amr_offset)
+        if ytcfg.get("yt", "octree_cache"):
+            max_level = add_amr_positions(oct_handler, **self._get_amr_positions())
+        else:
+            with self.amr_file as f:
+                f.seek(self.amr_offset)
 
-            min_level = self.ds.min_level
-            max_level = read_amr(
-                f, self.amr_header, self.ngridbound, min_level, oct_handler
-            )
+                min_level = self.ds.min_level
+                max_level = read_amr(
+                    f, self.amr_header, self.ngridbound, min_level, oct_handler
+                )
 
-            oct_handler.finalize()
+        oct_handler.finalize()
 
         new_max_level = max_level
         if new_max_level > self.max_level:
@@ -617,6 +665,11 @@ class RAMSESIndex(OctreeIndex):
 
         self.domains = [RAMSESDomainFile(self.dataset, i + 1) for i in cpu_list]
 
+    def _locate_point_domains(self, coords):
+        if self.ds.parameters["ordering type"] != "hilbert":
+            return None
+        return get_cpu_list_points(self.ds, coords.to_value("code_length")) + 1
+
     @cached_property
     def max_level(self):
         force_max_level, convention = self.ds._force_max_level
@@ -835,6 +888,8 @@ class RAMSESDataset(Dataset):
         """
 
         self._fields_in_file = fields
+        # Open handles of the fluid and particle files, shared between reads
+        self._file_pool = FileHandlePool(fpu, ytcfg.get("yt", "max_open_files"))
         # By default, extra fields have not triggered a warning
         self._warned_extra_fields = defaultdict(lambda: False)
         self._extra_particle_fields = extra_particle_fields
@@ -1024,6 +1079,9 @@ class RAMSESDataset(Dataset):
         # Only the length unit get scales by a factor of boxlen
         setdefaultattr(self, "length_unit", self.quan(length_unit * boxlen, "cm"))
 
+    def close(self):
+        self._file_pool.close()
+
     def _parse_parameter_file(self):
         # hardcoded for now
         # These should be explicitly obtained from the file, but for now that
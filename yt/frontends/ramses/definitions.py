@@ -2,7 +2,7 @@
 import re
 
 from yt.funcs import mylog
-from yt.utilities.configure import YTConfig, configuration_callbacks
+from yt.utilities.configure import YTConfig, register_configuration_callback
 
 
 def ramses_header(hvals):
@@ -83,4 +83,4 @@ def _setup_ramses_particle_families(ytcfg: YTConfig) -> None:
             particle_families[key] = val
 
 
-configuration_callbacks.append(_setup_ramses_particle_families)
+register_configuration_callback(_setup_ramses_particle_families)
@@ -243,7 +243,8 @@ class FieldFileHandler(abc.ABC, HandlerMixin):
         *structure* of your fluid file is non-canonical, change this.
         """
         nvars = len(self.field_list)
-        with FortranFile(self.fname) as fd:
+        with self.domain.ds._file_pool.open(self.fname) as fd:
+            fd.seek(0)
             # Skip headers
             nskip = len(self.attrs)
             fd.skip(nskip)
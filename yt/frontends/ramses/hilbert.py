@@ -201,3 +201,41 @@ def get_cpu_list_cuboid(
         cpu_read.update(range(cpu_min[i], cpu_max[i]))
 
     return cpu_read
+
+
+def get_cpu_list_points(
+    ds,
+    X: "np.ndarray[Any, np.dtype[np.float64]]",
+    bound_keys: Optional["np.ndarray[Any, np.dtype[np.float64]]"] = None,
+) -> "np.ndarray[Any, np.dtype[np.int64]]":
+    """
+    Return the CPU owning each position, following the hilbert domain
+    decomposition. Note that it will be 0-indexed.
+
+    Parameters
+    ----------
+    ds : Dataset
+      The dataset containing the information
+    X : (N, ndim) float array
+      An array containing positions. They should be between 0 and 1.
+    """
+    X = np.atleast_2d(X)
+    if X.shape[1] != 3:
+        raise NotImplementedError("This function is only implemented in 3D.")
+
+    ncpu = ds.parameters["ncpu"]
+    if bound_keys is None:
+        bound_keys = np.empty(ncpu + 1, dtype="float64")
+        bound_keys[:ncpu] = [ds.hilbert_indices[icpu + 1][0] for icpu in range(ncpu)]
+        bound_keys[ncpu] = ds.hilbert_indices[ncpu][1]
+
+    # The keys are defined at level levelmax + 1, but they have to fit in
+    # 64 bits, so they are computed at most at level 21.
+    levelmax = ds.parameters["levelmax"]
+    bit_length = min(levelmax + 1, 21)
+    dkey = 2.0 ** (3 * (levelmax + 1 - bit_length))
+    maxdom = 2**bit_length
+    ijk = np.clip((X * maxdom).astype(np.int64), 0, maxdom - 1)
+    keys = hilbert3d(ijk, bit_length) * dkey
+
+    return np.clip(np.searchsorted(bound_keys, keys, side="right") - 1, 0, ncpu - 1)
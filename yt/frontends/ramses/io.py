@@ -1,4 +1,5 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import TYPE_CHECKING, Union
 
@@ -6,8 +7,8 @@ import numpy as np
 from unyt import unyt_array
 
 from yt._maintenance.deprecation import issue_deprecation_warning
+from yt.config import ytcfg
 from yt.frontends.ramses.definitions import VAR_DESC_RE, VERSION_RE
-from yt.utilities.cython_fortran_utils import FortranFile
 from yt.utilities.exceptions import (
     YTFieldTypeNotFound,
     YTFileNotParseable,
@@ -92,7 +93,7 @@ def _ramses_particle_binary_file_handler(particle_handler, subset, fields, count
     foffsets = particle_handler.field_offsets
     fname = particle_handler.fname
     data_types = particle_handler.field_types
-    with FortranFile(fname) as fd:
+    with ds._file_pool.open(fname) as fd:
         # We do *all* conversion into boxlen here.
         # This means that no other conversions need to be applied to convert
         # positions into the same domain as the octs themselves.
@@ -168,42 +169,39 @@ class IOHandlerRAMSES(BaseIOHandler):
 
         # Set of field types
         ftypes = {f[0] for f in fields}
-        for chunk in chunks:
-            # Gather fields by type to minimize i/o operations
-            for ft in ftypes:
-                # Get all the fields of the same type
-                field_subs = list(filter(lambda f, ft=ft: f[0] == ft, fields))
-
-                # Loop over subsets
-                for subset in chunk.objs:
-                    fname = None
-                    for fh in subset.domain.field_handlers:
-                        if fh.ftype == ft:
-                            file_handler = fh
-                            fname = fh.fname
-                            break
-
-                    if fname is None:
-                        raise YTFieldTypeNotFound(ft)
-
-                    # Now we read the entire thing
-                    with FortranFile(fname) as fd:
-                        # This contains the boundary information, so we skim through
-                        # and pick off the right vectors
-                        rv = subset.fill(fd, field_subs, selector, file_handler)
-                    for ft, f in field_subs:
-                        d = rv.pop(f)
-                        if d.size == 0:
-                            continue
-                        mylog.debug(
-                            "Filling %s with %s (%0.3e %0.3e) (%s zones)",
-                            f,
-                            d.size,
-                            d.min(),
-                            d.max(),
-                            d.size,
-                        )
-                        tr[ft, f].append(d)
+        subsets = [subset for chunk in chunks for subset in chunk.objs]
+        nthreads = ytcfg.get("yt", "io_threads")
+        if nthreads > 1 and len(subsets) > 1:
+            # Domains are independent, so they are read concurrently. The
+            # Cython routines filling them release the GIL while reading
+            # records and filling the octs. The results are gathered in the
+            # order of the subsets, so they do not depend on the threads.
+            with ThreadPoolExecutor(max_workers=nthreads) as executor:
+                results = list(
+                    executor.map(
+                        lambda s: self._read_subset(s, ftypes, fields, selector),
+                        subsets,
+                    )
+                )
+        else:
+            results = (
+                self._read_subset(subset, ftypes, fields, selector)
+                for subset in subsets
+            )
+
+        for rv in results:
+            for field, d in rv.items():
+                if d.size == 0:
+                    continue
+                mylog.debug(
+                    "Filling %s with %s (%0.3e %0.3e) (%s zones)",
+                    field[1],
+                    d.size,
+                    d.min(),
+                    d.max(),
+                    d.size,
+                )
+                tr[field].append(d)
         d = {}
         for field in fields:
             tmp = tr.pop(field, None)
@@ -211,6 +209,34 @@ class IOHandlerRAMSES(BaseIOHandler):
 
         return d
 
+    def _read_subset(self, subset, ftypes, fields, selector):
+        # Read the fields of the subset, gathering them by type to minimize
+        # i/o operations
+        rv = {}
+        for ft in ftypes:
+            # Get all the fields of the same type
+            field_subs = list(filter(lambda f, ft=ft: f[0] == ft, fields))
+
+            fname = None
+            for fh in subset.domain.field_handlers:
+                if fh.ftype == ft:
+                    file_handler = fh
+                    fname = fh.fname
+                    break
+
+            if fname is None:
+                raise YTFieldTypeNotFound(ft)
+
+            # Now we read the entire thing, reusing the handle of the file if
+            # it was opened by a previous read
+            with self.ds._file_pool.open(fname) as fd:
+                # This contains the boundary information, so we skim through
+                # and pick off the right vectors
+                data = subset.fill(fd, field_subs, selector, file_handler)
+            for field in field_subs:
+                rv[field] = data.pop(field[1])
+        return rv
+
     def _read_particle_coords(self, chunks, ptf):
         pn = "particle_position_%s"
         fields = [
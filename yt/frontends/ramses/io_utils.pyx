@@ -1,7 +1,7 @@
 # distutils: libraries = STD_LIBS
 # distutils: include_dirs = LIB_DIR
 cimport cython
-from libc.stdio cimport SEEK_CUR, SEEK_SET
+from libc.stdio cimport FILE, SEEK_CUR, SEEK_SET, fread, fseek
 cimport numpy as np
 
 import numpy as np
@@ -25,14 +25,30 @@ cdef inline int skip_len(int Nskip, int record_len) noexcept nogil:
     return Nskip * (record_len * DOUBLE_SIZE + INT64_SIZE)
 
 
+cdef inline int read_record_inplace(FILE* cfile, INT32_t nbytes, void *data) noexcept nogil:
+    """Read a record of nbytes bytes into data. Return -1 if the record
+    does not have this size."""
+    cdef INT32_t s1, s2
+    if fread(&s1, INT32_SIZE, 1, cfile) != 1 or s1 != nbytes:
+        return -1
+    if fread(data, 1, nbytes, cfile) != <size_t> nbytes:
+        return -1
+    if fread(&s2, INT32_SIZE, 1, cfile) != 1 or s2 != s1:
+        return -1
+    return 0
+
+
 @cython.cpow(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
 @cython.nonecheck(False)
-def read_amr(FortranFile f, dict headers,
-             np.ndarray[np.int64_t, ndim=1] ngridbound, INT64_t min_level,
-             RAMSESOctreeContainer oct_handler):
+cdef INT64_t _read_amr(FortranFile f, dict headers,
+                       np.ndarray[np.int64_t, ndim=1] ngridbound, INT64_t min_level,
+                       RAMSESOctreeContainer oct_handler, list blocks) except -1:
+    # Read the positions of the octs, level by level and cpu by cpu. They are
+    # added to oct_handler if it is not None, and appended to blocks as
+    # (cpu, level, positions) tuples if it is not None.
 
     cdef INT64_t ncpu, nboundary, max_level, nlevelmax, ncpu_and_bound
     cdef DOUBLE_t nx, ny, nz
@@ -98,7 +114,9 @@ def read_amr(FortranFile f, dict headers,
             f.seek(record_len * jump_len, SEEK_CUR)
 
             # Note that we're adding *grids*, not individual cells.
-            if ilevel >= min_level:
+            if ilevel >= min_level and blocks is not None:
+                blocks.append((icpu + 1, ilevel - min_level, pos[:ng, :].copy()))
+            if ilevel >= min_level and oct_handler is not None:
                 n = oct_handler.add(icpu + 1, ilevel - min_level, pos[:ng, :],
                                     count_boundary = 1)
                 if n > 0:
@@ -106,6 +124,59 @@ def read_amr(FortranFile f, dict headers,
 
     return max_level
 
+
+def read_amr(FortranFile f, dict headers,
+             np.ndarray[np.int64_t, ndim=1] ngridbound, INT64_t min_level,
+             RAMSESOctreeContainer oct_handler):
+    """Add the octs of the AMR file to oct_handler and return the deepest
+    level (relative to min_level) where octs were added."""
+    return _read_amr(f, headers, ngridbound, min_level, oct_handler, None)
+
+
+def read_amr_positions(FortranFile f, dict headers,
+                       np.ndarray[np.int64_t, ndim=1] ngridbound, INT64_t min_level):
+    """Read the positions of the octs of the AMR file, without building the
+    octree.
+
+    Returns a dict with the cpu (1-indexed), the level (relative to min_level)
+    and the number of octs of each block of octs, in the order they are
+    stored in the file, and the positions of all the octs. They can be
+    added to an octree with add_amr_positions.
+    """
+    cdef list blocks = []
+    _read_amr(f, headers, ngridbound, min_level, None, blocks)
+    if len(blocks) == 0:
+        return {
+            "cpus": np.empty(0, dtype="int32"),
+            "levels": np.empty(0, dtype="int32"),
+            "counts": np.empty(0, dtype="int64"),
+            "positions": np.empty((0, 3), dtype="float64"),
+        }
+    cpus, levels, positions = zip(*blocks)
+    return {
+        "cpus": np.array(cpus, dtype="int32"),
+        "levels": np.array(levels, dtype="int32"),
+        "counts": np.array([len(p) for p in positions], dtype="int64"),
+        "positions": np.concatenate(positions),
+    }
+
+
+def add_amr_positions(RAMSESOctreeContainer oct_handler,
+                      np.ndarray cpus, np.ndarray levels, np.ndarray counts,
+                      np.ndarray positions):
+    """Add octs read by read_amr_positions to oct_handler and return the
+    deepest level where octs were added, like read_amr."""
+    cdef INT64_t max_level = 0, start = 0, n
+    cdef Py_ssize_t i
+    for i in range(cpus.shape[0]):
+        n = oct_handler.add(cpus[i], levels[i], positions[start:start + counts[i]],
+                            count_boundary = 1)
+        if n > 0:
+            max_level = max(levels[i], max_level)
+        start += counts[i]
+    return max_level
+
+
 @cython.cpow(True)
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -179,6 +250,8 @@ def fill_hydro(FortranFile f,
     cdef INT64_t twotondim
     cdef int ilevel, icpu, nlevels, nc, ncpu_selected, nfields_selected
     cdef int i, j, ii
+    cdef int status = 0
+    cdef FILE* cfile
 
     twotondim = 2**ndim
     nfields_selected = len(fields)
@@ -231,21 +304,39 @@ def fill_hydro(FortranFile f,
             offset = offsets[icpu, ilevel]
             if offset == -1:
                 continue
-            f.seek(offset + skip_len(first_field_index, nc), SEEK_SET)
-
-            # We have already skipped the first fields (if any)
-            # so we "rewind" (this will cancel the first seek)
-            jump_len = -first_field_index
-            for i in range(twotondim):
-                # Read the selected fields
-                for j in range(nfields_selected):
-                    jump_len += jumps[j]
-                    if jump_len > 0:
-                        f.seek(skip_len(jump_len, nc), SEEK_CUR)
-                        jump_len = 0
-                    f.read_vector_inplace('d', <void*> &buffer[0, i, j])
-
-                jump_len += jumps[nfields_selected]
+            if f._closed:
+                raise ValueError("I/O operation on closed file.")
+
+            # The records are read without the GIL, so that several domains
+            # can be read concurrently
+            with nogil:
+                cfile = f.cfile
+                fseek(cfile, offset + skip_len(first_field_index, nc), SEEK_SET)
+
+                # We have already skipped the first fields (if any)
+                # so we "rewind" (this will cancel the first seek)
+                jump_len = -first_field_index
+                for i in range(twotondim):
+                    # Read the selected fields
+                    for j in range(nfields_selected):
+                        jump_len += jumps[j]
+                        if jump_len > 0:
+                            fseek(cfile, skip_len(jump_len, nc), SEEK_CUR)
+                            jump_len = 0
+                        status = read_record_inplace(
+                            cfile, nc * DOUBLE_SIZE, <void*> &buffer[0, i, j]
+                        )
+                        if status != 0:
+                            break
+                    if status != 0:
+                        break
+
+                    jump_len += jumps[nfields_selected]
+            if status != 0:
+                raise IOError(
+                    "Could not read the records of %s cells at level %s of cpu %s"
+                    % (nc, ilevel, icpu + 1)
+                )
 
             # In principle, we may be left with some fields to skip
             # but since we're doing an absolute seek at the beginning of
@@ -2,7 +2,11 @@ import numpy as np
 from numpy.testing import assert_equal
 
 import yt
-from yt.frontends.ramses.hilbert import get_cpu_list_cuboid, hilbert3d
+from yt.frontends.ramses.hilbert import (
+    get_cpu_list_cuboid,
+    get_cpu_list_points,
+    hilbert3d,
+)
 from yt.testing import requires_file
 
 
@@ -24,6 +28,20 @@ def test_hilbert3d():
         assert_equal(hilbert3d(i, 3).item(), o)
 
 
+def test_get_cpu_list_points():
+    # 8 CPUs, each owning one of the octants of the domain
+    class FakeDataset:
+        parameters = {"ncpu": 8, "levelmax": 4}
+        hilbert_indices = {
+            icpu + 1: (icpu * 2.0**12, (icpu + 1) * 2.0**12) for icpu in range(8)
+        }
+
+    rng = np.random.default_rng(0x4D3D3D3)
+    X = rng.random((100, 3))
+    cpus = get_cpu_list_points(FakeDataset(), X)
+    assert_equal(cpus, hilbert3d((X * 2).astype("int64"), 1))
+
+
 output_00080 = "output_00080/info_00080.txt"
 
 
@@ -53,3 +71,14 @@ def test_get_cpu_list():
         ls = list(get_cpu_list_cuboid(ds, bbox, bound_keys=bound_keys))
         assert len(ls) > 0
         assert all(np.array(o) == np.array(ls))
+
+
+@requires_file(output_00080)
+def test_get_cpu_list_points_cuboid():
+    ds = yt.load(output_00080)
+
+    rng = np.random.default_rng(16091992)
+    X = rng.random((50, 3))
+    cpus = get_cpu_list_points(ds, X)
+    for x, cpu in zip(X, cpus, strict=True):
+        assert cpu in get_cpu_list_cuboid(ds, np.array([x, x + 1e-6]))
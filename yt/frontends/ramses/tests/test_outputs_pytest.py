@@ -1,5 +1,8 @@
+import os
+import shutil
 from copy import deepcopy
 
+import numpy as np
 import pytest
 
 import yt
@@ -80,3 +83,84 @@ def test_warning_T2():
 
     # But this one should not
     ds2.r["gas", "temperature"]
+
+
+@requires_file(output_00080)
+def test_file_handle_pool():
+    old_value = ytcfg.get("yt", "max_open_files")
+    try:
+        ytcfg["yt", "max_open_files"] = 0
+        ref = yt.load(output_00080)
+        ref_density = ref.r["gas", "density"]
+        ytcfg["yt", "max_open_files"] = 4
+        ds = yt.load(output_00080)
+    finally:
+        ytcfg["yt", "max_open_files"] = old_value
+
+    assert len(ref._file_pool) == 0
+    for _ in range(2):
+        np.testing.assert_equal(ds.r["gas", "density"], ref_density)
+        np.testing.assert_equal(
+            ds.r["io", "particle_mass"], ref.r["io", "particle_mass"]
+        )
+    assert len(ds._file_pool) == 4
+    ds.close()
+    assert len(ds._file_pool) == 0
+
+
+@requires_file(output_00080)
+def test_threaded_domain_reads():
+    fields = [("gas", "density"), ("gravity", "x-acceleration")]
+
+    def read_fields():
+        ds = yt.load(output_00080)
+        dobjs = [ds.all_data(), ds.sphere("c", (0.2, "unitary"))]
+        return [dobj[f] for dobj in dobjs for f in fields]
+
+    ref = read_fields()
+    old_value = ytcfg.get("yt", "io_threads")
+    try:
+        ytcfg["yt", "io_threads"] = 4
+        values = read_fields()
+    finally:
+        ytcfg["yt", "io_threads"] = old_value
+
+    for v, v_ref in zip(values, ref, strict=True):
+        np.testing.assert_equal(v, v_ref)
+
+
+@requires_file(output_00080)
+def test_octree_cache(tmp_path, monkeypatch):
+    import yt.frontends.ramses.data_structures as ramses_ds
+
+    if os.path.exists(output_00080):
+        src = os.path.dirname(output_00080)
+    else:
+        src = os.path.join(
+            ytcfg.get("yt", "test_data_dir"), os.path.dirname(output_00080)
+        )
+    fn = os.path.join(
+        shutil.copytree(src, tmp_path / "output_00080"),
+        os.path.basename(output_00080),
+    )
+
+    ref = yt.load(fn)
+    ref_density = ref.r["gas", "density"]
+    old_value = ytcfg.get("yt", "octree_cache")
+    try:
+        ytcfg["yt", "octree_cache"] = True
+        ds = yt.load(fn)
+        np.testing.assert_equal(ds.r["gas", "density"], ref_density)
+        for dom in ds.index.domains:
+            assert os.path.isfile(dom._octree_filename)
+
+        # the octrees are built without parsing the AMR files again
+        def fail(*args, **kwargs):
+            raise RuntimeError("the AMR file was parsed again")
+
+        monkeypatch.setattr(ramses_ds, "read_amr_positions", fail)
+        ds = yt.load(fn)
+        np.testing.assert_equal(ds.r["gas", "density"], ref_density)
+        assert ds.index.max_level == ref.index.max_level
+    finally:
+        ytcfg["yt", "octree_cache"] = old_value
@@ -6,7 +6,12 @@ Generic file-handing functions for SPH data
 
 """
 
+import numpy as np
+
+from yt.config import ytcfg
+from yt.utilities.file_handler import MappedFilePool
 from yt.utilities.io_handler import BaseParticleIOHandler
+from yt.utilities.on_demand_imports import _h5py as h5py
 
 
 class IOHandlerSPH(BaseParticleIOHandler):
@@ -19,4 +24,66 @@ class IOHandlerSPH(BaseParticleIOHandler):
     At present this is non-functional.
     """
 
-    pass
+    # Selected particles are read as a set of runs of contiguous rows when
+    # there are at most this many runs, covering at most this fraction of the
+    # rows. Runs separated by fewer rows than _sparse_read_gap are merged.
+    _sparse_read_max_runs = 256
+    _sparse_read_max_fraction = 0.25
+    _sparse_read_gap = 64
+
+    def __init__(self, ds, *args, **kwargs):
+        super().__init__(ds, *args, **kwargs)
+        self._memory_map = ytcfg.get("yt", "memory_map_particle_files")
+        self._mapped_files = MappedFilePool(ytcfg.get("yt", "max_open_files"))
+
+    def _map_records(self, filename, dtype, count, offset, shape=()):
+        # A view of *count* records of *dtype* (each of the given shape)
+        # stored at *offset* in the memory map of *filename*.
+        return self._mapped_files.view(filename, dtype, (count,) + shape, offset)
+
+    def _read_selected_rows(self, dset, si, ei, mask, column=None):
+        """
+        Read the rows of the HDF5 dataset *dset* between *si* and *ei*
+        selected by *mask*, optionally only in *column*.
+
+        If the selected rows are sparse enough, only the runs of contiguous
+        rows holding them are read, as a union of hyperslabs. Otherwise the
+        whole range is read and then masked.
+        """
+        if isinstance(mask, slice):
+            data = dset[si:ei] if column is None else dset[si:ei, column]
+            return data[mask, ...]
+        si = si or 0
+        ind = np.flatnonzero(mask)
+        breaks = np.flatnonzero(np.diff(ind) > self._sparse_read_gap)
+        starts = ind[np.r_[0, breaks + 1]] if ind.size else ind
+        stops = ind[np.r_[breaks, ind.size - 1]] + 1 if ind.size else ind
+        nread = int((stops - starts).sum())
+        if (
+            starts.size > self._sparse_read_max_runs
+            or nread > self._sparse_read_max_fraction * mask.size
+        ):
+            data = dset[si:ei] if column is None else dset[si:ei, column]
+            return data[mask, ...]
+
+        if column is None:
+            shape = count = dset.shape[1:]
+            offset = (0,) * len(shape)
+        else:
+            shape, count = (), (1,)
+            offset = (column,)
+        data = np.empty((nread,) + shape, dtype=dset.dtype)
+        if nread == 0:
+            return data
+        fspace = dset.id.get_space()
+        fspace.select_none()
+        for start, stop in zip(starts, stops, strict=True):
+            fspace.select_hyperslab(
+                (si + start,) + offset, (stop - start,) + count, op=h5py.h5s.SELECT_OR
+            )
+        mspace = h5py.h5s.create_simple(data.shape)
+        dset.id.read(mspace, fspace, data)
+        keep = np.concatenate(
+            [mask[start:stop] for start, stop in zip(starts, stops, strict=True)]
+        )
+        return data[keep, ...]
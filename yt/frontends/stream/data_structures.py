@@ -42,6 +42,8 @@ from yt.utilities.lib.particle_kdtree_tools import (
 )
 from yt.utilities.logger import ytLogger as mylog
 
+# importing the IO handlers registers them
+from . import io  # noqa: F401
 from .definitions import process_data, set_particle_types
 from .fields import StreamFieldInfo
 
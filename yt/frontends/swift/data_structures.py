@@ -1,21 +1,279 @@
+import collections
+import os
+
 import numpy as np
 
 from yt.data_objects.static_output import ParticleFile
 from yt.frontends.sph.data_structures import SPHDataset, SPHParticleIndex
 from yt.funcs import only_on_root
+from yt.geometry.particle_geometry_handler import ParticleIndexInfo
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 
 from .fields import SwiftFieldInfo
 
 
+def _ranges_max(dset, starts, counts, block_size=2**24):
+    # The maximum of an HDF5 dataset over the disjoint ranges of rows
+    # [starts, starts + counts), read by blocks of rows.
+    vmax = np.zeros(starts.size, dtype="float64")
+    order = np.flatnonzero(counts > 0)
+    order = order[np.argsort(starts[order])]
+    lo = starts[order]
+    hi = lo + counts[order]
+    for i in range(0, dset.shape[0], block_size):
+        block = dset[i : i + block_size]
+        sel = (lo < i + block.size) & (hi > i)
+        if not sel.any():
+            continue
+        # the maxima over [lo, hi) are the even elements of the reduction over
+        # the interleaved bounds, the block being extended by one value so
+        # that its end is a valid index
+        bounds = np.stack([lo[sel] - i, hi[sel] - i], axis=1).clip(0, block.size)
+        values = np.maximum.reduceat(np.append(block, 0), bounds.ravel())[::2]
+        vmax[order[sel]] = np.maximum(vmax[order[sel]], values)
+    return vmax
+
+
 class SwiftParticleFile(ParticleFile):
     pass
 
 
+class SwiftParticleIndex(SPHParticleIndex):
+    """
+    Particle index built from the /Cells group of SWIFT snapshots.
+
+    SWIFT writes the particles of each top-level cell contiguously and stores
+    the centre of every cell, along with the number of particles of each type
+    it holds and their offset in the file. When this metadata is available,
+    selecting the particles of a data object only needs the cells it
+    intersects, and no bitmap index is built from the particle coordinates.
+    """
+
+    # The boxes holding the particles of each cell are written by SWIFT since
+    # version 0.9 (MinPositions and MaxPositions). Without them, cells are
+    # padded by half their width, as particles may have drifted out of their
+    # cell since the tree was last rebuilt. SWIFT rebuilds it before any
+    # particle moves by more than a tenth of the width of its cell
+    # (space_maxreldx), and the top-level cells are the widest ones. The boxes
+    # of SPH particle types are further padded by the support radius of the
+    # largest kernel of each cell.
+    _cell_padding = 0.5
+
+    # The ratio of the kernel support radius to the smoothing length of the
+    # kernels of SWIFT (in 3D), and the largest one for unknown kernels.
+    _kernel_gammas = {
+        "Cubic spline (M4)": 1.825742,
+        "Quartic spline (M5)": 2.018932,
+        "Quintic spline (M6)": 2.195775,
+        "Wendland C2": 1.936492,
+        "Wendland C4": 2.207940,
+        "Wendland C6": 2.449490,
+    }
+
+    def _initialize_index(self):
+        self._cells = self._read_cell_metadata()
+        self._cell_selection = (None, None)
+        if self._cells is None:
+            super()._initialize_index()
+            return
+        mylog.debug("Using the cell metadata of %s as index", self.ds)
+        self.ds._file_hash = self._generate_hash()
+        self.pii = ParticleIndexInfo(1, 1, None, False)
+        self.regions = None
+        self.ptype_regions = {}
+        self.ds.index_order = (1, 1)
+
+    def _read_cell_metadata(self):
+        with h5py.File(self.ds.parameter_filename, mode="r") as f:
+            if "Cells" not in f:
+                return None
+            cells = f["Cells"]
+            # the offsets were renamed from "Offsets" to "OffsetsInFile" when
+            # distributed snapshots were introduced
+            offsets = cells.get("OffsetsInFile", cells.get("Offsets"))
+            if offsets is None or "Centres" not in cells or "Counts" not in cells:
+                return None
+            if "Files" in cells and np.unique(cells["Files"][()]).size > 1:
+                # the cells of distributed snapshots are spread over several
+                # files, and their offsets are relative to each of them
+                mylog.debug("The cells of %s span several files", self.ds)
+                return None
+            centres = cells["Centres"][()].astype("float64")
+            width = cells["Meta-data"].attrs["size"].astype("float64")
+            counts = {ptype: cells["Counts"][ptype][()] for ptype in offsets}
+            offsets = {ptype: offsets[ptype][()] for ptype in offsets}
+            positions = {}
+            if "MinPositions" in cells and "MaxPositions" in cells:
+                for ptype in offsets:
+                    if ptype in cells["MinPositions"]:
+                        positions[ptype] = (
+                            cells["MinPositions"][ptype][()].astype("float64"),
+                            cells["MaxPositions"][ptype][()].astype("float64"),
+                        )
+            hydro = f["HydroScheme"].attrs if "HydroScheme" in f else {}
+            kernel = hydro.get("Kernel function", b"")
+            if isinstance(kernel, bytes):
+                kernel = kernel.decode("utf-8")
+            gamma = self._kernel_gammas.get(
+                kernel, max(self._kernel_gammas.values())
+            )
+        return {
+            "left_edge": centres - width / 2,
+            "right_edge": centres + width / 2,
+            "width": width,
+            "positions": positions,
+            "gamma": gamma,
+            "counts": {k: v.astype("int64") for k, v in counts.items()},
+            "offsets": {k: v.astype("int64") for k, v in offsets.items()},
+            # the boxes holding the particles of each type, as they are needed
+            "extents": {},
+        }
+
+    def _cell_extents(self, ptype):
+        # Return the boxes holding the particles of type *ptype* (and their
+        # kernels) of each cell.
+        cells = self._cells
+        if ptype not in cells["extents"]:
+            if ptype in cells["positions"]:
+                left_edge, right_edge = cells["positions"][ptype]
+            else:
+                pad = self._cell_padding * cells["width"]
+                left_edge = cells["left_edge"] - pad
+                right_edge = cells["right_edge"] + pad
+            if ptype in self.ds._sph_ptypes:
+                support = cells["gamma"] * self._cell_max_smoothing_lengths(ptype)
+                left_edge = left_edge - support[:, None]
+                right_edge = right_edge + support[:, None]
+            cells["extents"][ptype] = (left_edge, right_edge)
+        return cells["extents"][ptype]
+
+    def _cell_max_smoothing_lengths(self, ptype):
+        # The largest smoothing length of the particles of each cell, which
+        # takes reading all of them. As for the bounding box of the bitmap
+        # index, they are stored next to the dataset, under the hash of the
+        # data files.
+        ds = self.ds
+        fname = getattr(ds, "index_filename", None) or f"{ds.parameter_filename}.ewah"
+        key = f"max_smoothing_lengths/{ds._file_hash}/{ptype}"
+        if ds._file_hash != -1 and os.path.isfile(fname):
+            try:
+                with h5py.File(fname, mode="r") as f:
+                    if key in f:
+                        return f[key][()]
+            except OSError:
+                pass
+
+        mylog.info("Reading the smoothing lengths of %s to pad its cells", ptype)
+        with h5py.File(ds.parameter_filename, mode="r") as f:
+            hsml = _ranges_max(
+                self.io._smoothing_length_dataset(f[ptype]),
+                self._cells["offsets"][ptype],
+                self._cells["counts"][ptype],
+            )
+
+        if ds._file_hash != -1 and self.comm.rank == 0:
+            try:
+                with h5py.File(fname, mode="a") as f:
+                    if key in f:
+                        del f[key]
+                    f[key] = hsml
+            except OSError:
+                # the directory of the dataset may not be writable
+                pass
+        return hsml
+
+    def _selected_cell_ranges(self, selector, ptype):
+        # Return the first and last (excluded) rows of the particles of type
+        # *ptype* in the cells touched by the selector.
+        if self._cell_selection[0] is not selector:
+            self._cell_selection = (selector, {})
+        ranges = self._cell_selection[1]
+        if ptype not in ranges:
+            counts = self._cells["counts"][ptype]
+            mask = self._select_cells(selector, *self._cell_extents(ptype))
+            mask &= counts > 0
+            starts = self._cells["offsets"][ptype][mask]
+            ranges[ptype] = (starts, starts + counts[mask])
+        return ranges[ptype]
+
+    def _select_cells(self, selector, left_edge, right_edge):
+        # Selectors expect boxes within the domain, so padded cells crossing a
+        # periodic boundary are also tested through their periodic images.
+        ds = self.ds
+        DLE = ds.domain_left_edge.d
+        DRE = ds.domain_right_edge.d
+        DW = DRE - DLE
+        cell_ids = np.arange(left_edge.shape[0])
+        for ax in range(3):
+            if not ds.periodicity[ax]:
+                continue
+            images = [(left_edge, right_edge, cell_ids)]
+            for crossing, shift in (
+                (left_edge[:, ax] < DLE[ax], DW[ax]),
+                (right_edge[:, ax] > DRE[ax], -DW[ax]),
+            ):
+                LE = left_edge[crossing]
+                RE = right_edge[crossing]
+                LE[:, ax] += shift
+                RE[:, ax] += shift
+                images.append((LE, RE, cell_ids[crossing]))
+            left_edge, right_edge, cell_ids = (
+                np.concatenate(arrs) for arrs in zip(*images, strict=True)
+            )
+        levels = np.zeros((left_edge.shape[0], 1), dtype="int32")
+        selected = selector.select_grids(left_edge, right_edge, levels)
+        mask = np.zeros(self._cells["left_edge"].shape[0], dtype="bool")
+        mask[cell_ids[selected]] = True
+        return mask
+
+    def _identify_data_files(self, selector):
+        if self._cells is None:
+            return super()._identify_data_files(selector)
+        file_ptypes = collections.defaultdict(set)
+        for ptype, counts in self._cells["counts"].items():
+            if ptype in self.ds._sph_ptypes and ptype not in self._cells["extents"]:
+                # the cells of SPH particle types are only padded when their
+                # particles are read, until then all of them may be selected
+                starts = self._cells["offsets"][ptype][counts > 0]
+                stops = starts + counts[counts > 0]
+            else:
+                starts, stops = self._selected_cell_ranges(selector, ptype)
+            for i, data_file in enumerate(self.data_files):
+                si, ei = self._data_file_rows(data_file, ptype)
+                if np.any((starts < ei) & (stops > si)):
+                    file_ptypes[i].add(ptype)
+        dfi = np.array(sorted(file_ptypes), dtype="int64")
+        return dfi, file_ptypes
+
+    def _data_file_rows(self, data_file, ptype):
+        si = data_file.start or 0
+        ei = si + data_file.total_particles[ptype]
+        return si, ei
+
+    def _selected_rows(self, data_file, ptype, selector):
+        """
+        Return a boolean mask of the rows of *data_file* holding particles of
+        type *ptype* in the cells touched by *selector*, or None if the
+        dataset has no cell metadata.
+        """
+        if self._cells is None or ptype not in self._cells["counts"]:
+            return None
+        starts, stops = self._selected_cell_ranges(selector, ptype)
+        si, ei = self._data_file_rows(data_file, ptype)
+        # mark the boundaries of the cell ranges and integrate them
+        starts = np.clip(starts, si, ei) - si
+        stops = np.clip(stops, si, ei) - si
+        edges = np.zeros(ei - si + 1, dtype="int64")
+        np.add.at(edges, starts, 1)
+        np.add.at(edges, stops, -1)
+        return np.cumsum(edges[:-1]) > 0
+
+
 class SwiftDataset(SPHDataset):
     _load_requirements = ["h5py"]
-    _index_class = SPHParticleIndex
+    _index_class = SwiftParticleIndex
     _field_info_class = SwiftFieldInfo
     _file_class = SwiftParticleFile
 
@@ -201,9 +459,8 @@ class SwiftDataset(SPHDataset):
         valid = True
         # Attempt to open the file, if it's not a hdf5 then this will fail:
         try:
-            handle = h5py.File(filename, mode="r")
-            valid = handle["Header"].attrs["Code"].decode("utf-8") == "SWIFT"
-            handle.close()
+            with get_file_signature(filename).open_hdf5() as handle:
+                valid = handle["Header"].attrs["Code"].decode("utf-8") == "SWIFT"
         except (OSError, KeyError):
             valid = False
 
@@ -65,17 +65,18 @@ class IOHandlerSwift(IOHandlerSPH):
         with h5py.File(sub_file.filename, mode="r") as f:
             pcount = f["/Header"].attrs["NumPart_ThisFile"][ind].astype("int64")
             pcount = np.clip(pcount - si, 0, ei - si)
-            keys = f[ptype].keys()
-            # SWIFT commit a94cc81 changed from "SmoothingLength" to "SmoothingLengths"
-            # between SWIFT versions 0.8.2 and 0.8.3
-            if "SmoothingLengths" in keys:
-                hsml = f[ptype]["SmoothingLengths"][si:ei, ...]
-            else:
-                hsml = f[ptype]["SmoothingLength"][si:ei, ...]
+            hsml = self._smoothing_length_dataset(f[ptype])[si:ei, ...]
             # we upscale to float64
             hsml = hsml.astype("float64", copy=False)
             return hsml
 
+    def _smoothing_length_dataset(self, g):
+        # SWIFT commit a94cc81 changed from "SmoothingLength" to "SmoothingLengths"
+        # between SWIFT versions 0.8.2 and 0.8.3
+        if "SmoothingLengths" in g:
+            return g["SmoothingLengths"]
+        return g["SmoothingLength"]
+
     def _read_particle_data_file(self, sub_file, ptf, selector=None):
         # note: this frontend uses the variable name and terminology sub_file.
         # other frontends use data_file with the understanding that it may
@@ -89,28 +90,49 @@ class IOHandlerSwift(IOHandlerSPH):
             if sub_file.total_particles[ptype] == 0:
                 continue
             g = f[f"/{ptype}"]
-            # this should load as float64
-            coords = g["Coordinates"][si:ei]
-            if ptype == "PartType0":
-                hsmls = self._get_smoothing_length(sub_file)
+            # only the particles in the cells touched by the selector are
+            # read, if the index knows about them
+            rows = None
+            if selector:
+                rows = self.ds.index._selected_rows(sub_file, ptype, selector)
+            if rows is not None:
+                if not rows.any():
+                    continue
+                coords = self._read_selected_rows(g["Coordinates"], si, ei, rows)
+                if ptype == "PartType0":
+                    hsmls = self._read_selected_rows(
+                        self._smoothing_length_dataset(g), si, ei, rows
+                    ).astype("float64", copy=False)
+                else:
+                    hsmls = 0.0
             else:
-                hsmls = 0.0
+                # this should load as float64
+                coords = g["Coordinates"][si:ei]
+                if ptype == "PartType0":
+                    hsmls = self._get_smoothing_length(sub_file)
+                else:
+                    hsmls = 0.0
 
             if selector:
                 mask = selector.select_points(
                     coords[:, 0], coords[:, 1], coords[:, 2], hsmls
                 )
+                if mask is not None and rows is not None:
+                    rows[rows] = mask
+                    mask = rows
             del coords
             if selector and mask is None:
                 continue
             for field in field_list:
                 if field in ("Mass", "Masses"):
-                    data = g[self.ds._particle_mass_name][si:ei]
+                    dset = g[self.ds._particle_mass_name]
                 else:
-                    data = g[field][si:ei]
+                    dset = g[field]
 
                 if selector:
-                    data = data[mask, ...]
+                    data = self._read_selected_rows(dset, si, ei, mask)
+                else:
+                    data = dset[si:ei]
 
                 data.astype("float64", copy=False)
 
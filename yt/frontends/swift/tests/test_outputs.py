@@ -1,5 +1,9 @@
+import os
+import tempfile
+from unittest import mock
+
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_equal
 
 from yt import load
 from yt.frontends.swift.api import SwiftDataset
@@ -111,3 +115,180 @@ def test_cosmo_dataset_selection():
     ds = load(EAGLE_6)
     psc = ParticleSelectionComparison(ds)
     psc.run_defaults()
+
+
+def _fake_swift_snapshot(
+    fn,
+    cdim=4,
+    npart=(2048, 1024),
+    with_cells=True,
+    with_positions=False,
+    hsml=0.4,
+    nfiles=1,
+):
+    # Write a SWIFT snapshot with the particles sorted by top-level cell and,
+    # optionally, the cell metadata written by SWIFT (with the boxes holding
+    # the particles of each cell if *with_positions*), as if the cells were
+    # spread over *nfiles* files. Smoothing lengths are at most *hsml* cell
+    # widths.
+    prng = np.random.RandomState(0x4D3D3D3)
+    width = 1.0 / cdim
+    with h5py.File(fn, mode="w") as f:
+        header = f.create_group("Header")
+        header.attrs["Code"] = np.bytes_("SWIFT")
+        header.attrs["BoxSize"] = np.ones(3)
+        header.attrs["Dimension"] = 3
+        header.attrs["Time"] = 0.0
+        header.attrs["NumPart_ThisFile"] = np.array(npart, dtype="int64")
+        units = f.create_group("Units")
+        units.attrs["Unit length in cgs (U_L)"] = 3.0857e24
+        units.attrs["Unit mass in cgs (U_M)"] = 1.989e43
+        units.attrs["Unit time in cgs (U_t)"] = 3.0857e19
+        units.attrs["Unit temperature in cgs (U_T)"] = 1.0
+        f.create_group("Policy").attrs["cosmological integration"] = 0
+        f.create_group("Parameters").attrs["InitialConditions:periodic"] = 1
+        f.create_group("HydroScheme").attrs["Kernel function"] = np.bytes_(
+            "Cubic spline (M4)"
+        )
+        f.create_group("SubgridScheme")
+
+        centres = (np.indices((cdim,) * 3).reshape(3, -1).T + 0.5) * width
+        counts = {}
+        offsets = {}
+        min_positions = {}
+        max_positions = {}
+        for i, n in enumerate(npart):
+            ptype = f"PartType{i}"
+            pos = prng.random_sample((n, 3))
+            cell = np.ravel_multi_index(
+                tuple((pos / width).astype("int64").T), (cdim,) * 3
+            )
+            order = np.argsort(cell, kind="stable")
+            pos, cell = pos[order], cell[order]
+            # particles drift out of their cell between tree rebuilds
+            pos = (pos + prng.uniform(-0.3, 0.3, pos.shape) * width) % 1.0
+            counts[ptype] = np.bincount(cell, minlength=cdim**3)
+            offsets[ptype] = np.cumsum(counts[ptype]) - counts[ptype]
+            min_positions[ptype] = centres.copy()
+            max_positions[ptype] = centres.copy()
+            for c in np.unique(cell):
+                min_positions[ptype][c] = pos[cell == c].min(axis=0)
+                max_positions[ptype][c] = pos[cell == c].max(axis=0)
+            g = f.create_group(ptype)
+            g.create_dataset("Coordinates", data=pos)
+            g.create_dataset("Masses", data=np.full(n, 1.0 / n))
+            g.create_dataset("Velocities", data=np.zeros((n, 3)))
+            g.create_dataset("ParticleIDs", data=np.arange(n, dtype="int64"))
+            if i == 0:
+                h = hsml * width * prng.uniform(0.5, 1.0, n)
+                g.create_dataset("SmoothingLengths", data=h)
+                g.create_dataset("Densities", data=np.ones(n))
+
+        if with_cells:
+            cells = f.create_group("Cells")
+            cells.create_group("Meta-data").attrs["size"] = np.full(3, width)
+            cells.create_dataset("Centres", data=centres)
+            cells.create_dataset("Files", data=np.arange(cdim**3) % nfiles)
+            groups = [("Counts", counts), ("OffsetsInFile", offsets)]
+            if with_positions:
+                groups += [("MinPositions", min_positions)]
+                groups += [("MaxPositions", max_positions)]
+            for name, values in groups:
+                g = cells.create_group(name)
+                for ptype, v in values.items():
+                    g.create_dataset(ptype, data=v)
+
+
+@requires_module("h5py")
+def test_cell_index():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _check_cell_index(tmpdir)
+
+
+@requires_module("h5py")
+def test_cell_index_large_kernels():
+    # kernels wider than the cells
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _check_cell_index(tmpdir, cdim=8, hsml=2.0)
+
+
+@requires_module("h5py")
+def test_cell_index_distributed():
+    # the offsets of the cells of distributed snapshots are relative to each
+    # file, so the bitmap index is used instead
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _fake_swift_snapshot(os.path.join(tmpdir, "cells.hdf5"), nfiles=2)
+        ds = load(os.path.join(tmpdir, "cells.hdf5"))
+        assert ds.index._cells is None
+        assert ds.index.regions is not None
+
+
+@requires_module("h5py")
+def test_cell_index_positions():
+    # the boxes holding the particles of each cell are used when available
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _check_cell_index(tmpdir, cdim=8, hsml=2.0, with_positions=True)
+
+
+@requires_module("h5py")
+def test_ranges_max():
+    from yt.frontends.swift.data_structures import _ranges_max
+
+    prng = np.random.RandomState(0x4D3D3D3)
+    values = prng.random_sample(1000)
+    counts = prng.randint(0, 20, 100)
+    starts = np.cumsum(counts) - counts
+    order = prng.permutation(100)
+    vmax = _ranges_max(values, starts[order], counts[order], block_size=64)
+    for i, (start, count) in enumerate(zip(starts[order], counts[order])):
+        expected = values[start : start + count].max() if count > 0 else 0.0
+        assert vmax[i] == expected
+
+
+def _check_cell_index(tmpdir, cdim=4, hsml=0.4, with_positions=False):
+    _fake_swift_snapshot(
+        os.path.join(tmpdir, "cells.hdf5"),
+        cdim=cdim,
+        hsml=hsml,
+        with_positions=with_positions,
+    )
+    _fake_swift_snapshot(
+        os.path.join(tmpdir, "no_cells.hdf5"), cdim=cdim, with_cells=False, hsml=hsml
+    )
+    ds = load(os.path.join(tmpdir, "cells.hdf5"))
+    ref = load(os.path.join(tmpdir, "no_cells.hdf5"))
+    assert ds.index._cells is not None
+    assert ref.index._cells is None
+    assert not os.path.exists(os.path.join(tmpdir, "cells.hdf5.ewah"))
+
+    # the smoothing lengths are only read to select SPH particles
+    ds.sphere((0.3, 0.6, 0.5), 0.15)["PartType1", "ParticleIDs"]
+    assert "PartType0" not in ds.index._cells["extents"]
+
+    for center, radius in [((0.3, 0.6, 0.5), 0.15), ((0.05, 0.95, 0.5), 0.2)]:
+        sp1 = ds.sphere(center, radius)
+        sp2 = ref.sphere(center, radius)
+        for ptype in ("PartType0", "PartType1"):
+            ids1 = np.sort(sp1[ptype, "ParticleIDs"])
+            ids2 = np.sort(sp2[ptype, "ParticleIDs"])
+            assert ids1.size > 0
+            assert_equal(ids1, ids2)
+        # only the particles of the cells around the sphere are read
+        rows = ds.index._selected_rows(
+            ds.index.data_files[0], "PartType1", sp1.selector
+        )
+        assert 0 < rows.sum() < rows.size
+
+    psc = ParticleSelectionComparison(ds)
+    psc.run_defaults()
+
+    # and are then stored next to the dataset, as no bitmap index is built
+    ds2 = load(os.path.join(tmpdir, "cells.hdf5"))
+    with mock.patch("yt.frontends.swift.data_structures._ranges_max") as scan:
+        assert_equal(
+            ds2.index._cell_max_smoothing_lengths("PartType0"),
+            ds.index._cell_max_smoothing_lengths("PartType0"),
+        )
+    scan.assert_not_called()
+    with h5py.File(os.path.join(tmpdir, "cells.hdf5.ewah"), mode="r") as f:
+        assert list(f) == ["max_smoothing_lengths"]
@@ -92,15 +92,15 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
         for data_file in self._sorted_chunk_iterator(chunks):
             poff = data_file.field_offsets
             tp = data_file.total_particles
-            f = open(data_file.filename, "rb")
+            f = self._open_data_file(data_file)
             for ptype in sorted(ptf, key=lambda a, poff=poff: poff.get(a, -1)):
                 if data_file.total_particles[ptype] == 0:
                     continue
-                f.seek(poff[ptype])
                 total = 0
                 while total < tp[ptype]:
                     count = min(chunksize, tp[ptype] - total)
-                    p = np.fromfile(f, self._pdtypes[ptype], count=count)
+                    offset = poff[ptype] + total * self._pdtypes[ptype].itemsize
+                    p = self._read_records(f, data_file, ptype, count, offset)
                     total += p.size
                     d = [p["Coordinates"][ax].astype("float64") for ax in "xyz"]
                     del p
@@ -109,6 +109,24 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
                     else:
                         hsml = 0.0
                     yield ptype, d, hsml
+            if f is not None:
+                f.close()
+
+    def _open_data_file(self, data_file):
+        # the file is only read through its memory map if enabled
+        if self._memory_map:
+            return None
+        return open(data_file.filename, "rb")
+
+    def _read_records(self, f, data_file, ptype, count, offset):
+        # Read *count* particle records of *ptype* at *offset*, from the open
+        # file *f* or as a view of the memory-mapped file.
+        if f is None:
+            return self._map_records(
+                data_file.filename, self._pdtypes[ptype], count, offset
+            )
+        f.seek(offset)
+        return np.fromfile(f, self._pdtypes[ptype], count=count)
 
     @property
     def hsml_filename(self):
@@ -150,14 +168,12 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
         return self._read_smoothing_length(data_file, shape[0])
 
     def _read_particle_data_file(self, data_file, ptf, selector=None):
-        from numpy.lib.recfunctions import append_fields
-
         return_data = {}
 
         poff = data_file.field_offsets
         aux_fields_offsets = self._calculate_particle_offsets_aux(data_file)
         tp = data_file.total_particles
-        f = open(data_file.filename, "rb")
+        f = self._open_data_file(data_file)
 
         # we need to open all aux files for chunking to work
         _aux_fh = {}
@@ -170,14 +186,23 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
         for ptype, field_list in sorted(ptf.items(), key=lambda a: poff.get(a[0], -1)):
             if data_file.total_particles[ptype] == 0:
                 continue
-            f.seek(poff[ptype])
             afields = list(set(field_list).intersection(self._aux_fields))
             count = min(self.ds.index.chunksize, tp[ptype])
-            p = np.fromfile(f, self._pdtypes[ptype], count=count)
+            p = self._read_records(f, data_file, ptype, count, poff[ptype])
             auxdata = []
             for afield in afields:
-                aux_fh(afield).seek(aux_fields_offsets[afield][ptype])
                 if isinstance(self._aux_pdtypes[afield], np.dtype):
+                    if f is None:
+                        auxdata.append(
+                            self._map_records(
+                                f"{data_file.filename}.{afield}",
+                                self._aux_pdtypes[afield],
+                                count,
+                                aux_fields_offsets[afield][ptype],
+                            )
+                        )
+                        continue
+                    aux_fh(afield).seek(aux_fields_offsets[afield][ptype])
                     auxdata.append(
                         np.fromfile(
                             aux_fh(afield), self._aux_pdtypes[afield], count=count
@@ -194,7 +219,10 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
                             aux = np.array([aux])
                         auxdata.append(aux)
             if afields:
-                p = append_fields(p, afields, auxdata)
+                # the auxiliary fields are looked up next to the fields of the
+                # records, without copying the records into a new array
+                p = {name: p[name] for name in p.dtype.names}
+                p.update(zip(afields, auxdata, strict=True))
             if ptype == "Gas":
                 hsml = self._read_smoothing_length(data_file, count)
             else:
@@ -214,7 +242,8 @@ class IOHandlerTipsyBinary(IOHandlerSPH):
                 return_data[ptype, field] = tf.pop(field)
 
         # close all file handles
-        f.close()
+        if f is not None:
+            f.close()
         for fh in _aux_fh.values():
             fh.close()
 
@@ -0,0 +1,60 @@
+import struct
+
+import numpy as np
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.frontends.tipsy.io import IOHandlerTipsyBinary
+from yt.loaders import load
+
+
+def _fake_tipsy(fn, npart=(300, 500, 200), endian=">"):
+    # Write a tipsy snapshot of gas, dark matter and star particles in a unit
+    # box, along with a binary auxiliary field.
+    prng = np.random.RandomState(0x4D3D3D3)
+    pdtypes = IOHandlerTipsyBinary._compute_dtypes({}, endian)
+    with open(fn, "wb") as f:
+        f.write(struct.pack(f"{endian}diiiiii", 1.0, sum(npart), 3, *npart, 0))
+        for ptype, n in zip(("Gas", "DarkMatter", "Stars"), npart, strict=True):
+            p = np.zeros(n, dtype=pdtypes[ptype])
+            for name in pdtypes[ptype].names:
+                if name == "Coordinates":
+                    for ax in "xyz":
+                        p[name][ax] = prng.uniform(-0.5, 0.5, n)
+                elif name != "Velocities":
+                    p[name] = prng.uniform(0.01, 0.02, n)
+            f.write(p.tobytes())
+    with open(f"{fn}.HI", "wb") as f:
+        f.write(np.array(sum(npart), dtype=f"{endian}i4").tobytes())
+        f.write(prng.random_sample(sum(npart)).astype(f"{endian}f4").tobytes())
+
+
+def test_memory_mapped_reads(tmp_path):
+    fn = str(tmp_path / "fake.00001")
+    _fake_tipsy(fn)
+    fields = [
+        ("Gas", "Coordinates"),
+        ("Gas", "Density"),
+        ("Gas", "HI"),
+        ("DarkMatter", "Mass"),
+        ("Stars", "FormationTime"),
+    ]
+    old_value = ytcfg.get("yt", "memory_map_particle_files")
+    values = []
+    try:
+        for memory_map in (False, True):
+            ytcfg["yt", "memory_map_particle_files"] = memory_map
+            ds = load(fn, bounding_box=[[-0.5, 0.5]] * 3)
+            assert ds.index.io._memory_map is memory_map
+            ad = ds.all_data()
+            sp = ds.sphere([0.1, -0.2, 0.0], 0.25)
+            values.append([ad[field] for field in fields])
+            values[-1] += [sp[field] for field in fields]
+    finally:
+        ytcfg["yt", "memory_map_particle_files"] = old_value
+    for v1, v2 in zip(*values, strict=True):
+        assert v1.size > 0
+        assert_equal(v1, v2)
+    # the auxiliary field is read for the right particles
+    raw = np.fromfile(f"{fn}.HI", dtype=">f4", offset=4)
+    assert_equal(values[1][2], raw[:300])
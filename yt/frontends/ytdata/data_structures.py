@@ -26,6 +26,7 @@ from yt.units._numpy_wrapper_functions import uconcatenate
 from yt.units.unit_registry import UnitRegistry  # type: ignore
 from yt.units.yt_array import YTQuantity
 from yt.utilities.exceptions import GenerationInProgress, YTFieldTypeNotFound
+from yt.utilities.file_handler import get_file_signature
 from yt.utilities.logger import ytLogger as mylog
 from yt.utilities.on_demand_imports import _h5py as h5py
 from yt.utilities.parallel_tools.parallel_analysis_interface import parallel_root_only
@@ -197,6 +198,7 @@ class YTDataset(SavedDataset):
 
     def create_field_info(self):
         self.field_dependencies = {}
+        self._field_graph = {}
         self.derived_field_list = []
         self.filtered_particle_types = []
         self.field_info = self._field_info_class(self, self.field_list)
@@ -307,7 +309,7 @@ class YTDataContainerDataset(YTDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             cont_type = parse_h5_attr(f, "container_type")
             if data_type is None:
@@ -360,7 +362,7 @@ class YTDataLightRayDataset(YTDataContainerDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             if data_type in ["yt_light_ray"]:
                 return True
@@ -395,7 +397,7 @@ class YTSpatialPlotDataset(YTDataContainerDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             cont_type = parse_h5_attr(f, "container_type")
             if data_type == "yt_data_container" and cont_type in [
@@ -574,7 +576,7 @@ class YTGridDataset(YTDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             cont_type = parse_h5_attr(f, "container_type")
             if data_type == "yt_frb":
@@ -795,7 +797,7 @@ class YTNonspatialDataset(YTGridDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             if data_type == "yt_array_data":
                 return True
@@ -915,7 +917,7 @@ class YTProfileDataset(YTNonspatialDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             if data_type == "yt_profile":
                 return True
@@ -996,7 +998,7 @@ class YTClumpTreeDataset(YTNonspatialDataset):
         if cls._missing_load_requirements():
             return False
 
-        with h5py.File(filename, mode="r") as f:
+        with get_file_signature(filename).open_hdf5() as f:
             data_type = parse_h5_attr(f, "data_type")
             if data_type is None:
                 return False
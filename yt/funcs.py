@@ -901,13 +901,13 @@ def enable_plugins(plugin_filename=None):
             raise FileNotFoundError("Could not find a global system plugin file.")
 
     mylog.info("Loading plugins from %s", _fn)
-    ytdict = yt.__dict__
-    execdict = ytdict.copy()
+    # the public API of yt is imported lazily, so we get all of it here
+    execdict = {k: getattr(yt, k) for k in yt.__all__}
     execdict["add_field"] = my_plugins_fields.add_field
     with open(_fn) as f:
         code = compile(f.read(), _fn, "exec")
         exec(code, execdict, execdict)
-    ytnamespace = list(ytdict.keys())
+    ytnamespace = dir(yt)
     for k in execdict.keys():
         if k not in ytnamespace:
             if callable(execdict[k]):
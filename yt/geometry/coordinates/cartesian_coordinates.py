@@ -1,6 +1,5 @@
 import numpy as np
 
-from yt.data_objects.index_subobjects.unstructured_mesh import SemiStructuredMesh
 from yt.funcs import mylog
 from yt.units._numpy_wrapper_functions import uconcatenate, uvstack
 from yt.units.yt_array import YTArray
@@ -178,6 +177,10 @@ class CartesianCoordinateHandler(CoordinateHandler):
         two-dimensional image plots. Relies on several sampling
         routines written in cython
         """
+        from yt.data_objects.index_subobjects.unstructured_mesh import (
+            SemiStructuredMesh,
+        )
+
         index = data_source.ds.index
         if hasattr(index, "meshes") and not isinstance(
             index.meshes[0], SemiStructuredMesh
@@ -259,6 +262,10 @@ class CartesianCoordinateHandler(CoordinateHandler):
             raise ValueError(
                 "Must have at least two sample points in order to draw a line plot."
             )
+        from yt.data_objects.index_subobjects.unstructured_mesh import (
+            SemiStructuredMesh,
+        )
+
         index = self.ds.index
         if hasattr(index, "meshes") and not isinstance(
             index.meshes[0], SemiStructuredMesh
@@ -1,6 +1,7 @@
 import abc
 import os
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -66,10 +67,13 @@ class Index(ParallelAnalysisInterface, abc.ABC):
         self._parallel_locking = False
         self._data_file = None
         self._data_mode = None
+        self._field_cache_nodes = {}
         self.num_grids = None
 
     def _initialize_data_storage(self):
-        if not ytcfg.get("yt", "serialize"):
+        if not (
+            ytcfg.get("yt", "serialize") or ytcfg.get("yt", "derived_field_cache")
+        ):
             return
         fn = self.ds.storage_filename
         if fn is None:
@@ -185,6 +189,14 @@ class Index(ParallelAnalysisInterface, abc.ABC):
         except TypeError:
             return self._data_file[full_name]
 
+    def _get_cached_field(self, obj, field):
+        # Persistent caching of derived field values is only implemented by
+        # indexes whose objects have a stable identity, see GridIndex.
+        return None
+
+    def _store_cached_field(self, obj, field, data):
+        pass
+
     def _get_particle_type_counts(self):
         # this is implemented by subclasses
         raise NotImplementedError
@@ -431,36 +443,97 @@ class YTDataChunk:
 
 
 class ChunkDataCache:
-    def __init__(self, base_iter, preload_fields, geometry_handler, max_length=256):
-        # At some point, max_length should instead become a heuristic function,
-        # potentially looking at estimated memory usage.  Note that this never
-        # initializes the iterator; it assumes the iterator is already created,
-        # and it calls next() on it.
-        self.base_iter = base_iter.__iter__()
-        self.queue = []
-        self.max_length = max_length
+    def __init__(self, base_iter, preload_fields, geometry_handler, max_bytes=None):
+        # Grids are batched so that the estimated size of the preloaded fields
+        # for a batch stays within max_bytes (by default, the
+        # "preload_buffer_size" configuration option).  If the
+        # "preload_in_background" option is set, the next batch is read in a
+        # background thread while the caller consumes the current one.
+        if max_bytes is None:
+            max_bytes = ytcfg.get("yt", "preload_buffer_size")
+        self.max_bytes = max_bytes
         self.preload_fields = preload_fields
         self.geometry_handler = geometry_handler
+        self.queue = []
         self.cache = {}
+        self._batches = self._split_batches(base_iter)
+        self._background = ytcfg.get("yt", "preload_in_background")
+        self._executor = None
+        self._next_batch = None
+        self._started = False
 
     def __iter__(self):
         return self
 
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        # Stop reading ahead, e.g. when the iteration is abandoned.
+        self._next_batch = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _estimate_size(self, grid):
+        ds = self.geometry_handler.ds
+        io = self.geometry_handler.io
+        itemsize = io._output_dtype(getattr(io, "_field_dtype", "=f8")).itemsize
+        ncells = np.prod(grid.ActiveDimensions)
+        nbytes = 0
+        for ftype, _ in self.preload_fields:
+            if ftype in ds.particle_types:
+                nbytes += itemsize * getattr(grid, "NumberOfParticles", 0)
+            else:
+                nbytes += itemsize * ncells
+        return nbytes
+
+    def _split_batches(self, base_iter):
+        batch = []
+        batch_size = 0
+        for g in base_iter:
+            size = self._estimate_size(g)
+            if len(batch) > 0 and batch_size + size > self.max_bytes:
+                yield batch
+                batch = []
+                batch_size = 0
+            batch.append(g)
+            batch_size += size
+        if len(batch) > 0:
+            yield batch
+
+    def _read_batch(self, batch):
+        chunk = YTDataChunk(None, "cache", batch, cache=False)
+        return (
+            self.geometry_handler.io._read_chunk_data(chunk, self.preload_fields) or {}
+        )
+
+    def _submit_next_batch(self):
+        batch = next(self._batches, None)
+        if batch is None:
+            self.close()
+        elif not self._background:
+            self._next_batch = (batch, None)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._next_batch = (batch, self._executor.submit(self._read_batch, batch))
+
     def __next__(self):
+        if not self._started:
+            # nothing is read before the iteration starts
+            self._started = True
+            self._submit_next_batch()
         if len(self.queue) == 0:
-            for _ in range(self.max_length):
-                try:
-                    self.queue.append(next(self.base_iter))
-                except StopIteration:
-                    break
-            # If it's still zero ...
-            if len(self.queue) == 0:
+            if self._next_batch is None:
                 raise StopIteration
-            chunk = YTDataChunk(None, "cache", self.queue, cache=False)
-            self.cache = (
-                self.geometry_handler.io._read_chunk_data(chunk, self.preload_fields)
-                or {}
-            )
+            batch, future = self._next_batch
+            if future is None:
+                self.cache = self._read_batch(batch)
+            else:
+                self.cache = future.result()
+            self.queue = batch
+            self._submit_next_batch()
         g = self.queue.pop(0)
         g._initialize_cache(self.cache.pop(g.id, {}))
         return g
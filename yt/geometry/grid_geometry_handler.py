@@ -1,4 +1,6 @@
 import abc
+import hashlib
+import os
 import weakref
 from collections import defaultdict
 
@@ -11,9 +13,15 @@ from yt.fields.field_detector import FieldDetector
 from yt.funcs import ensure_numpy_array, iter_fields
 from yt.geometry.geometry_handler import ChunkDataCache, Index, YTDataChunk
 from yt.utilities.definitions import MAXLEVEL
+from yt.utilities.lib.interpolators import TrilinearlyInterpolate
 from yt.utilities.logger import ytLogger as mylog
 
 from .grid_container import GridTree, MatchPointsToGrids
+from .grid_hierarchy_cache import (
+    LazyGridArray,
+    read_grid_hierarchy,
+    write_grid_hierarchy,
+)
 
 
 class GridIndex(Index, abc.ABC):
@@ -28,19 +36,28 @@ class GridIndex(Index, abc.ABC):
         "grid_particle_count",
         "grid_dimensions",
     )
+    # Frontends that can create a grid from the arrays of the index (see
+    # _create_grid) set this to True. Their grid hierarchy can then be stored
+    # in a sidecar file, from which grids are created lazily.
+    _lazy_grids = False
 
     def _setup_geometry(self):
         mylog.debug("Counting grids.")
         self._count_grids()
 
-        mylog.debug("Initializing grid arrays.")
-        self._initialize_grid_arrays()
+        if self._load_grid_hierarchy():
+            mylog.debug("Loaded the grid hierarchy of %s grids.", self.num_grids)
+        else:
+            mylog.debug("Initializing grid arrays.")
+            self._initialize_grid_arrays()
+
+            mylog.debug("Parsing index.")
+            self._parse_index()
 
-        mylog.debug("Parsing index.")
-        self._parse_index()
+            mylog.debug("Constructing grid objects.")
+            self._populate_grid_objects()
 
-        mylog.debug("Constructing grid objects.")
-        self._populate_grid_objects()
+            self._save_grid_hierarchy()
 
         mylog.debug("Re-examining index")
         self._initialize_level_stats()
@@ -69,6 +86,112 @@ class GridIndex(Index, abc.ABC):
     def parameters(self):
         return self.dataset.parameters
 
+    def _create_grid(self, i):
+        """
+        Create the grid object at position *i* in the index from the arrays
+        of the grid hierarchy, for frontends with _lazy_grids.
+        """
+        raise NotImplementedError
+
+    @property
+    def _grid_hierarchy_filename(self):
+        if not (self._lazy_grids and ytcfg.get("yt", "grid_hierarchy_cache")):
+            return None
+        return f"{self.ds.parameter_filename}.gridindex"
+
+    def _get_grid_hierarchy_metadata(self):
+        # The stored hierarchy is only valid for the very file it was read
+        # from, and with the settings that affect how it was built.
+        source = getattr(self, "index_filename", None) or self.ds.parameter_filename
+        st = os.stat(source)
+        return {
+            "source_mtime_ns": st.st_mtime_ns,
+            "source_size": st.st_size,
+            "num_grids": int(self.num_grids),
+            "float_type": str(self.float_type),
+            "dataset_type": str(self.dataset_type),
+            "grid_class": self.grid.__name__,
+            "reconstruct_index": bool(ytcfg.get("yt", "reconstruct_index")),
+        }
+
+    def _get_grid_hierarchy_arrays(self):
+        arrays = {name: np.asarray(getattr(self, name)) for name in self._index_properties}
+        parents = np.full(self.num_grids, -1, dtype="int64")
+        children = []
+        num_children = np.zeros(self.num_grids, dtype="int64")
+        filenames = {}
+        filename_index = np.full(self.num_grids, -1, dtype="int32")
+        for i, g in enumerate(self.grids):
+            parent = g.Parent
+            if isinstance(parent, list):
+                parent = parent[0] if parent else None
+            if parent is not None:
+                parents[i] = parent.id - parent._id_offset
+            ids = [c.id - c._id_offset for c in g.Children]
+            children.extend(ids)
+            num_children[i] = len(ids)
+            if g.filename is not None:
+                fn = os.path.relpath(g.filename, self.directory)
+                filename_index[i] = filenames.setdefault(fn, len(filenames))
+        arrays["grid_parents"] = parents
+        arrays["grid_children_offsets"] = np.concatenate([[0], num_children.cumsum()])
+        arrays["grid_children"] = np.array(children, dtype="int64")
+        arrays["grid_filename_index"] = filename_index
+        arrays["grid_filenames"] = np.array(list(filenames), dtype="S")
+        return arrays
+
+    def _set_grid_hierarchy_arrays(self, arrays):
+        self.grid_left_edge = self.ds.arr(arrays["grid_left_edge"], "code_length")
+        self.grid_right_edge = self.ds.arr(arrays["grid_right_edge"], "code_length")
+        self.grid_dimensions = arrays["grid_dimensions"]
+        self.grid_levels = arrays["grid_levels"]
+        self.grid_particle_count = arrays["grid_particle_count"]
+        self._grid_parents = arrays["grid_parents"]
+        self._grid_children_offsets = arrays["grid_children_offsets"]
+        self._grid_children = arrays["grid_children"]
+        self._grid_filename_index = arrays["grid_filename_index"]
+        self._grid_filenames = [fn.decode() for fn in arrays["grid_filenames"]]
+
+    def _get_grid_children(self, i):
+        start, stop = self._grid_children_offsets[i : i + 2]
+        return self._grid_children[start:stop]
+
+    def _get_grid_filename(self, i):
+        fi = self._grid_filename_index[i]
+        if fi == -1:
+            return None
+        return os.path.join(self.directory, self._grid_filenames[fi])
+
+    def _load_grid_hierarchy(self):
+        fn = self._grid_hierarchy_filename
+        if fn is None or not os.path.isfile(fn):
+            return False
+        try:
+            metadata, arrays = read_grid_hierarchy(fn)
+        except (OSError, ValueError, KeyError) as e:
+            mylog.debug("Could not read the grid hierarchy from %s: %s", fn, e)
+            return False
+        if metadata != self._get_grid_hierarchy_metadata():
+            mylog.debug("The grid hierarchy in %s is out of date.", fn)
+            return False
+        self._set_grid_hierarchy_arrays(arrays)
+        self.grids = LazyGridArray(self.num_grids, self._create_grid)
+        self.max_level = self.grid_levels.max()
+        return True
+
+    def _save_grid_hierarchy(self):
+        fn = self._grid_hierarchy_filename
+        if fn is None or self.comm.rank not in (0, None):
+            return
+        if not os.access(os.path.dirname(os.path.abspath(fn)), os.W_OK):
+            return
+        try:
+            write_grid_hierarchy(
+                fn, self._get_grid_hierarchy_arrays(), self._get_grid_hierarchy_metadata()
+            )
+        except OSError as e:
+            mylog.debug("Could not write the grid hierarchy to %s: %s", fn, e)
+
     def _detect_output_fields_backup(self):
         # grab fields from backup file as well, if present
         return
@@ -238,47 +361,63 @@ class GridIndex(Index, abc.ABC):
         for item in ("Mpc", "pc", "AU", "cm"):
             print(f"\tWidth: {dx.in_units(item):0.3e}")
 
-    def _find_field_values_at_points(self, fields, coords):
+    def _find_field_values_at_points(self, fields, coords, interpolation="nearest"):
         r"""Find the value of fields at a set of coordinates.
 
         Returns the values [field1, field2,...] of the fields at the given
         (x, y, z) points. Returns a numpy array of field values cross coords
+
+        Points are sorted by the leaf grid containing them, so that each grid
+        is read once. With interpolation="trilinear", values are interpolated
+        between the centers of the cells surrounding each point, using one
+        layer of ghost zones around each grid. Points outside of the domain
+        get NaN values.
         """
+        if interpolation not in ("nearest", "trilinear"):
+            raise ValueError(
+                f"Unknown interpolation {interpolation!r}, "
+                "expected 'nearest' or 'trilinear'."
+            )
+        if interpolation == "trilinear" and self.ds.dimensionality != 3:
+            raise NotImplementedError(
+                "Trilinear interpolation is only implemented for 3D datasets."
+            )
         coords = self.ds.arr(ensure_numpy_array(coords), "code_length")
-        grids = self._find_points(coords[:, 0], coords[:, 1], coords[:, 2])[0]
+        pos = np.ascontiguousarray(coords.d.reshape(-1, 3), dtype="float64")
         fields = list(iter_fields(fields))
-        mark = np.zeros(3, dtype="int64")
-        out = []
-
-        # create point -> grid mapping
-        grid_index = {}
-        for coord_index, grid in enumerate(grids):
-            if grid not in grid_index:
-                grid_index[grid] = []
-            grid_index[grid].append(coord_index)
+        gind = self._find_grid_indices(pos[:, 0], pos[:, 1], pos[:, 2])
 
         out = []
         for field in fields:
             funit = self.ds._get_field_info(field).units
-            out.append(self.ds.arr(np.empty(len(coords)), funit))
-
-        for grid in grid_index:
-            cellwidth = (grid.RightEdge - grid.LeftEdge) / grid.ActiveDimensions
+            out.append(self.ds.arr(np.full(len(pos), np.nan), funit))
+
+        # group points by grid
+        order = np.argsort(gind, kind="stable")
+        sorted_gind = gind[order]
+        bounds = np.flatnonzero(np.diff(sorted_gind)) + 1
+        starts = np.concatenate([[0], bounds])
+        stops = np.concatenate([bounds, [len(pos)]])
+        for start, stop in zip(starts, stops, strict=True):
+            if start == stop or sorted_gind[start] < 0:
+                continue
+            grid = self.grids[sorted_gind[start]]
+            pind = order[start:stop]
+            if interpolation == "nearest":
+                values = _sample_nearest(grid, fields, pos[pind])
+            else:
+                values = _sample_trilinear(grid, fields, pos[pind])
             for field_index, field in enumerate(fields):
-                for coord_index in grid_index[grid]:
-                    mark = (coords[coord_index, :] - grid.LeftEdge) / cellwidth
-                    mark = np.array(mark, dtype="int64")
-                    out[field_index][coord_index] = grid[field][
-                        mark[0], mark[1], mark[2]
-                    ]
+                out[field_index].d[pind] = values[field]
+            grid.clear_data()
         if len(fields) == 1:
             return out[0]
         return out
 
-    def _find_points(self, x, y, z):
+    def _find_grid_indices(self, x, y, z):
         """
-        Returns the (objects, indices) of leaf grids
-        containing a number of (x,y,z) points
+        Returns the indices of leaf grids containing a number of (x,y,z)
+        points, without creating the corresponding grid objects.
         """
         x = ensure_numpy_array(x)
         y = ensure_numpy_array(y)
@@ -288,10 +427,28 @@ class GridIndex(Index, abc.ABC):
 
         grid_tree = self._get_grid_tree()
         pts = MatchPointsToGrids(grid_tree, len(x), x, y, z)
-        ind = pts.find_points_in_tree()
+        return pts.find_points_in_tree()
+
+    def _find_points(self, x, y, z):
+        """
+        Returns the (objects, indices) of leaf grids
+        containing a number of (x,y,z) points
+        """
+        ind = self._find_grid_indices(x, y, z)
         return self.grids[ind], ind
 
     def _get_grid_tree(self):
+        if isinstance(self.grids, LazyGridArray):
+            # build the tree from the arrays, without creating every grid
+            return GridTree(
+                self.num_grids,
+                self.grid_left_edge.astype("float64"),
+                self.grid_right_edge.astype("float64"),
+                self.grid_dimensions.astype("int32"),
+                self._grid_parents.astype("int64"),
+                self.grid_levels[:, 0].astype("int64"),
+                np.diff(self._grid_children_offsets),
+            )
         left_edge = self.ds.arr(np.zeros((self.num_grids, 3)), "code_length")
         right_edge = self.ds.arr(np.zeros((self.num_grids, 3)), "code_length")
         level = np.zeros((self.num_grids), dtype="int64")
@@ -359,6 +516,66 @@ class GridIndex(Index, abc.ABC):
         count = sum(g.count(dobj.selector) for g in grids)
         return count
 
+    def _get_field_cache_node(self, field):
+        # Per-grid values of derived fields are stored in the data file under a
+        # node named after a hash of the dataset checksum, the yt version, the
+        # definition of the field and of all the derived fields it depends on,
+        # and the on-disk fields it reads, so that any change to these
+        # invalidates previously stored values.  Fields depending on field
+        # parameters, or whose dependencies cannot be determined, are never
+        # stored.
+        if self._data_file is None or not ytcfg.get("yt", "derived_field_cache"):
+            return None
+        if field in self._field_cache_nodes:
+            return self._field_cache_nodes[field]
+        from yt import __version__
+
+        node = None
+        fd = self.ds.field_dependencies.get(field, None)
+        checksum = self.ds.checksum
+        if fd is not None and len(fd.requested_parameters) == 0:
+            definitions = self._get_definition_hashes(field)
+            if checksum != "notafile" and definitions is not None:
+                m = hashlib.md5(f"{checksum};{__version__}".encode())
+                for definition in definitions:
+                    m.update(definition.encode())
+                for dep in sorted(str(f) for f in fd.requested):
+                    m.update(dep.encode("utf-8"))
+                node = f"/derived_field_cache/{m.hexdigest()}"
+        self._field_cache_nodes[field] = node
+        return node
+
+    def _get_definition_hashes(self, field):
+        # The definition hashes of *field* and of the derived fields it
+        # depends on, recursively, or None if these cannot be determined.
+        from yt.fields.field_plan import get_dependency_graph
+
+        graph = get_dependency_graph(self.ds, field)
+        if graph is None:
+            return None
+        return sorted(
+            f"{name};{self.ds._get_field_info(name)._get_definition_hash()}"
+            for name in graph
+            if name not in self.field_list
+        )
+
+    def _get_cached_field(self, obj, field):
+        node = self._get_field_cache_node(field)
+        if node is None:
+            return None
+        return self.get_data(node, "grid_%010i" % (obj.id - obj._id_offset))
+
+    def _store_cached_field(self, obj, field, data):
+        node = self._get_field_cache_node(field)
+        if node is None:
+            return
+        self.save_data(
+            getattr(data, "d", data),
+            node,
+            "grid_%010i" % (obj.id - obj._id_offset),
+            passthrough=True,
+        )
+
     def _chunk_all(self, dobj, cache=True, fast_index=None):
         gobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         fast_index = fast_index or getattr(dobj._current_chunk, "_fast_index", None)
@@ -377,17 +594,22 @@ class GridIndex(Index, abc.ABC):
         preload_fields, _ = self._split_fields(preload_fields)
         if self._preload_implemented and len(preload_fields) > 0 and ngz == 0:
             giter = ChunkDataCache(list(giter), preload_fields, self)
-        for og in giter:
-            if ngz > 0:
-                g = og.retrieve_ghost_zones(ngz, [], smoothed=True)
-            else:
-                g = og
-            size = self._count_selection(dobj, [og])
-            if size == 0:
-                continue
-            # We don't want to cache any of the masks or icoords or fcoords for
-            # individual grids.
-            yield YTDataChunk(dobj, "spatial", [g], size, cache=False)
+        try:
+            for og in giter:
+                if ngz > 0:
+                    g = og.retrieve_ghost_zones(ngz, [], smoothed=True)
+                else:
+                    g = og
+                size = self._count_selection(dobj, [og])
+                if size == 0:
+                    continue
+                # We don't want to cache any of the masks or icoords or fcoords
+                # for individual grids.
+                yield YTDataChunk(dobj, "spatial", [g], size, cache=False)
+        finally:
+            # stop reading ahead if the chunks are not all consumed
+            if isinstance(giter, ChunkDataCache):
+                giter.close()
 
     _grid_chunksize = 1000
 
@@ -500,6 +722,42 @@ class GridIndex(Index, abc.ABC):
         )
 
 
+def _sample_nearest(grid, fields, pos):
+    # values of the cells containing the points
+    dims = grid.ActiveDimensions
+    ijk = ((pos - grid.LeftEdge.d) / grid.dds.d).astype("int64")
+    np.clip(ijk, 0, dims - 1, out=ijk)
+    return {field: grid[field].d[ijk[:, 0], ijk[:, 1], ijk[:, 2]] for field in fields}
+
+
+def _sample_trilinear(grid, fields, pos):
+    # interpolate between the centers of the cells surrounding the points,
+    # which may be ghost zones
+    dims = grid.ActiveDimensions
+    LE = grid.LeftEdge.d
+    dds = grid.dds.d
+    bins = [LE[i] + (np.arange(dims[i] + 2) - 0.5) * dds[i] for i in range(3)]
+    ijk = np.floor((pos - LE) / dds + 0.5).astype("int64")
+    np.clip(ijk, 0, dims, out=ijk)
+    gz = grid.retrieve_ghost_zones(1, fields, smoothed=False)
+    values = {}
+    for field in fields:
+        output = np.empty(len(pos), dtype="float64")
+        TrilinearlyInterpolate(
+            np.ascontiguousarray(gz[field].d, dtype="float64"),
+            np.ascontiguousarray(pos[:, 0]),
+            np.ascontiguousarray(pos[:, 1]),
+            np.ascontiguousarray(pos[:, 2]),
+            *bins,
+            np.ascontiguousarray(ijk[:, 0]),
+            np.ascontiguousarray(ijk[:, 1]),
+            np.ascontiguousarray(ijk[:, 2]),
+            output,
+        )
+        values[field] = output
+    return values
+
+
 def _grid_sort_id(g):
     return g.id
 
@@ -0,0 +1,152 @@
+"""
+Storage of the grid hierarchy of patch AMR datasets in a sidecar file. The
+same format stores the positions of the octs of RAMSES domains.
+
+The file starts with a magic string, followed by the length of a JSON header
+(as a little-endian 64 bit integer) and the header itself. The header holds
+free-form metadata and the dtype, shape and offset of each array, which are
+stored raw, aligned on 64 bytes, after the header. Arrays are memory-mapped
+when the file is read back.
+"""
+
+import json
+import os
+import struct
+
+import numpy as np
+
+_MAGIC = b"YTGRIDH\x00"
+# bump this whenever the layout of the file or the meaning of its arrays changes
+_VERSION = 1
+_ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def write_grid_hierarchy(fn, arrays, metadata):
+    """
+    Write the *arrays* (a dict of numpy arrays) and *metadata* (a
+    JSON-serializable dict) to *fn*.
+    """
+    arrays = {name: np.ascontiguousarray(arr) for name, arr in arrays.items()}
+    layout = {}
+    offset = 0
+    for name, arr in arrays.items():
+        layout[name] = {"dtype": arr.dtype.str, "shape": arr.shape, "offset": offset}
+        offset = _align(offset + arr.nbytes)
+    header = json.dumps(
+        {"version": _VERSION, "metadata": metadata, "arrays": layout}
+    ).encode("utf-8")
+    data_start = _align(len(_MAGIC) + 8 + len(header))
+
+    # write to a temporary file first so that concurrent processes never
+    # read a partially written file
+    tmp_fn = f"{fn}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_fn, "wb") as f:
+            f.write(_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            for name, arr in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(arr.tobytes())
+        os.replace(tmp_fn, fn)
+    finally:
+        if os.path.exists(tmp_fn):
+            os.remove(tmp_fn)
+
+
+def read_grid_hierarchy(fn):
+    """
+    Return the metadata and the arrays stored in *fn*. Arrays are
+    memory-mapped copy-on-write, so they can be modified in memory without
+    altering the file.
+
+    Raises OSError if the file does not exist or if it was written with a
+    different version of the format.
+    """
+    with open(fn, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise OSError(f"{fn} is not a grid hierarchy file")
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size).decode("utf-8"))
+    if header["version"] != _VERSION:
+        raise OSError(
+            f"The grid hierarchy in {fn} was stored with version "
+            f"{header['version']} of the format (expected {_VERSION})."
+        )
+    data_start = _align(len(_MAGIC) + 8 + header_size)
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        shape = tuple(spec["shape"])
+        if np.prod(shape) == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+            continue
+        arrays[name] = np.memmap(
+            fn, dtype=dtype, mode="c", offset=data_start + spec["offset"], shape=shape
+        )
+    return header["metadata"], arrays
+
+
+class LazyGridArray:
+    """
+    A stand-in for the object array holding the grids of an index, which
+    creates each grid the first time it is accessed.
+
+    It supports the kinds of indexing of a 1D numpy array: integers, slices,
+    boolean masks and integer arrays. Accessing several grids at once returns
+    a numpy object array.
+    """
+
+    ndim = 1
+    dtype = np.dtype("object")
+
+    def __init__(self, num_grids, create_grid):
+        self._grids = np.empty(num_grids, dtype="object")
+        self._created = np.zeros(num_grids, dtype="bool")
+        self._create_grid = create_grid
+
+    def _get(self, i):
+        if not self._created[i]:
+            # creating a grid may in turn create its parents
+            self._grids[i] = self._create_grid(int(i))
+            self._created[i] = True
+        return self._grids[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple) and len(key) == 1:
+            key = key[0]
+        if isinstance(key, (int, np.integer)):
+            return self._get(range(len(self))[key])
+        ind = np.arange(len(self))[key]
+        for i in ind[~self._created[ind]]:
+            self._get(i)
+        return self._grids[ind]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._get(i)
+
+    def __len__(self):
+        return len(self._grids)
+
+    @property
+    def size(self):
+        return len(self)
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    @property
+    def num_created(self):
+        return int(self._created.sum())
+
+    def tolist(self):
+        return list(self)
+
+    def __array__(self, dtype=None, copy=None):
+        return self[:]
@@ -15,7 +15,7 @@ cimport numpy as np
 
 import numpy as np
 
-from libc.math cimport floor
+from libc.math cimport NAN, floor
 
 from .oct_visitors cimport (
     NeighbourCellIndexVisitor,
@@ -759,13 +759,14 @@ cdef class OctreeContainer:
         for key in dest_fields:
             dest = dest_fields[key]
             source = source_fields[key]
-            for i in range(levels.shape[0]):
-                lvl = levels[i]
-                if lvl != level: continue
-                if file_inds[i] < 0:
-                    dest[i + offset] = np.nan
-                else:
-                    dest[i + offset] = source[file_inds[i], cell_inds[i]]
+            with nogil:
+                for i in range(levels.shape[0]):
+                    lvl = levels[i]
+                    if lvl != level: continue
+                    if file_inds[i] < 0:
+                        dest[i + offset] = NAN
+                    else:
+                        dest[i + offset] = source[file_inds[i], cell_inds[i]]
 
     def fill_index(self, SelectorObject selector = AlwaysSelector(None)):
         """Get the on-file index of each cell"""
@@ -855,15 +856,16 @@ cdef class OctreeContainer:
             dest = dest_fields[key]
             source = source_fields[key]
             count = 0
-            for i in range(level_inds.shape[0]):
-                lev = level_inds[i]
-                dom = domain_inds[i]
-                if lev != level or dom != domain: continue
-                count += 1
-                if file_inds[i] < 0:
-                    dest[i + offset] = np.nan
-                else:
-                    dest[i + offset] = source[file_inds[i], cell_inds[i]]
+            with nogil:
+                for i in range(level_inds.shape[0]):
+                    lev = level_inds[i]
+                    dom = domain_inds[i]
+                    if lev != level or dom != domain: continue
+                    count += 1
+                    if file_inds[i] < 0:
+                        dest[i + offset] = NAN
+                    else:
+                        dest[i + offset] = source[file_inds[i], cell_inds[i]]
         return count
 
     @cython.boundscheck(False)
@@ -1,6 +1,7 @@
 import numpy as np
 
 from yt.fields.field_detector import FieldDetector
+from yt.funcs import ensure_numpy_array, iter_fields
 from yt.geometry.geometry_handler import Index
 from yt.utilities.logger import ytLogger as mylog
 
@@ -24,6 +25,95 @@ class OctreeIndex(Index):
     def convert(self, unit):
         return self.dataset.conversion_factors[unit]
 
+    def _locate_point_domains(self, coords):
+        """
+        Return the id of the domain owning each of the points, or None if it
+        cannot be known without reading the domains.
+        """
+        return None
+
+    def _find_field_values_at_points(self, fields, coords, interpolation="nearest"):
+        r"""Find the value of fields at a set of coordinates.
+
+        Returns the values [field1, field2,...] of the fields at the given
+        (x, y, z) points. Returns a numpy array of field values cross coords
+
+        Each point is assigned once to the domain owning it, and each of these
+        domains is read only over a region enclosing its own points. Points
+        that cannot be assigned up front are looked up in all the domains
+        intersecting the region enclosing them. Points outside of the domain
+        get NaN values.
+        """
+        if interpolation != "nearest":
+            raise NotImplementedError(
+                "Only the 'nearest' interpolation is implemented for octrees."
+            )
+        ds = self.dataset
+        coords = ds.arr(ensure_numpy_array(coords), "code_length").reshape(-1, 3)
+        fields = list(iter_fields(fields))
+        out = []
+        for field in fields:
+            funit = ds._get_field_info(field).units
+            out.append(ds.arr(np.full(len(coords), np.nan), funit))
+
+        remaining = np.all(
+            (coords >= ds.domain_left_edge) & (coords <= ds.domain_right_edge),
+            axis=1,
+        )
+        domain_ids = None
+        if remaining.any():
+            domain_ids = self._locate_point_domains(coords[remaining])
+        if domain_ids is not None:
+            inds = np.flatnonzero(remaining)
+            order = np.argsort(domain_ids, kind="stable")
+            inds = inds[order]
+            unique_ids, starts = np.unique(domain_ids[order], return_index=True)
+            for domain_id, idx in zip(
+                unique_ids, np.split(inds, starts[1:]), strict=True
+            ):
+                found = self._sample_points(fields, coords, idx, out, domain_id)
+                # The owner of a cell may differ from the owner of the point
+                # on domain boundaries, look for these in the neighbours.
+                if not found.all():
+                    self._sample_points(fields, coords, idx[~found], out)
+        elif remaining.any():
+            self._sample_points(fields, coords, np.flatnonzero(remaining), out)
+        if len(fields) == 1:
+            return out[0]
+        return out
+
+    def _sample_points(self, fields, coords, idx, out, domain_id=None):
+        # Sample the fields at the points *idx* in the domains (or only in
+        # *domain_id*) intersecting the region enclosing them, and return
+        # the mask of the points that were found.
+        ds = self.dataset
+        pos = coords[idx]
+        # Pad the region by the size of the coarsest cells, so that it
+        # selects all the cells containing points.
+        pad = ds.domain_width / ds.domain_dimensions
+        left_edge = np.maximum(pos.min(axis=0) - pad, ds.domain_left_edge)
+        right_edge = np.minimum(pos.max(axis=0) + pad, ds.domain_right_edge)
+        region = ds.box(left_edge, right_edge)
+        found = np.zeros(len(idx), dtype="bool")
+        for chunk in region.chunks([], "spatial"):
+            for obj in chunk._current_chunk.objs:
+                if found.all():
+                    break
+                if domain_id is not None and obj.domain_id != domain_id:
+                    continue
+                todo = np.flatnonzero(~found)
+                hit = None
+                for field_index, field in enumerate(fields):
+                    # spatial arrays are (nz, nz, nz, nocts), and the cell
+                    # identifier numbers cells oct by oct
+                    mesh_values = obj[field].d.T.reshape(-1)
+                    values = obj.mesh_sampling_particle_field(pos[todo], mesh_values)
+                    if hit is None:
+                        hit = ~np.isnan(values)
+                    out[field_index].d[idx[todo[hit]]] = values[hit]
+                found[todo[hit]] = True
+        return found
+
     def _add_mesh_sampling_particle_field(self, deposit_field, ftype, ptype):
         units = self.ds.field_info[ftype, deposit_field].units
         take_log = self.ds.field_info[ftype, deposit_field].take_log
@@ -1,18 +1,25 @@
 import collections
 import errno
+import mmap
+import multiprocessing
 import os
 import struct
+import sys
+import threading
 import weakref
+from contextlib import contextmanager
 
 import numpy as np
 from ewah_bool_utils.ewah_bool_wrap import BoolArrayCollection
 
+from yt.config import ytcfg
 from yt.data_objects.index_subobjects.particle_container import ParticleContainer
 from yt.funcs import get_pbar, is_sequence, only_on_root
 from yt.geometry.geometry_handler import Index, YTDataChunk
 from yt.geometry.particle_oct_container import ParticleBitmap
 from yt.utilities.lib.fnv_hash import fnv_hash
 from yt.utilities.logger import ytLogger as mylog
+from yt.utilities.on_demand_imports import _h5py as h5py
 from yt.utilities.parallel_tools.parallel_analysis_interface import parallel_objects
 
 
@@ -32,6 +39,74 @@ def validate_index_order(index_order):
     return index_order
 
 
+# The index being built by worker processes and the arguments of its refined
+# step. Workers are forked, so that they inherit them instead of unpickling them.
+_index_worker_state = None
+
+
+@contextmanager
+def _index_worker_pool(index, nprocs, refined_args=None):
+    global _index_worker_state
+    _index_worker_state = (index, refined_args)
+    try:
+        with multiprocessing.get_context("fork").Pool(nprocs) as pool:
+            yield pool
+    finally:
+        _index_worker_state = None
+
+
+def _other_threads():
+    # The threads running besides this one, except for the monitor thread of
+    # tqdm progress bars, which does not take any lock of the libraries used
+    # to read data.
+    return [
+        t
+        for t in threading.enumerate()
+        if t is not threading.current_thread() and type(t).__name__ != "TMonitor"
+    ]
+
+
+def _split_files(nfiles, nprocs):
+    # several batches per process, to balance the load and report progress
+    nbatches = min(nfiles, 8 * nprocs)
+    return [b.tolist() for b in np.array_split(np.arange(nfiles), nbatches)]
+
+
+def _bounding_box_worker(file_indices):
+    index, _ = _index_worker_state
+    bounds = [index._data_file_bounding_box(index.data_files[i]) for i in file_indices]
+    file_min, file_max = zip(*bounds, strict=True)
+    return np.min(file_min, axis=0), np.max(file_max, axis=0)
+
+
+def _coarse_index_worker(file_indices):
+    index, _ = _index_worker_state
+    bitmaps = index._bitmaps
+    # the particle counts of this batch only, they are summed by the parent
+    for regions in bitmaps.values():
+        regions.particle_counts[:] = 0
+    max_hsml = dict.fromkeys(bitmaps, 0.0)
+    for i in file_indices:
+        for key, hsml in index._coarse_index_data_file(index.data_files[i]).items():
+            max_hsml[key] = max(max_hsml[key], hsml)
+    counts = {key: regions.particle_counts for key, regions in bitmaps.items()}
+    return len(file_indices), max_hsml, counts
+
+
+def _refined_index_worker(file_indices):
+    index, refined_args = _index_worker_state
+    results = {}
+    for i in file_indices:
+        data_file = index.data_files[i]
+        colls = index._refined_index_data_file(data_file, *refined_args)
+        results[i] = (data_file.file_id, _dump_collections(colls))
+    return results
+
+
+def _dump_collections(colls):
+    return {key: b"" if coll is None else coll.dumps() for key, coll in colls.items()}
+
+
 class ParticleIndexInfo:
     def __init__(self, order1, order2, filename, mutable_index):
         self._order1 = order1
@@ -62,6 +137,10 @@ class ParticleIndexInfo:
         return self._order2_orig
 
 
+# bump this whenever the layout of the per particle type indexes changes
+_ptype_index_version = 1
+
+
 class ParticleIndex(Index):
     """The Index subclass for particle datasets"""
 
@@ -161,27 +240,16 @@ class ParticleIndex(Index):
             global_rootonly=True,
         )
 
+        if not hasattr(self.ds, "_file_hash"):
+            self.ds._file_hash = self._generate_hash()
+
+        # Load Morton index from file if provided
+        fname = getattr(ds, "index_filename", None) or f"{ds.parameter_filename}.ewah"
+
         # if we have not yet set domain_left_edge and domain_right_edge then do
         # an I/O pass over the particle coordinates to determine a bounding box
         if self.ds.domain_left_edge is None:
-            min_ppos = np.empty(3, dtype="float64")
-            min_ppos[:] = np.nan
-            max_ppos = np.empty(3, dtype="float64")
-            max_ppos[:] = np.nan
-            only_on_root(
-                mylog.info,
-                "Bounding box cannot be inferred from metadata, reading "
-                "particle positions to infer bounding box",
-            )
-            for df in self.data_files:
-                for _, ppos in self.io._yield_coordinates(df):
-                    min_ppos = np.nanmin(np.vstack([min_ppos, ppos]), axis=0)
-                    max_ppos = np.nanmax(np.vstack([max_ppos, ppos]), axis=0)
-            only_on_root(
-                mylog.info,
-                f"Load this dataset with bounding_box=[{min_ppos}, {max_ppos}] "
-                "to avoid I/O overhead from inferring bounding_box.",
-            )
+            min_ppos, max_ppos = self._initialize_bounding_box(fname)
             ds.domain_left_edge = ds.arr(1.05 * min_ppos, "code_length")
             ds.domain_right_edge = ds.arr(1.05 * max_ppos, "code_length")
             ds.domain_width = ds.domain_right_edge - ds.domain_left_edge
@@ -202,38 +270,35 @@ class ParticleIndex(Index):
         else:
             dont_cache = False
 
-        if not hasattr(self.ds, "_file_hash"):
-            self.ds._file_hash = self._generate_hash()
-
-        # Load Morton index from file if provided
-        fname = getattr(ds, "index_filename", None) or f"{ds.parameter_filename}.ewah"
-
         self.pii = ParticleIndexInfo(order1, order2, fname, mutable_index)
 
-        self.regions = ParticleBitmap(
-            ds.domain_left_edge,
-            ds.domain_right_edge,
-            ds.periodicity,
-            self.ds._file_hash,
-            len(self.data_files),
-            index_order1=self.pii.order1,
-            index_order2=self.pii.order2_orig,
-        )
+        # Either a single bitmap index for all particle types, or one per
+        # particle type, each with its own refined order and collisions.
+        self.regions = None
+        self.ptype_regions = {}
+        if ytcfg.get("yt", "particle_type_indexes"):
+            counts = self._get_particle_type_counts()
+            for ptype in sorted(pt for pt, count in counts.items() if count > 0):
+                self.ptype_regions[ptype] = self._create_bitmap()
+        else:
+            self.regions = self._create_bitmap()
 
         dont_load = dont_cache and not hasattr(ds, "index_filename")
         try:
             if dont_load:
                 raise OSError
-            rflag, max_hsml = self.regions.load_bitmasks(fname)
-            if max_hsml > 0.0 and self.pii.mutable_index:
-                self._order2_update(max_hsml)
-            rflag = self.regions.check_bitmasks()
+            max_hsml = self._load_bitmaps(fname)
+            for key, regions in self._bitmaps.items():
+                if max_hsml[key] > 0.0 and self.pii.mutable_index:
+                    self._order2_update(max_hsml[key], regions)
+            rflag = all(regions.check_bitmasks() for regions in self._bitmaps.values())
             self._initialize_frontend_specific()
-            if rflag == 0:
+            if not rflag:
                 raise OSError
             self.pii._is_loaded = True
         except (OSError, struct.error):
-            self.regions.reset_bitmasks()
+            for regions in self._bitmaps.values():
+                regions.reset_bitmasks()
             max_hsml = self._initialize_coarse_index()
             self._initialize_refined_index()
             wdir = os.path.dirname(fname)
@@ -241,55 +306,264 @@ class ParticleIndex(Index):
                 # Sometimes os mis-reports whether a directory is writable,
                 # So pass if writing the bitmask file fails.
                 try:
-                    self.regions.save_bitmasks(fname, max_hsml)
+                    self._save_bitmaps(fname, max_hsml)
                 except OSError:
                     pass
-            rflag = self.regions.check_bitmasks()
 
         self.ds.index_order = (self.pii.order1, self.pii.order2)
 
-    def _order2_update(self, max_hsml):
+    def _create_bitmap(self):
+        ds = self.ds
+        return ParticleBitmap(
+            ds.domain_left_edge,
+            ds.domain_right_edge,
+            ds.periodicity,
+            ds._file_hash,
+            len(self.data_files),
+            index_order1=self.pii.order1,
+            index_order2=self.pii.order2_orig,
+        )
+
+    @property
+    def _bitmaps(self):
+        # the bitmap indexes, keyed by particle type, or by None for the single
+        # index of all particle types
+        if self.regions is not None:
+            return {None: self.regions}
+        return self.ptype_regions
+
+    def _bitmap_key(self, ptype):
+        return None if self.regions is not None else ptype
+
+    def _load_bitmaps(self, fname):
+        # Load the bitmap indexes from fname and return the maximum smoothing
+        # length each of them was built with. Raises OSError if they are not
+        # found.
+        if self.regions is not None:
+            _, max_hsml = self.regions.load_bitmasks(fname)
+            return {None: max_hsml}
+        if not os.path.isfile(fname):
+            raise OSError
+        with h5py.File(fname, mode="r") as f:
+            version = f.get("particle_types", f).attrs.get("version")
+        if version != _ptype_index_version:
+            raise OSError(f"No per particle type index found in {fname}")
+        max_hsml = {}
+        for ptype, regions in self.ptype_regions.items():
+            _, max_hsml[ptype] = regions.load_bitmasks(
+                fname, group=f"particle_types/{ptype}"
+            )
+        return max_hsml
+
+    def _save_bitmaps(self, fname, max_hsml):
+        if self.regions is not None:
+            self.regions.save_bitmasks(fname, max_hsml[None])
+            return
+        for ptype, regions in self.ptype_regions.items():
+            regions.save_bitmasks(
+                fname, max_hsml[ptype], group=f"particle_types/{ptype}"
+            )
+        with h5py.File(fname, mode="a") as f:
+            f.require_group("particle_types").attrs["version"] = _ptype_index_version
+
+    def _order2_update(self, max_hsml, regions=None):
         # By passing this in, we only allow index_order2 to be increased by
         # two at most, never increased.  One place this becomes particularly
         # useful is in the case of an extremely small section of gas
         # particles embedded in a much much larger domain.  The max
         # smoothing length will be quite small, so based on the larger
         # domain, it will correspond to a very very high index order, which
-        # is a large amount of memory!  Having multiple indexes, one for
-        # each particle type, would fix this.
-        new_order2 = self.regions.update_mi2(max_hsml, self.pii.order2 + 2)
-        self.pii.order2 = new_order2
+        # is a large amount of memory!  With the particle_type_indexes
+        # option, only the index of the gas particles is refined that much.
+        if regions is None:
+            regions = self.regions
+        regions.update_mi2(max_hsml, regions.index_order2 + 2)
+        self.pii.order2 = max(r.index_order2 for r in self._bitmaps.values())
+
+    def _initialize_bounding_box(self, fname):
+        # The extrema of the particle positions are stored next to the bitmap
+        # index, under the hash of the data files, as the index itself
+        # depends on the domain edges inferred from them.
+        key = f"bounding_box/{self.ds._file_hash}"
+        if self.ds._file_hash != -1 and os.path.isfile(fname):
+            try:
+                with h5py.File(fname, mode="r") as f:
+                    if key in f:
+                        return f[key][0], f[key][1]
+            except OSError:
+                pass
+
+        only_on_root(
+            mylog.info,
+            "Bounding box cannot be inferred from metadata, reading "
+            "particle positions to infer bounding box",
+        )
+        min_ppos = np.full(3, np.inf)
+        max_ppos = np.full(3, -np.inf)
+        nprocs = self._get_index_processes()
+        if nprocs > 0:
+            with _index_worker_pool(self, nprocs) as pool:
+                results = pool.imap_unordered(
+                    _bounding_box_worker, _split_files(len(self.data_files), nprocs)
+                )
+                for file_min, file_max in results:
+                    np.minimum(min_ppos, file_min, out=min_ppos)
+                    np.maximum(max_ppos, file_max, out=max_ppos)
+        else:
+            for data_file in parallel_objects(self.data_files):
+                file_min, file_max = self._data_file_bounding_box(data_file)
+                np.minimum(min_ppos, file_min, out=min_ppos)
+                np.maximum(max_ppos, file_max, out=max_ppos)
+        min_ppos = self.comm.mpi_allreduce(min_ppos, op="min")
+        max_ppos = self.comm.mpi_allreduce(max_ppos, op="max")
+        only_on_root(
+            mylog.info,
+            f"Load this dataset with bounding_box=[{min_ppos}, {max_ppos}] "
+            "to avoid I/O overhead from inferring bounding_box.",
+        )
+
+        if self.ds._file_hash != -1 and self.comm.rank == 0:
+            try:
+                with h5py.File(fname, mode="a") as f:
+                    if key in f:
+                        del f[key]
+                    f[key] = np.stack([min_ppos, max_ppos])
+            except OSError:
+                # as for the bitmap index, the file may not be writable
+                pass
+        return min_ppos, max_ppos
+
+    def _data_file_bounding_box(self, data_file):
+        file_min = np.full(3, np.inf)
+        file_max = np.full(3, -np.inf)
+        for _, ppos in self.io._yield_coordinates(data_file):
+            if len(ppos) == 0:
+                continue
+            np.minimum(file_min, ppos.min(axis=0), out=file_min)
+            np.maximum(file_max, ppos.max(axis=0), out=file_max)
+        return file_min, file_max
+
+    def _get_index_processes(self):
+        # number of worker processes to build the bitmap index with, or 0 to
+        # build it in this process
+        nprocs = min(ytcfg.get("yt", "index_processes"), len(self.data_files))
+        if nprocs < 2 or self.comm.size > 1:
+            return 0
+        if "fork" not in multiprocessing.get_all_start_methods():
+            mylog.debug("Cannot fork worker processes, building the index serially")
+            return 0
+        if sys.platform == "darwin":
+            # forking is not safe with the system libraries of macOS
+            mylog.debug("Not forking worker processes on macOS")
+            return 0
+        if len(_other_threads()) > 0:
+            # a forked process would inherit the locks held by other threads
+            # (e.g. the HDF5 one) and could deadlock on them
+            mylog.info(
+                "Building the index serially, as worker processes cannot be "
+                "forked safely while other threads are running"
+            )
+            return 0
+        return nprocs
+
+    def _coarse_index_data_file(self, data_file):
+        # returns the maximum smoothing length of the particles of each index
+        bitmaps = self._bitmaps
+        max_hsml = dict.fromkeys(bitmaps, 0.0)
+        for ptype, pos in self.io._yield_coordinates(data_file):
+            key = self._bitmap_key(ptype)
+            if key not in bitmaps:
+                continue
+            ds = self.ds
+            if hasattr(ds, "_sph_ptypes") and ptype == ds._sph_ptypes[0]:
+                hsml = self.io._get_smoothing_length(data_file, pos.dtype, pos.shape)
+                if hsml is not None and hsml.size > 0.0:
+                    max_hsml[key] = max(max_hsml[key], hsml.max())
+            else:
+                hsml = None
+            bitmaps[key]._coarse_index_data_file(pos, hsml, data_file.file_id)
+        return max_hsml
+
+    def _refined_index_data_file(
+        self, data_file, masks, sub_mi1, sub_mi2, count_threshold, mask_threshold
+    ):
+        # returns the collection of refined cells of each index
+        bitmaps = self._bitmaps
+        colls = dict.fromkeys(bitmaps)
+        nsub_mi = 0
+        for ptype, pos in self.io._yield_coordinates(data_file):
+            key = self._bitmap_key(ptype)
+            if pos.size == 0 or key not in bitmaps:
+                continue
+            if hasattr(self.ds, "_sph_ptypes") and ptype == self.ds._sph_ptypes[0]:
+                hsml = self.io._get_smoothing_length(data_file, pos.dtype, pos.shape)
+            else:
+                hsml = None
+            nsub_mi, colls[key] = bitmaps[key]._refined_index_data_file(
+                colls[key],
+                pos,
+                hsml,
+                masks[key],
+                sub_mi1,
+                sub_mi2,
+                data_file.file_id,
+                nsub_mi,
+                count_threshold=count_threshold,
+                mask_threshold=mask_threshold,
+            )
+        return colls
 
     def _initialize_coarse_index(self):
-        max_hsml = 0.0
+        bitmaps = self._bitmaps
+        max_hsml = dict.fromkeys(bitmaps, 0.0)
         pb = get_pbar("Initializing coarse index ", len(self.data_files))
-        for i, data_file in parallel_objects(enumerate(self.data_files)):
-            pb.update(i + 1)
-            for ptype, pos in self.io._yield_coordinates(data_file):
-                ds = self.ds
-                if hasattr(ds, "_sph_ptypes") and ptype == ds._sph_ptypes[0]:
-                    hsml = self.io._get_smoothing_length(
-                        data_file, pos.dtype, pos.shape
-                    )
-                    if hsml is not None and hsml.size > 0.0:
-                        max_hsml = max(max_hsml, hsml.max())
-                else:
-                    hsml = None
-                self.regions._coarse_index_data_file(pos, hsml, data_file.file_id)
+        nprocs = self._get_index_processes()
+        if nprocs > 0:
+            # the masks of each file are filled in by the worker processes
+            # through shared memory, while particle counts are summed here
+            shared = {}
+            for key, regions in bitmaps.items():
+                masks = regions.masks
+                shared[key] = mmap.mmap(-1, max(masks.nbytes, 1))
+                regions.masks = np.ndarray(masks.shape, masks.dtype, buffer=shared[key])
+                regions.masks[:] = masks
+            ndone = 0
+            with _index_worker_pool(self, nprocs) as pool:
+                for nfiles, hsml, pcounts in pool.imap_unordered(
+                    _coarse_index_worker, _split_files(len(self.data_files), nprocs)
+                ):
+                    for key, regions in bitmaps.items():
+                        regions.particle_counts += pcounts[key]
+                        max_hsml[key] = max(max_hsml[key], hsml[key])
+                    ndone += nfiles
+                    pb.update(ndone)
+            for key, regions in bitmaps.items():
+                regions.masks = np.array(regions.masks)
+                shared[key].close()
+        else:
+            for i, data_file in parallel_objects(enumerate(self.data_files)):
+                pb.update(i + 1)
+                for key, hsml in self._coarse_index_data_file(data_file).items():
+                    max_hsml[key] = max(max_hsml[key], hsml)
         pb.finish()
-        self.regions.masks = self.comm.mpi_allreduce(self.regions.masks, op="sum")
-        self.regions.particle_counts = self.comm.mpi_allreduce(
-            self.regions.particle_counts, op="sum"
-        )
-        for data_file in self.data_files:
-            self.regions._set_coarse_index_data_file(data_file.file_id)
-        self.regions.find_collisions_coarse()
-        if max_hsml > 0.0 and self.pii.mutable_index:
-            self._order2_update(max_hsml)
+        for key, regions in bitmaps.items():
+            regions.masks = self.comm.mpi_allreduce(regions.masks, op="sum")
+            regions.particle_counts = self.comm.mpi_allreduce(
+                regions.particle_counts, op="sum"
+            )
+            for data_file in self.data_files:
+                regions._set_coarse_index_data_file(data_file.file_id)
+            regions.find_collisions_coarse()
+            if max_hsml[key] > 0.0 and self.pii.mutable_index:
+                self._order2_update(max_hsml[key], regions)
         return max_hsml
 
     def _initialize_refined_index(self):
-        mask = self.regions.masks.sum(axis=1).astype("uint8")
+        bitmaps = self._bitmaps
+        masks = {
+            key: regions.masks.sum(axis=1).astype("uint8")
+            for key, regions in bitmaps.items()
+        }
         max_npart = max(sum(d.total_particles.values()) for d in self.data_files) * 28
         sub_mi1 = np.zeros(max_npart, "uint64")
         sub_mi2 = np.zeros(max_npart, "uint64")
@@ -301,57 +575,43 @@ class ParticleIndex(Index):
             mask_threshold,
             count_threshold,
         )
-        total_refined = 0
-        total_coarse_refined = (
-            (mask >= 2) & (self.regions.particle_counts > count_threshold)
-        ).sum()
+        total_coarse_refined = sum(
+            ((masks[key] >= 2) & (regions.particle_counts > count_threshold)).sum()
+            for key, regions in bitmaps.items()
+        )
         mylog.debug(
             "This should produce roughly %s zones, for %s of the domain",
             total_coarse_refined,
-            100 * total_coarse_refined / mask.size,
+            100 * total_coarse_refined / sum(mask.size for mask in masks.values()),
         )
+        args = (masks, sub_mi1, sub_mi2, count_threshold, mask_threshold)
         storage = {}
-        for sto, (i, data_file) in parallel_objects(
-            enumerate(self.data_files), storage=storage
-        ):
-            coll = None
-            pb.update(i + 1)
-            nsub_mi = 0
-            for ptype, pos in self.io._yield_coordinates(data_file):
-                if pos.size == 0:
-                    continue
-                if hasattr(self.ds, "_sph_ptypes") and ptype == self.ds._sph_ptypes[0]:
-                    hsml = self.io._get_smoothing_length(
-                        data_file, pos.dtype, pos.shape
-                    )
-                else:
-                    hsml = None
-                nsub_mi, coll = self.regions._refined_index_data_file(
-                    coll,
-                    pos,
-                    hsml,
-                    mask,
-                    sub_mi1,
-                    sub_mi2,
-                    data_file.file_id,
-                    nsub_mi,
-                    count_threshold=count_threshold,
-                    mask_threshold=mask_threshold,
-                )
-                total_refined += nsub_mi
-            sto.result_id = i
-            if coll is None:
-                coll_str = b""
-            else:
-                coll_str = coll.dumps()
-            sto.result = (data_file.file_id, coll_str)
+        nprocs = self._get_index_processes()
+        if nprocs > 0:
+            # the collections are serialized by the worker processes
+            with _index_worker_pool(self, nprocs, args) as pool:
+                for results in pool.imap_unordered(
+                    _refined_index_worker, _split_files(len(self.data_files), nprocs)
+                ):
+                    storage.update(results)
+                    pb.update(len(storage))
+        else:
+            for sto, (i, data_file) in parallel_objects(
+                enumerate(self.data_files), storage=storage
+            ):
+                pb.update(i + 1)
+                colls = self._refined_index_data_file(data_file, *args)
+                sto.result_id = i
+                sto.result = (data_file.file_id, _dump_collections(colls))
         pb.finish()
         for i in sorted(storage):
-            file_id, coll_str = storage[i]
-            coll = BoolArrayCollection()
-            coll.loads(coll_str)
-            self.regions.bitmasks.append(file_id, coll)
-        self.regions.find_collisions_refined()
+            file_id, coll_strs = storage[i]
+            for key, coll_str in coll_strs.items():
+                coll = BoolArrayCollection()
+                coll.loads(coll_str)
+                bitmaps[key].append_refined_collection(file_id, coll)
+        for regions in bitmaps.values():
+            regions.find_collisions_refined()
 
     def _detect_output_fields(self):
         # TODO: Add additional fields
@@ -385,14 +645,13 @@ class ParticleIndex(Index):
                 dobj._chunk_info = [dobj]
             else:
                 # TODO: only return files
+                file_ptypes = None
                 if getattr(dobj.selector, "is_all_data", False):
-                    nfiles = self.regions.nfiles
+                    nfiles = len(self.data_files)
                     dfi = np.arange(nfiles)
                 else:
-                    dfi, file_masks, addfi = self.regions.identify_file_masks(
-                        dobj.selector
-                    )
-                    nfiles = len(file_masks)
+                    dfi, file_ptypes = self._identify_data_files(dobj.selector)
+                    nfiles = len(dfi)
                 dobj._chunk_info = [None for _ in range(nfiles)]
 
                 # The following was moved here from ParticleContainer in order
@@ -414,6 +673,8 @@ class ParticleIndex(Index):
                         [self.data_files[dfi[i]]],
                         domain_id=domain_id,
                     )
+                    if file_ptypes is not None:
+                        dobj._chunk_info[i].ptypes = file_ptypes[dfi[i]]
                 # NOTE: One fun thing about the way IO works is that it
                 # consolidates things quite nicely.  So we should feel free to
                 # create as many objects as part of the chunk as we want, since
@@ -423,6 +684,26 @@ class ParticleIndex(Index):
                 # like.
         (dobj._current_chunk,) = self._chunk_all(dobj)
 
+    def _identify_data_files(self, selector):
+        # Return the indices of the data files touched by the selector, along
+        # with the particle types selected in each of them (None if all).
+        if self.regions is not None:
+            dfi, _, _ = self.regions.identify_file_masks(selector)
+            return dfi, None
+        return self._identify_ptype_files(selector)
+
+    def _identify_ptype_files(self, selector):
+        # Select the files touched by the selector according to the index of
+        # each particle type, and return them along with the particle types
+        # selected in each of them.
+        file_ptypes = collections.defaultdict(set)
+        for ptype, regions in self.ptype_regions.items():
+            dfi, _, _ = regions.identify_file_masks(selector)
+            for i in dfi:
+                file_ptypes[int(i)].add(ptype)
+        dfi = np.array(sorted(file_ptypes), dtype="int64")
+        return dfi, file_ptypes
+
     def _chunk_all(self, dobj):
         oobjs = getattr(dobj._current_chunk, "objs", dobj._chunk_info)
         yield YTDataChunk(dobj, "all", oobjs, None)
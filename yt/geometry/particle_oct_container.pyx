@@ -52,11 +52,10 @@ from .oct_container cimport (
 from .oct_visitors cimport cind
 from .selection_routines cimport AlwaysSelector, SelectorObject
 
-from yt.funcs import get_pbar
-
 from ewah_bool_utils.ewah_bool_wrap cimport BoolArrayCollection
 
 import os
+import zlib
 
 from ewah_bool_utils.ewah_bool_wrap cimport (
     BoolArrayCollectionUncompressed as BoolArrayColl,
@@ -65,7 +64,7 @@ from ewah_bool_utils.ewah_bool_wrap cimport (
 )
 
 
-_bitmask_version = np.uint64(5)
+_bitmask_version = np.uint64(7)
 
 
 
@@ -445,6 +444,15 @@ cdef class ParticleBitmap:
     cdef public FileBitmasks bitmasks
     cdef public BoolArrayCollection collisions
     cdef public int _used_mi2
+    # serialized bitmasks of the files (memory-mapped from the index file),
+    # which are decoded the first time they are needed
+    cdef public object _encoded_bitmasks
+    cdef public object _encoded_offsets
+    cdef public object _encoded_checksums
+    cdef public object _decoded_files
+    # the files with particles in each coarse cell, in CSR format
+    cdef public object _coarse_file_offsets
+    cdef public object _coarse_files
 
     def __init__(self, left_edge, right_edge, periodicity, file_hash, nfiles,
                  index_order1, index_order2):
@@ -478,6 +486,7 @@ cdef class ParticleBitmap:
         self.particle_counts = np.zeros(1 << (index_order1 * 3), dtype="uint64")
         self.bitmasks = FileBitmasks(self.nfiles)
         self.collisions = BoolArrayCollection()
+        self._encoded_bitmasks = None
         hash_data = bytearray()
         hash_data.extend(self.file_hash.to_bytes(8, "little", signed=True))
         hash_data.extend(np.array(self.left_edge).tobytes())
@@ -489,11 +498,46 @@ cdef class ParticleBitmap:
         self.hash_value = fnv_hash(hash_data)
 
     def _bitmask_logicaland(self, ifile, bcoll, out):
+        self._decode_files((ifile,))
         self.bitmasks._logicaland(ifile, bcoll, out)
 
     def _bitmask_intersects(self, ifile, bcoll):
+        self._decode_files((ifile,))
         return self.bitmasks._intersects(ifile, bcoll)
 
+    def _decode_files(self, file_ids):
+        # Decode the bitmasks of the given files, if they were loaded lazily
+        # and are not decoded yet.
+        if self._encoded_bitmasks is None:
+            return
+        offsets = self._encoded_offsets
+        for ifile in file_ids:
+            if self._decoded_files[ifile]:
+                continue
+            # a corrupted buffer would make the decoder abort, so it is
+            # checked beforehand
+            encoded = self._encoded_bitmasks[offsets[ifile]:offsets[ifile + 1]].tobytes()
+            if (zlib.crc32(encoded) != self._encoded_checksums[ifile]
+                    or not self.bitmasks._loads(ifile, encoded)):
+                raise OSError(f"The bitmasks of file {ifile} in the index are corrupted")
+            self._decoded_files[ifile] = 1
+        if self._decoded_files.all():
+            self._encoded_bitmasks = None
+
+    def _decode_all_files(self):
+        self._decode_files(range(self.nfiles))
+
+    def _candidate_files(self, BoolArrayCollection cmask):
+        # The files with particles in the coarse cells set in cmask, which are
+        # the only ones whose bitmasks can intersect it.
+        mi1 = (<ewah_bool_array*> cmask.ewah_keys)[0].toArray()
+        mi1 = np.array(mi1, dtype="int64")
+        starts = self._coarse_file_offsets[mi1].astype("int64")
+        counts = self._coarse_file_offsets[mi1 + 1].astype("int64") - starts
+        ind = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        ind += np.arange(ind.size)
+        return np.unique(self._coarse_files[ind])
+
     def update_mi2(self, np.float64_t characteristic_size,
                    np.uint64_t max_index_order2 = 6):
         """
@@ -655,6 +699,16 @@ cdef class ParticleBitmap:
             if mask[i] == 1:
                 bitmasks._set_coarse(file_id, i)
 
+    def append_refined_collection(self, np.uint64_t file_id,
+                                  BoolArrayCollection collection):
+        """
+        Add the refined index of a data file, as returned by
+        _refined_index_data_file in this process or in another one.  The
+        refined index order cannot change afterwards.
+        """
+        self._used_mi2 = 1
+        self.bitmasks.append(file_id, collection)
+
     @cython.boundscheck(False)
     @cython.wraparound(False)
     @cython.cdivision(True)
@@ -942,6 +996,7 @@ cdef class ParticleBitmap:
     @cython.cdivision(True)
     @cython.initializedcheck(False)
     def find_collisions(self, verbose=False):
+        self._decode_all_files()
         cdef tuple cc, rc
         cc, rc = self.bitmasks._find_collisions(self.collisions,verbose)
         return cc, rc
@@ -951,6 +1006,7 @@ cdef class ParticleBitmap:
     @cython.cdivision(True)
     @cython.initializedcheck(False)
     def find_collisions_coarse(self, verbose=False, file_list = None):
+        self._decode_all_files()
         cdef int nc, nm
         nc, nm = self.bitmasks._find_collisions_coarse(self.collisions, verbose, file_list)
         return nc, nm
@@ -963,6 +1019,7 @@ cdef class ParticleBitmap:
                             BoolArrayCollection mask2 = None):
         cdef np.ndarray[np.uint8_t, ndim=1] arr = np.zeros((1 << (self.index_order1 * 3)),'uint8')
         cdef np.uint8_t[:] arr_view = arr
+        self._decode_files((ifile,))
         self.bitmasks._select_uncontaminated(ifile, mask, arr_view, mask2)
         return arr
 
@@ -976,6 +1033,7 @@ cdef class ParticleBitmap:
         cdef np.uint8_t[:] arr_view = arr
         cdef np.ndarray[np.uint8_t, ndim=1] sfiles = np.zeros(self.nfiles,'uint8')
         cdef np.uint8_t[:] sfiles_view = sfiles
+        self._decode_all_files()
         self.bitmasks._select_contaminated(ifile, mask, arr_view, sfiles_view, mask2)
         return arr, np.where(sfiles)[0].astype('uint32')
 
@@ -984,26 +1042,59 @@ cdef class ParticleBitmap:
     @cython.cdivision(True)
     @cython.initializedcheck(False)
     def find_collisions_refined(self, verbose=False):
+        self._decode_all_files()
         cdef np.int32_t nc, nm
         nc, nm = self.bitmasks._find_collisions_refined(self.collisions,verbose)
         return nc, nm
 
     def get_bitmasks(self):
+        self._decode_all_files()
         return self.bitmasks
 
     def iseq_bitmask(self, solf):
+        self._decode_all_files()
         return self.bitmasks._iseq(solf.get_bitmasks())
 
-    def save_bitmasks(self, fname, max_hsml):
+    def save_bitmasks(self, fname, max_hsml, group=None):
         import h5py
-        cdef bytes serial_BAC
         cdef np.uint64_t ifile
+        cdef np.uint64_t ncoarse = 1 << (self.index_order1 * 3)
+        cdef np.ndarray[np.uint8_t, ndim=1] coarse = np.zeros(ncoarse, "uint8")
+        self._decode_all_files()
+        # The bitmasks of all the files are stored one after the other in a
+        # single contiguous dataset, which can be memory-mapped, along with
+        # their offsets and checksums and the files with particles in each
+        # coarse cell.
+        serial_BACs = []
+        offsets = np.zeros(self.nfiles + 1, dtype="uint64")
+        checksums = np.zeros(self.nfiles, dtype="uint32")
+        coarse_cells = []
+        coarse_files = []
+        for ifile in range(self.nfiles):
+            serial_BACs.append(self.bitmasks._dumps(ifile))
+            offsets[ifile + 1] = offsets[ifile] + len(serial_BACs[-1])
+            checksums[ifile] = zlib.crc32(serial_BACs[-1])
+            coarse[:] = 0
+            self.bitmasks._get_coarse_array(ifile, ncoarse, coarse)
+            cells = np.flatnonzero(coarse)
+            coarse_cells.append(cells)
+            coarse_files.append(np.full(cells.size, ifile, dtype="uint32"))
+        coarse_cells = np.concatenate(coarse_cells)
+        order = np.argsort(coarse_cells, kind="stable")
+        coarse_files = np.concatenate(coarse_files)[order]
+        coarse_offsets = np.searchsorted(
+            coarse_cells[order], np.arange(ncoarse + 1)
+        ).astype("uint64")
+
         with h5py.File(fname, mode="a") as fp:
+            # the bitmasks are stored in a group named after the hash, nested
+            # in *group* if given
+            root = fp if group is None else fp.require_group(group)
             try:
-                grp = fp[str(self.hash_value)]
+                grp = root[str(self.hash_value)]
                 grp.clear()
             except KeyError:
-                grp = fp.create_group(str(self.hash_value))
+                grp = root.create_group(str(self.hash_value))
 
             grp.attrs["bitmask_version"] = _bitmask_version
             grp.attrs["nfiles"] = self.nfiles
@@ -1016,30 +1107,41 @@ cdef class ParticleBitmap:
             grp.attrs["index_order1"] = self.index_order1
             grp.attrs["index_order2"] = self.index_order2
 
+            bitmasks = grp.create_dataset("bitmasks", (offsets[-1],), dtype="uint8")
             for ifile in range(self.nfiles):
-                serial_BAC = self.bitmasks._dumps(ifile)
-                grp.create_dataset(f"nfile_{ifile:05}", data=np.void(serial_BAC))
-            serial_BAC = self.collisions._dumps()
-            grp.create_dataset("collisions", data=np.void(serial_BAC))
+                if offsets[ifile + 1] > offsets[ifile]:
+                    bitmasks[offsets[ifile]:offsets[ifile + 1]] = np.frombuffer(
+                        serial_BACs[ifile], dtype="uint8"
+                    )
+            grp.create_dataset("offsets", data=offsets)
+            grp.create_dataset("checksums", data=checksums)
+            grp.create_dataset("coarse_offsets", data=coarse_offsets)
+            grp.create_dataset("coarse_files", data=coarse_files)
+            grp.create_dataset("collisions", data=np.void(self.collisions._dumps()))
 
     def check_bitmasks(self):
         return self.bitmasks._check()
 
     def reset_bitmasks(self):
+        self._encoded_bitmasks = None
         self.bitmasks._reset()
 
-    def load_bitmasks(self, fname):
+    def load_bitmasks(self, fname, group=None):
+        """
+        Load the bitmasks from fname. Only the collisions are decoded, the
+        bitmasks of each file are memory-mapped and decoded the first time
+        they are needed.
+        """
         import h5py
         cdef bint read_flag = 1
-        cdef bint irflag
         cdef np.uint64_t ver
-        cdef bint overwrite = 0
         # Verify that file is correct version
         if not os.path.isfile(fname):
             raise OSError
         with h5py.File(fname, mode="r") as fp:
             try:
-                grp = fp[str(self.hash_value)]
+                root = fp if group is None else fp[group]
+                grp = root[str(self.hash_value)]
             except KeyError:
                 raise OSError(f"Index not found in the {fname}")
 
@@ -1048,47 +1150,81 @@ cdef class ParticleBitmap:
                 max_hsml = grp.attrs["max_hsml"]
             except KeyError:
                 raise OSError(f"'max_hsml' not found in the {fname}")
-            if ver == self.nfiles and ver != _bitmask_version:
-                overwrite = 1
-                ver = 0 # Original bitmaps had number of files first
             if ver != _bitmask_version:
                 raise OSError("The file format of the index has changed since "
                               "this file was created. It will be replaced with an "
                               "updated version.")
 
-            # Read bitmap for each file
-            pb = get_pbar("Loading particle index", self.nfiles)
-            for ifile in range(self.nfiles):
-                pb.update(ifile+1)
-                irflag = self.bitmasks._loads(ifile, grp[f"nfile_{ifile:05}"][...].tobytes())
-                if irflag == 0:
-                    read_flag = 0
-            pb.finish()
+            bitmasks = grp["bitmasks"]
+            offsets = grp["offsets"][...]
+            checksums = grp["checksums"][...]
+            coarse_offsets = grp["coarse_offsets"][...]
+            coarse_files = grp["coarse_files"][...]
+            # the tables are checked now, as the bitmasks they point to are
+            # only decoded during selections
+            if (
+                offsets.size != self.nfiles + 1
+                or offsets[0] != 0
+                or offsets[-1] != bitmasks.size
+                or np.any(offsets[1:] < offsets[:-1])
+                or checksums.size != self.nfiles
+                or coarse_offsets.size != (1 << (3 * self.index_order1)) + 1
+                or coarse_offsets[0] != 0
+                or coarse_offsets[-1] != coarse_files.size
+                or np.any(coarse_offsets[1:] < coarse_offsets[:-1])
+                or np.any(coarse_files >= self.nfiles)
+            ):
+                raise OSError(f"The index in {fname} is corrupted")
+            self._coarse_file_offsets = coarse_offsets
+            self._coarse_files = coarse_files
             # Collisions
-            irflag = self.collisions._loads(grp["collisions"][...].tobytes())
-            if irflag == 0:
+            if not self.collisions._loads(grp["collisions"][...].tobytes()):
                 read_flag = 0
-
-        # Save in correct format
-        if overwrite == 1:
-            self.save_bitmasks(fname, max_hsml)
+            data_offset = bitmasks.id.get_offset()
+            if bitmasks.size == 0:
+                encoded = np.empty(0, dtype="uint8")
+            elif bitmasks.chunks is None and data_offset is not None:
+                encoded = None
+            else:
+                encoded = bitmasks[...]
+        if encoded is None:
+            if data_offset + offsets[-1] > os.path.getsize(fname):
+                raise OSError(f"The index in {fname} is truncated")
+            encoded = np.memmap(
+                fname, dtype="uint8", mode="r", offset=data_offset,
+                shape=(offsets[-1],)
+            )
+        self.bitmasks._reset()
+        self._encoded_bitmasks = encoded
+        self._encoded_offsets = offsets
+        self._encoded_checksums = checksums
+        self._decoded_files = np.zeros(self.nfiles, dtype="uint8")
+        # Decode the bitmasks of a first file, so that check_bitmasks does not
+        # run on empty bitmasks.
+        nonempty = np.flatnonzero(offsets[1:] > offsets[:-1])
+        if nonempty.size > 0:
+            self._decode_files((nonempty[0],))
         return read_flag, max_hsml
 
     def print_info(self):
         cdef np.uint64_t ifile
+        self._decode_all_files()
         for ifile in range(self.nfiles):
             self.bitmasks.print_info(ifile, "File: %03d" % ifile)
 
     def count_coarse(self, ifile):
         r"""Get the number of coarse cells set for a file."""
+        self._decode_files((ifile,))
         return self.bitmasks.count_coarse(ifile)
 
     def count_refined(self, ifile):
         r"""Get the number of cells refined for a file."""
+        self._decode_files((ifile,))
         return self.bitmasks.count_refined(ifile)
 
     def count_total(self, ifile):
         r"""Get the total number of cells set for a file."""
+        self._decode_files((ifile,))
         return self.bitmasks.count_total(ifile)
 
     def check(self):
@@ -1099,6 +1235,7 @@ cdef class ParticleBitmap:
         cdef vector[size_t].iterator it_mi1
         cdef int nm = 0, nc = 0
         cdef np.uint64_t ifile, nbitmasks
+        self._decode_all_files()
         nbitmasks = len(self.bitmasks)
         # Locate all indices with second level refinement
         for ifile in range(self.nfiles):
@@ -1131,6 +1268,7 @@ cdef class ParticleBitmap:
 
     def file_ownership_mask(self, fid):
         cdef BoolArrayCollection out
+        self._decode_files((fid,))
         out = self.bitmasks._get_bitmask(<np.uint32_t> fid)
         return out
 
@@ -1216,6 +1354,7 @@ cdef class ParticleBitmap:
         # Get bitmasks for parts of files touching the selector
         file_masks = np.array([BoolArrayCollection() for i in range(len(file_idx))],
                               dtype="object")
+        self._decode_files(file_idx)
         for i, (fid, fmask) in enumerate(zip(file_idx,file_masks)):
             self.bitmasks._logicaland(<np.uint32_t> fid, cmask, fmask)
         return file_masks
@@ -1244,14 +1383,17 @@ cdef class ParticleBitmap:
         cdef ParticleBitmapSelector morton_selector
         morton_selector = ParticleBitmapSelector(selector, self, ngz=0)
         morton_selector.fill_masks(cmask)
+        # Only decode the bitmasks of the files that may touch the selector
+        if self._encoded_bitmasks is not None:
+            self._decode_files(self._candidate_files(cmask))
         # Get bitmasks for parts of files touching the selector
-        file_idx = self.mask_to_files(cmask)
+        file_idx = self._mask_to_files(cmask)
         file_masks = np.array([BoolArrayCollection() for i in range(len(file_idx))],
                               dtype="object")
         addfile_idx = len(file_idx)*[None]
         for i, (fid, fmask) in enumerate(zip(file_idx,file_masks)):
             self.bitmasks._logicaland(<np.uint32_t> fid, cmask, fmask)
-            addfile_idx[i] = self.mask_to_files(fmask).astype('uint32')
+            addfile_idx[i] = self._mask_to_files(fmask).astype('uint32')
         return file_idx.astype('uint32'), file_masks, addfile_idx
 
     @cython.boundscheck(False)
@@ -1267,6 +1409,11 @@ cdef class ParticleBitmap:
         return self.masks_to_files(cmask_s, cmask_g), (cmask_s, cmask_g)
 
     def mask_to_files(self, BoolArrayCollection mm_s):
+        self._decode_all_files()
+        return self._mask_to_files(mm_s)
+
+    def _mask_to_files(self, BoolArrayCollection mm_s):
+        # files whose bitmasks are not decoded are never selected
         cdef FileBitmasks mm_d = self.bitmasks
         cdef np.uint32_t ifile
         cdef np.ndarray[np.uint8_t, ndim=1] file_mask_p
@@ -1282,6 +1429,7 @@ cdef class ParticleBitmap:
         return file_idx_p.astype('uint32')
 
     def masks_to_files(self, BoolArrayCollection mm_s, BoolArrayCollection mm_g):
+        self._decode_all_files()
         cdef FileBitmasks mm_d = self.bitmasks
         cdef np.uint32_t ifile
         cdef np.ndarray[np.uint8_t, ndim=1] file_mask_p
@@ -1538,6 +1686,7 @@ cdef class ParticleBitmapSelector:
         mi1 = ~(<np.uint64_t>0)
         cdef np.float64_t pos[3]
         cdef np.float64_t dds[3]
+        self.bitmap._decode_all_files()
         for i in range(3):
             pos[i] = self.DLE[i]
             dds[i] = self.DRE[i] - self.DLE[i]
@@ -0,0 +1,106 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.geometry.grid_hierarchy_cache import (
+    LazyGridArray,
+    read_grid_hierarchy,
+    write_grid_hierarchy,
+)
+from yt.loaders import load
+from yt.testing import requires_file, requires_module
+
+m7 = "DD0010/moving7_0010"
+
+
+def test_grid_hierarchy_roundtrip(tmp_path):
+    fn = tmp_path / "grids.gridindex"
+    arrays = {
+        "grid_left_edge": np.random.random((5, 3)),
+        "grid_levels": np.arange(5, dtype="int32").reshape(5, 1),
+        "grid_children": np.array([], dtype="int64"),
+        "grid_filenames": np.array(["a.cpu0000", "b.cpu0001"], dtype="S"),
+    }
+    metadata = {"num_grids": 5, "float_type": "float64"}
+    write_grid_hierarchy(fn, arrays, metadata)
+    assert os.listdir(tmp_path) == ["grids.gridindex"]
+
+    md, arrays2 = read_grid_hierarchy(fn)
+    assert md == metadata
+    assert list(arrays2) == list(arrays)
+    for name, arr in arrays.items():
+        assert_equal(arrays2[name], arr)
+        assert arrays2[name].dtype == arr.dtype
+
+    # arrays are copy-on-write
+    arrays2["grid_left_edge"][:] = 0
+    _, arrays3 = read_grid_hierarchy(fn)
+    assert_equal(arrays3["grid_left_edge"], arrays["grid_left_edge"])
+
+
+def test_grid_hierarchy_not_a_sidecar(tmp_path):
+    fn = tmp_path / "grids.gridindex"
+    fn.write_bytes(b"something else")
+    with pytest.raises(OSError):
+        read_grid_hierarchy(fn)
+
+
+def test_lazy_grid_array():
+    created = []
+
+    def create_grid(i):
+        created.append(i)
+        return f"grid {i}"
+
+    grids = LazyGridArray(6, create_grid)
+    assert len(grids) == grids.size == 6
+    assert grids[-1] == "grid 5"
+    assert_equal(grids[[1, 3]], ["grid 1", "grid 3"])
+    mask = np.array([True, False, False, True, False, False])
+    assert_equal(grids[mask], ["grid 0", "grid 3"])
+    assert_equal(grids[1:3], ["grid 1", "grid 2"])
+    assert grids.num_created == 5
+    assert list(grids) == [f"grid {i}" for i in range(6)]
+    # each grid is only created once
+    assert sorted(created) == list(range(6))
+
+
+@requires_module("h5py")
+@requires_file(m7)
+def test_grid_hierarchy_cache(tmp_path):
+    if os.path.exists(m7):
+        src = os.path.dirname(m7)
+    else:
+        src = os.path.join(ytcfg.get("yt", "test_data_dir"), os.path.dirname(m7))
+    data_dir = shutil.copytree(src, tmp_path / "DD0010")
+    fn = os.path.join(data_dir, os.path.basename(m7))
+
+    old_value = ytcfg.get("yt", "grid_hierarchy_cache")
+    try:
+        ytcfg["yt", "grid_hierarchy_cache"] = True
+        ref = load(fn)
+        ref.index
+        assert os.path.isfile(f"{fn}.gridindex")
+        ds = load(fn)
+        ds.index
+    finally:
+        ytcfg["yt", "grid_hierarchy_cache"] = old_value
+
+    assert isinstance(ds.index.grids, LazyGridArray)
+    for name in ref.index._index_properties:
+        assert_equal(getattr(ds.index, name), getattr(ref.index, name))
+    for g1, g2 in zip(ref.index.grids, ds.index.grids, strict=True):
+        assert g1.id == g2.id
+        assert g1.Level == g2.Level
+        assert g1.filename == g2.filename
+        assert getattr(g1.Parent, "id", None) == getattr(g2.Parent, "id", None)
+        assert [c.id for c in g1.Children] == [c.id for c in g2.Children]
+        assert_equal(g1.dds, g2.dds)
+
+    ad1 = ref.all_data()
+    ad2 = ds.all_data()
+    assert_equal(ad2["gas", "density"], ad1["gas", "density"])
@@ -1,3 +1,8 @@
+import numpy as np
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.geometry.geometry_handler import ChunkDataCache
 from yt.testing import assert_allclose_units, fake_amr_ds
 
 
@@ -19,3 +24,63 @@ def test_icoords_to_ires():
         assert_allclose_units(fcoords_xz[:, 1], dd.fcoords[:, 2])
         assert_allclose_units(fwidth_xz[:, 0], dd.fwidth[:, 0])
         assert_allclose_units(fwidth_xz[:, 1], dd.fwidth[:, 2])
+
+
+def test_chunk_data_cache_batches():
+    ds = fake_amr_ds()
+    grids = list(ds.index.grids)
+    fields = [("stream", "Density"), ("stream", "temperature")]
+    grid_bytes = [8 * len(fields) * np.prod(g.ActiveDimensions) for g in grids]
+    max_bytes = 3 * max(grid_bytes)
+
+    read_batches = []
+
+    def _read_chunk_data(chunk, fields):
+        read_batches.append(list(chunk.objs))
+        return {g.id: {f: g.id for f in fields} for g in chunk.objs}
+
+    ds.index.io._read_chunk_data = _read_chunk_data
+    old_background = ytcfg.get("yt", "preload_in_background")
+    try:
+        for background in (True, False):
+            ytcfg["yt", "preload_in_background"] = background
+            read_batches.clear()
+            cache = ChunkDataCache(grids, fields, ds.index, max_bytes=max_bytes)
+            assert_equal([g.id for g in cache], [g.id for g in grids])
+            assert len(read_batches) > 1
+            assert_equal(sum(read_batches, []), grids)
+            for batch in read_batches:
+                size = sum(grid_bytes[grids.index(g)] for g in batch)
+                assert len(batch) == 1 or size <= max_bytes
+    finally:
+        ytcfg["yt", "preload_in_background"] = old_background
+
+
+def test_chunk_data_cache_close():
+    ds = fake_amr_ds()
+    grids = list(ds.index.grids)
+    fields = [("stream", "Density")]
+    read_batches = []
+
+    def _read_chunk_data(chunk, fields):
+        read_batches.append(list(chunk.objs))
+        return {}
+
+    ds.index.io._read_chunk_data = _read_chunk_data
+    old_background = ytcfg.get("yt", "preload_in_background")
+    try:
+        ytcfg["yt", "preload_in_background"] = True
+        cache = ChunkDataCache(grids, fields, ds.index, max_bytes=1)
+        # nothing is read before the iteration starts
+        assert cache._executor is None
+        assert read_batches == []
+        next(cache)
+        executor = cache._executor
+        assert executor is not None
+        # abandoning the iteration stops the background thread
+        cache.close()
+        assert cache._executor is None
+        assert executor._shutdown
+        assert len(read_batches) <= 2
+    finally:
+        ytcfg["yt", "preload_in_background"] = old_background
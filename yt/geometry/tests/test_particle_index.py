@@ -0,0 +1,204 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from yt.config import ytcfg
+from yt.geometry.particle_geometry_handler import ParticleIndex
+from yt.loaders import load
+from yt.testing import fake_gadget_hdf5_ds, requires_module
+from yt.utilities.on_demand_imports import _h5py as h5py
+
+
+@requires_module("h5py")
+def test_index_processes(tmp_path):
+    old_value = ytcfg.get("yt", "index_processes")
+    try:
+        datasets = []
+        for nprocs in (0, 3):
+            ytcfg["yt", "index_processes"] = nprocs
+            ds = fake_gadget_hdf5_ds(
+                tmp_path / f"snap{nprocs}",
+                nfiles=8,
+                prng=np.random.RandomState(0x4D3D3D3),
+            )
+            ds.index
+            datasets.append(ds)
+    finally:
+        ytcfg["yt", "index_processes"] = old_value
+
+    ref, ds = datasets
+    assert len(ds.index.data_files) == 8
+    assert ds.index_order == ref.index_order
+    assert_equal(ds.index.regions.masks, ref.index.regions.masks)
+    assert_equal(ds.index.regions.particle_counts, ref.index.regions.particle_counts)
+    for nfile in range(8):
+        for count in ("count_coarse", "count_refined", "count_total"):
+            assert getattr(ds.index.regions, count)(nfile) == getattr(
+                ref.index.regions, count
+            )(nfile)
+
+    sp1 = ref.sphere([0.3, 0.5, 0.5], 0.2)
+    sp2 = ds.sphere([0.3, 0.5, 0.5], 0.2)
+    assert_equal(sp2["PartType0", "Density"], sp1["PartType0", "Density"])
+
+
+@requires_module("h5py")
+def test_index_processes_fork_safety(tmp_path, monkeypatch):
+    import yt.geometry.particle_geometry_handler as pgh
+
+    ds = fake_gadget_hdf5_ds(tmp_path / "snap", nfiles=8)
+    index = ds.index
+    old_value = ytcfg.get("yt", "index_processes")
+    try:
+        ytcfg["yt", "index_processes"] = 3
+        monkeypatch.setattr(pgh.sys, "platform", "linux")
+        monkeypatch.setattr(pgh, "_other_threads", lambda: [])
+        assert index._get_index_processes() == 3
+        # never fork while other threads are running, or on macOS
+        monkeypatch.setattr(pgh, "_other_threads", lambda: ["reader"])
+        assert index._get_index_processes() == 0
+        monkeypatch.setattr(pgh, "_other_threads", lambda: [])
+        monkeypatch.setattr(pgh.sys, "platform", "darwin")
+        assert index._get_index_processes() == 0
+    finally:
+        ytcfg["yt", "index_processes"] = old_value
+
+
+@requires_module("h5py")
+def test_bounding_box_cache(tmp_path, monkeypatch):
+    ds = fake_gadget_hdf5_ds(tmp_path, box_size=0.0)
+    ds.index
+    ad = ds.all_data()
+    ppos = ad["all", "particle_position"].to("code_length").d
+    assert_equal(ds.domain_left_edge.d, 1.05 * ppos.min(axis=0))
+    assert_equal(ds.domain_right_edge.d, 1.05 * ppos.max(axis=0))
+
+    # the bounding box is read back from the index file
+    def fail(self, data_file):
+        raise RuntimeError("the bounding box was computed again")
+
+    monkeypatch.setattr(ParticleIndex, "_data_file_bounding_box", fail)
+    ds2 = load(ds.filename)
+    ds2.index
+    assert_equal(ds2.domain_left_edge, ds.domain_left_edge)
+    assert_equal(ds2.domain_right_edge, ds.domain_right_edge)
+
+
+def _shrink_smoothing_lengths(path, nfiles):
+    import h5py
+
+    for i in range(nfiles):
+        with h5py.File(path / f"snap.{i}.hdf5", mode="r+") as f:
+            f["PartType0/SmoothingLength"][:] = 1e-4
+
+
+@requires_module("h5py")
+def test_particle_type_indexes(tmp_path):
+    # small smoothing lengths only refine the index of the gas particles
+    ref = fake_gadget_hdf5_ds(tmp_path / "ref", prng=np.random.RandomState(0x4D3D3D3))
+    _shrink_smoothing_lengths(tmp_path / "ref", 4)
+    old_value = ytcfg.get("yt", "particle_type_indexes")
+    try:
+        ytcfg["yt", "particle_type_indexes"] = True
+        ds = fake_gadget_hdf5_ds(tmp_path, prng=np.random.RandomState(0x4D3D3D3))
+        _shrink_smoothing_lengths(tmp_path, 4)
+        ds.index
+        ds2 = load(ds.filename)
+        ds2.index
+    finally:
+        ytcfg["yt", "particle_type_indexes"] = old_value
+
+    assert ds.index.regions is None
+    regions = ds.index.ptype_regions
+    assert sorted(regions) == ["PartType0", "PartType1"]
+    assert regions["PartType0"].index_order2 > regions["PartType1"].index_order2
+    assert ds.index_order == (6, regions["PartType0"].index_order2)
+    # the indexes are read back from the index file
+    assert ds2.index.pii._is_loaded
+    for ptype, ptype_regions in ds2.index.ptype_regions.items():
+        assert ptype_regions.index_order2 == regions[ptype].index_order2
+        for nfile in range(4):
+            assert ptype_regions.count_total(nfile) == regions[ptype].count_total(
+                nfile
+            )
+
+    for ptype in ("PartType0", "PartType1"):
+        sp1 = ref.sphere([0.3, 0.5, 0.5], 0.1)
+        sp2 = ds2.sphere([0.3, 0.5, 0.5], 0.1)
+        assert_equal(sp2[ptype, "ParticleIDs"], sp1[ptype, "ParticleIDs"])
+    ad = ds2.all_data()
+    assert ad["all", "particle_ones"].size == 8192
+
+
+@requires_module("h5py")
+def test_lazy_bitmap_loading(tmp_path):
+    ref = fake_gadget_hdf5_ds(tmp_path, nfiles=8)
+    ref.index
+    ds = load(ref.filename)
+    ds.index
+    regions = ds.index.regions
+    assert ds.index.pii._is_loaded
+    # the bitmasks of the files are only decoded when needed, apart from
+    # those of a first file, which are checked at load time
+    assert regions._decoded_files.sum() == 1
+
+    sp1 = ref.sphere([0.3, 0.5, 0.5], 0.05)
+    sp2 = ds.sphere([0.3, 0.5, 0.5], 0.05)
+    assert_equal(sp2["PartType0", "ParticleIDs"], sp1["PartType0", "ParticleIDs"])
+    assert 0 < regions._decoded_files.sum() < 8
+
+    prng = np.random.RandomState(0x4D3D3D3)
+    for center in prng.random_sample((10, 3)):
+        sp1 = ref.sphere(center, 0.1)
+        sp2 = ds.sphere(center, 0.1)
+        files1, masks1, addfiles1 = ref.index.regions.identify_file_masks(
+            sp1.selector
+        )
+        files2, masks2, addfiles2 = regions.identify_file_masks(sp2.selector)
+        assert_equal(files2, files1)
+        for add1, add2 in zip(addfiles1, addfiles2, strict=True):
+            assert_equal(add2, add1)
+
+    assert ds.index.regions.iseq_bitmask(ref.index.regions)
+    assert regions._decoded_files.all()
+
+
+def _corrupt_index(fname, name, corrupt):
+    with h5py.File(fname, mode="r+") as f:
+        (grp,) = f.values()
+        offsets = grp["offsets"][...]
+        corrupt(grp[name], offsets)
+
+
+@requires_module("h5py")
+def test_corrupted_bitmap_index(tmp_path):
+    ref = fake_gadget_hdf5_ds(tmp_path, nfiles=8)
+    ref.index
+    fname = f"{ref.filename}.ewah"
+    sp1 = ref.sphere([0.3, 0.5, 0.5], 0.1)
+
+    def _first_file(dset, offsets):
+        dset[offsets[0] : offsets[1]] = 255
+
+    def _out_of_range(dset, offsets):
+        dset[0] = 8
+
+    # corrupted indexes are detected at load time, and rebuilt
+    for name, corrupt in (("bitmasks", _first_file), ("coarse_files", _out_of_range)):
+        _corrupt_index(fname, name, corrupt)
+        ds = load(ref.filename)
+        ds.index
+        assert not ds.index.pii._is_loaded
+        sp2 = ds.sphere([0.3, 0.5, 0.5], 0.1)
+        assert_equal(sp2["PartType0", "ParticleIDs"], sp1["PartType0", "ParticleIDs"])
+
+    # the bitmasks of the other files are checked when they are decoded
+    def _last_file(dset, offsets):
+        dset[offsets[-2] : offsets[-1]] = 255
+
+    _corrupt_index(fname, "bitmasks", _last_file)
+    ds = load(ref.filename)
+    ds.index
+    assert ds.index.pii._is_loaded
+    with pytest.raises(OSError):
+        ds.index.regions._decode_all_files()
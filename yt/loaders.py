@@ -22,7 +22,7 @@ from yt._maintenance.deprecation import (
     issue_deprecation_warning,
 )
 from yt._typing import AnyFieldKey, AxisOrder, FieldKey
-from yt.data_objects.static_output import Dataset
+from yt.data_objects.static_output import Dataset, _load_dataset
 from yt.funcs import levenshtein_distance
 from yt.sample_data.api import lookup_on_disk_data
 from yt.utilities.decompose import decompose_array, get_psize
@@ -33,6 +33,7 @@ from yt.utilities.exceptions import (
     YTSimulationNotIdentified,
     YTUnidentifiedDataType,
 )
+from yt.utilities.file_handler import cached_file_signatures
 from yt.utilities.hierarchy_inspection import find_lowest_subclasses
 from yt.utilities.lib.misc_utilities import get_box_grids_level
 from yt.utilities.logger import ytLogger as mylog
@@ -50,10 +51,43 @@ if TYPE_CHECKING:
 
 # --- Loaders for known data formats ---
 
+# The frontend last identified by load() in each directory. Outputs stored side
+# by side are usually written by the same code, so this frontend (and its
+# subclasses) is tried first. All the other known formats are still tried, so
+# that files claimed by several frontends are reported as ambiguous.
+_detected_frontends: dict[str, type[Dataset]] = {}
+
+
+def _get_load_candidates(fn, hint, args, kwargs) -> list[type[Dataset]]:
+    classes = list(output_type_registry.values())
+    directory = None
+    if not fn.startswith("http"):
+        directory = os.path.dirname(os.path.abspath(fn))
+        if (previous := _detected_frontends.get(directory)) is not None:
+            # sorting is stable, so the order of the registry is kept otherwise
+            classes.sort(key=lambda c: not issubclass(c, previous))
+
+    with cached_file_signatures():
+        candidates = [c for c in classes if c._is_valid(fn, *args, **kwargs)]
+    # Filter the candidates if a hint was given
+    if hint is not None:
+        candidates = [c for c in candidates if hint.lower() in c.__name__.lower()]
+    # Find only the lowest subclasses, i.e. most specialised front ends
+    candidates = find_lowest_subclasses(candidates)
+    if directory is not None and len(candidates) == 1:
+        _detected_frontends[directory] = candidates[0]
+    return candidates
+
 
 # FUTURE: embedded warnings need to have their stacklevel decremented when this decorator is removed
 @future_positional_only({0: "fn"}, since="4.2")
-def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **kwargs):
+def load(
+    fn: Union[str, "os.PathLike[str]"],
+    *args,
+    hint: str | None = None,
+    preserve_dtype: bool = False,
+    **kwargs,
+):
     """
     Load a Dataset or DatasetSeries object.
     The data format is automatically discovered, and the exact return type is the
@@ -72,6 +106,17 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
         a YTAmbiguousDataType exception, this argument can be used to lift ambiguity.
         Hints are case insensitive.
 
+    preserve_dtype : bool, optional
+        If True, floating point fields are returned with the precision they are
+        stored with on disk (e.g. float32), instead of being upcast to float64.
+        This halves the memory footprint and read bandwidth of single precision
+        data. Derived fields defined with ``requires_float64=True`` still see
+        their inputs as float64. Datasets loaded with and without this option
+        are cached separately. It applies to the generic readers and to the
+        Enzo, FLASH, GAMER, AMReX and Chombo ones; frontends with readers of
+        their own otherwise keep returning float64.
+        Default to False.
+
     Additional arguments, if any, are passed down to the return class.
 
     Returns
@@ -103,7 +148,9 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
     if any(wildcard in fn for wildcard in "[]?!*"):
         from yt.data_objects.time_series import DatasetSeries
 
-        return DatasetSeries(fn, *args, hint=hint, **kwargs)
+        return DatasetSeries(
+            fn, *args, hint=hint, preserve_dtype=preserve_dtype, **kwargs
+        )
 
     # This will raise FileNotFoundError if the path isn't matched
     # either in the current dir or yt.config.ytcfg['data_dir_directory']
@@ -116,17 +163,7 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
     for entrypoint in external_frontends:
         entrypoint.load()
 
-    candidates: list[type[Dataset]] = []
-    for cls in output_type_registry.values():
-        if cls._is_valid(fn, *args, **kwargs):
-            candidates.append(cls)
-
-    # Filter the candidates if a hint was given
-    if hint is not None:
-        candidates = [c for c in candidates if hint.lower() in c.__name__.lower()]
-
-    # Find only the lowest subclasses, i.e. most specialised front ends
-    candidates = find_lowest_subclasses(candidates)
+    candidates = _get_load_candidates(fn, hint, args, kwargs)
 
     if len(candidates) == 1:
         cls = candidates[0]
@@ -138,7 +175,7 @@ def load(fn: Union[str, "os.PathLike[str]"], *args, hint: str | None = None, **k
                 "Please verify your installation.",
                 stacklevel=3,
             )
-        return cls(fn, *args, **kwargs)
+        return _load_dataset(cls, fn, args, kwargs, preserve_dtype)
 
     if len(candidates) > 1:
         raise YTAmbiguousDataType(_input_fn, candidates)
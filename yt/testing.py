@@ -1095,6 +1095,54 @@ def fake_octree_ds(
     return ds
 
 
+def fake_gadget_hdf5_ds(
+    path,
+    nfiles=4,
+    npart=1024,
+    box_size=1.0,
+    prng=RandomState(0x4D3D3D3),  # noqa B008
+    **kwargs,
+):
+    """
+    Write a Gadget HDF5 snapshot split into *nfiles* files in the directory
+    *path* and load it. Each file holds *npart* gas and *npart* dark matter
+    particles, spread over a slab of the domain that overlaps with the slabs
+    of the neighbouring files. If *box_size* is 0, the domain is inferred
+    from the particle positions. Extra keyword arguments are passed to load.
+    """
+    from yt.utilities.on_demand_imports import _h5py as h5py
+
+    os.makedirs(path, exist_ok=True)
+    npart_file = np.array([npart, npart, 0, 0, 0, 0], dtype="uint32")
+    for i in range(nfiles):
+        with h5py.File(os.path.join(path, f"snap.{i}.hdf5"), mode="w") as f:
+            header = f.create_group("Header")
+            header.attrs["NumPart_ThisFile"] = npart_file
+            header.attrs["NumPart_Total"] = npart_file * nfiles
+            header.attrs["NumPart_Total_HighWord"] = np.zeros(6, dtype="uint32")
+            header.attrs["MassTable"] = np.zeros(6)
+            header.attrs["NumFilesPerSnapshot"] = nfiles
+            header.attrs["BoxSize"] = box_size
+            header.attrs["Time"] = 1.0
+            header.attrs["Redshift"] = 0.0
+            header.attrs["Omega0"] = 0.3
+            header.attrs["OmegaLambda"] = 0.7
+            header.attrs["HubbleParam"] = 0.7
+            for ptype in ("PartType0", "PartType1"):
+                group = f.create_group(ptype)
+                pos = prng.random_sample((npart, 3))
+                pos[:, 0] = ((i + 1.2 * pos[:, 0]) / nfiles) % 1.0
+                group["Coordinates"] = pos
+                group["Velocities"] = prng.normal(size=(npart, 3)).astype("float32")
+                group["ParticleIDs"] = np.arange(i * npart, (i + 1) * npart)
+                group["Masses"] = np.ones(npart, dtype="float32")
+            gas = f["PartType0"]
+            gas["SmoothingLength"] = np.full(npart, 0.5 / npart ** (1 / 3), "float32")
+            gas["Density"] = prng.random_sample(npart).astype("float32")
+            gas["InternalEnergy"] = prng.random_sample(npart).astype("float32")
+    return load(os.path.join(path, "snap.0.hdf5"), **kwargs)
+
+
 def add_noise_fields(ds):
     """Add 4 classes of noise fields to a dataset"""
     prng = RandomState(0x4D3D3D3)
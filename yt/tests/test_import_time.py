@@ -0,0 +1,66 @@
+import subprocess
+import sys
+
+# Packages that a bare "import yt" must not import, as they are what made it
+# slow: the plotting stack, the frontends and the data objects are only needed
+# once a dataset is loaded or a plot is made.
+LAZY_PACKAGES = (
+    "matplotlib",
+    "yt.visualization",
+    "yt.frontends",
+    "yt.data_objects",
+    "yt.geometry",
+)
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_footprint():
+    code = "import sys, yt; print('\\n'.join(sys.modules))"
+    modules = _run("-c", code).stdout.split()
+    imported = [
+        name
+        for name in modules
+        if any(name == pkg or name.startswith(f"{pkg}.") for pkg in LAZY_PACKAGES)
+    ]
+    assert imported == [], f"'import yt' imported {imported}"
+
+
+def test_frontend_imports():
+    # frontends can be imported on their own, before the data objects they
+    # depend on
+    for name in ("swift", "gadget", "enzo"):
+        _run("-c", f"import yt.frontends.{name}.api")
+
+
+def test_lazy_import():
+    code = (
+        "import sys, yt; "
+        "assert 'yt.visualization' not in sys.modules; "
+        "yt.load; "
+        "print('matplotlib' in sys.modules)"
+    )
+    assert _run("-c", code).stdout.strip() == "False"
+
+
+def test_lazy_data_objects():
+    # all the data objects are available on datasets, even though "import yt"
+    # does not import their modules
+    code = (
+        "import numpy as np, yt; "
+        "ds = yt.load_uniform_grid({'density': np.ones((8, 8, 8))}, (8, 8, 8)); "
+        "print(hasattr(ds, 'covering_grid'), hasattr(ds, 'smoothed_covering_grid'))"
+    )
+    assert _run("-c", code).stdout.strip() == "True True"
+
+
+def test_lazy_api():
+    import yt
+
+    assert yt.SlicePlot is yt.visualization.api.SlicePlot
+    assert "load" in dir(yt)
+    assert yt.api.load is yt.load
@@ -0,0 +1,182 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import yt.loaders
+from yt.config import ytcfg
+from yt.loaders import _get_load_candidates, load
+from yt.sample_data.api import _get_sample_data_registry
+from yt.testing import requires_module
+from yt.utilities.exceptions import YTAmbiguousDataType
+from yt.utilities.file_handler import cached_file_signatures, get_file_signature
+from yt.utilities.logger import ytLogger as mylog
+from yt.utilities.object_registries import output_type_registry
+
+
+@requires_module("h5py")
+def test_cached_file_signatures(tmp_path):
+    import h5py
+
+    fn = str(tmp_path / "data.h5")
+    with h5py.File(fn, mode="w") as f:
+        f.attrs["code"] = "test"
+        f.create_group("Header")
+
+    with cached_file_signatures():
+        signature = get_file_signature(fn)
+        assert get_file_signature(fn) is signature
+        assert signature.extension == ".h5"
+        assert signature.is_hdf5
+        assert signature.hdf5_keys == {"Header"}
+        assert signature.hdf5_attrs == {"code": "test"}
+        with signature.open_hdf5() as f1, signature.open_hdf5() as f2:
+            assert f1 is f2
+        assert f1
+    # the shared handle is closed when leaving the context
+    assert not f1
+
+    signature = get_file_signature(fn)
+    assert get_file_signature(fn) is not signature
+    assert signature.hdf5_keys == {"Header"}
+
+
+def test_file_signature_not_hdf5(tmp_path):
+    fn = tmp_path / "data.h5"
+    fn.write_bytes(b"not an hdf5 file")
+    with cached_file_signatures():
+        signature = get_file_signature(fn)
+        assert not signature.is_hdf5
+        assert signature.hdf5_keys == set()
+        assert signature.hdf5_attrs == {}
+        with pytest.raises(OSError):
+            with signature.open_hdf5():
+                pass
+
+
+class _FakeFormat:
+    checked: list[str] = []
+
+    def __init__(self, filename, *args, **kwargs):
+        self.filename = filename
+
+    @classmethod
+    def _missing_load_requirements(cls):
+        return []
+
+    @classmethod
+    def _is_valid(cls, filename, *args, **kwargs):
+        cls.checked.append(cls.__name__)
+        return Path(filename).read_text() == cls.__name__
+
+
+class FakeFormatA(_FakeFormat):
+    pass
+
+
+class FakeFormatB(_FakeFormat):
+    pass
+
+
+def test_detected_frontend_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        yt.loaders,
+        "output_type_registry",
+        {"FakeFormatA": FakeFormatA, "FakeFormatB": FakeFormatB},
+    )
+    monkeypatch.setattr(yt.loaders, "_detected_frontends", {})
+    for i, fmt in enumerate(["FakeFormatB", "FakeFormatB", "FakeFormatA"]):
+        (tmp_path / f"output_{i}").write_text(fmt)
+
+    _FakeFormat.checked.clear()
+    ds = load(tmp_path / "output_0")
+    assert isinstance(ds, FakeFormatB)
+    assert _FakeFormat.checked == ["FakeFormatA", "FakeFormatB"]
+
+    # the format found for the first output is tried first for the next ones
+    _FakeFormat.checked.clear()
+    ds = load(tmp_path / "output_1")
+    assert isinstance(ds, FakeFormatB)
+    assert _FakeFormat.checked == ["FakeFormatB", "FakeFormatA"]
+
+    _FakeFormat.checked.clear()
+    ds = load(tmp_path / "output_2")
+    assert isinstance(ds, FakeFormatA)
+    assert _FakeFormat.checked == ["FakeFormatB", "FakeFormatA"]
+
+
+class _AmbiguousFormat(_FakeFormat):
+    @classmethod
+    def _is_valid(cls, filename, *args, **kwargs):
+        cls.checked.append(cls.__name__)
+        return Path(filename).read_text() in (cls.__name__, "ambiguous")
+
+
+class AmbiguousFormatA(_AmbiguousFormat):
+    pass
+
+
+class AmbiguousFormatB(_AmbiguousFormat):
+    pass
+
+
+def test_detected_frontend_cache_ambiguous(tmp_path, monkeypatch):
+    # a file claimed by two formats is ambiguous, even next to a file whose
+    # format was identified before
+    monkeypatch.setattr(
+        yt.loaders,
+        "output_type_registry",
+        {"AmbiguousFormatA": AmbiguousFormatA, "AmbiguousFormatB": AmbiguousFormatB},
+    )
+    monkeypatch.setattr(yt.loaders, "_detected_frontends", {})
+    (tmp_path / "output_0").write_text("AmbiguousFormatB")
+    (tmp_path / "output_1").write_text("ambiguous")
+
+    assert isinstance(load(tmp_path / "output_0"), AmbiguousFormatB)
+    with pytest.raises(YTAmbiguousDataType):
+        load(tmp_path / "output_1")
+    assert isinstance(load(tmp_path / "output_1", hint="formatb"), AmbiguousFormatB)
+
+
+def _uncached_candidates(fn, load_kwargs):
+    from yt.utilities.hierarchy_inspection import find_lowest_subclasses
+
+    return find_lowest_subclasses(
+        [c for c in output_type_registry.values() if c._is_valid(fn, **load_kwargs)]
+    )
+
+
+def test_load_latency():
+    # Benchmark the detection of the format of the sample datasets that are
+    # available locally: each file is probed by every known frontend, with and
+    # without sharing the file signatures between them.
+    from yt.frontends import _all  # noqa: F401
+
+    data_dir = Path(ytcfg.get("yt", "test_data_dir"))
+    samples = []
+    for name, specs in _get_sample_data_registry().items():
+        topdir = name.removesuffix(".tar.gz")
+        fn = data_dir / topdir / (specs["load_name"] or "")
+        if os.path.exists(fn):
+            samples.append((str(fn), specs["load_kwargs"]))
+    if not samples:
+        pytest.skip("No sample data found in test_data_dir")
+
+    timings = {"uncached": 0.0, "cached": 0.0}
+    for fn, load_kwargs in samples:
+        t0 = time.perf_counter()
+        reference = _uncached_candidates(fn, load_kwargs)
+        t1 = time.perf_counter()
+        candidates = _get_load_candidates(fn, None, (), load_kwargs)
+        t2 = time.perf_counter()
+        assert candidates == reference, fn
+        timings["uncached"] += t1 - t0
+        timings["cached"] += t2 - t1
+
+    mylog.info(
+        "Format detection of %s sample datasets: %.3fs (uncached), %.3fs (cached)",
+        len(samples),
+        timings["uncached"],
+        timings["cached"],
+    )
@@ -9,6 +9,24 @@ from more_itertools import always_iterable
 from yt.utilities.configuration_tree import ConfigLeaf, ConfigNode
 
 configuration_callbacks: list[Callable[["YTConfig"], None]] = []
+_postinit_config: "YTConfig | None" = None
+
+
+def register_configuration_callback(callback: Callable[["YTConfig"], None]) -> None:
+    """
+    Register a function to be called with the configuration once yt is
+    initialized, or right away for modules imported (lazily) after that.
+    """
+    configuration_callbacks.append(callback)
+    if _postinit_config is not None:
+        callback(_postinit_config)
+
+
+def run_configuration_callbacks(config: "YTConfig") -> None:
+    global _postinit_config
+    _postinit_config = config
+    for callback in configuration_callbacks:
+        callback(config)
 
 
 def config_dir():
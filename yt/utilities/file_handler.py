@@ -1,16 +1,127 @@
+import os
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import cached_property
+
+import numpy as np
 
 from yt._maintenance.deprecation import issue_deprecation_warning
 from yt.utilities.on_demand_imports import NotAModule, _h5py as h5py
 
+_HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+
+# number of bytes read from the beginning of a file to identify its format
+_HEAD_SIZE = 4096
+
+
+class FileSignature:
+    """
+    What is needed to identify the format of a file: its extension, its first
+    bytes and, for HDF5 files, the members and attributes of its root group.
+
+    Each piece of information is read at most once. While
+    :func:`cached_file_signatures` is active, signatures are shared between
+    all the frontends that inspect the same file, and so is the handle of
+    HDF5 files returned by :meth:`open_hdf5`.
+    """
+
+    def __init__(self, filename, *, keep_open=False):
+        self.filename = os.fspath(filename)
+        self.extension = os.path.splitext(self.filename)[1].lower()
+        self._keep_open = keep_open
+        self._handle = None
+
+    @cached_property
+    def head(self) -> bytes:
+        """The first bytes of the file, or b"" if it is not a readable file."""
+        try:
+            with open(self.filename, "rb") as f:
+                return f.read(_HEAD_SIZE)
+        except Exception:
+            return b""
+
+    @property
+    def is_hdf5(self) -> bool:
+        return self.head.startswith(_HDF5_SIGNATURE)
+
+    @contextmanager
+    def open_hdf5(self):
+        """
+        Open the file with h5py, in read-only mode. Raises OSError if the
+        file is not an HDF5 file.
+        """
+        if not self.is_hdf5:
+            raise OSError(f"{self.filename} is not an HDF5 file")
+        if not self._keep_open:
+            with h5py.File(self.filename, mode="r") as f:
+                yield f
+            return
+        if self._handle is None:
+            self._handle = h5py.File(self.filename, mode="r")
+        yield self._handle
+
+    @cached_property
+    def hdf5_keys(self) -> frozenset:
+        """The names of the members of the root group of an HDF5 file."""
+        try:
+            with self.open_hdf5() as f:
+                return frozenset(f.keys())
+        except Exception:
+            return frozenset()
+
+    @cached_property
+    def hdf5_attrs(self) -> dict:
+        """The attributes of the root group of an HDF5 file."""
+        try:
+            with self.open_hdf5() as f:
+                return dict(f.attrs)
+        except Exception:
+            return {}
+
+    def close(self):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+_file_signatures: dict[str, FileSignature] | None = None
+
+
+@contextmanager
+def cached_file_signatures():
+    """
+    Share the signatures of files, and their open HDF5 handles, between all
+    the calls to :func:`get_file_signature` within this context. Handles are
+    closed when exiting the outermost context.
+    """
+    global _file_signatures
+    if _file_signatures is not None:
+        # nested contexts share the outer cache
+        yield
+        return
+    _file_signatures = {}
+    try:
+        yield
+    finally:
+        signatures, _file_signatures = _file_signatures, None
+        for signature in signatures.values():
+            signature.close()
+
+
+def get_file_signature(fn, /) -> FileSignature:
+    if _file_signatures is None:
+        return FileSignature(fn)
+    fn = os.fspath(fn)
+    if fn not in _file_signatures:
+        _file_signatures[fn] = FileSignature(fn, keep_open=True)
+    return _file_signatures[fn]
+
 
 def valid_hdf5_signature(fn: str, /) -> bool:
-    signature = b"\x89HDF\r\n\x1a\n"
     try:
-        with open(fn, "rb") as f:
-            header = f.read(8)
-            return header == signature
-    except Exception:
+        return get_file_signature(fn).is_hdf5
+    except TypeError:
         return False
 
 
@@ -25,6 +136,99 @@ def warn_h5py(fn):
         )
 
 
+class FileHandlePool:
+    """
+    A pool of open file handles, created with *open_file(filename)*, which
+    keeps the *maxsize* most recently used ones open instead of closing them.
+
+    Handles are taken out of the pool while they are in use, so that
+    concurrent users of the same file each get their own handle. Users must
+    not rely on the position of a handle when they get it.
+    """
+
+    def __init__(self, open_file, maxsize):
+        self._open_file = open_file
+        self.maxsize = maxsize
+        # idle handles, from the least to the most recently used
+        self._handles = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open(self, filename):
+        filename = os.fspath(filename)
+        handle = None
+        with self._lock:
+            for i in range(len(self._handles) - 1, -1, -1):
+                if self._handles[i][0] == filename:
+                    handle = self._handles.pop(i)[1]
+                    break
+        if handle is None:
+            handle = self._open_file(filename)
+        try:
+            yield handle
+        except BaseException:
+            handle.close()
+            raise
+        with self._lock:
+            self._handles.append((filename, handle))
+            evicted = self._handles[: max(len(self._handles) - self.maxsize, 0)]
+            del self._handles[: len(evicted)]
+        for _, old_handle in evicted:
+            old_handle.close()
+
+    def __len__(self):
+        return len(self._handles)
+
+    def close(self):
+        with self._lock:
+            handles, self._handles = self._handles, []
+        for _, handle in handles:
+            handle.close()
+
+
+class MappedFilePool:
+    """
+    Read-only memory maps of files, as arrays of bytes, which keeps the
+    *maxsize* most recently used ones mapped.
+
+    A map stays valid as long as it is referenced, even after it was evicted
+    from the pool, so that views of it can be handed out freely.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        # from the least to the most recently used
+        self._maps = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, filename):
+        filename = os.fspath(filename)
+        with self._lock:
+            mapped = self._maps.pop(filename, None)
+            if mapped is None:
+                mapped = np.memmap(filename, dtype="uint8", mode="r")
+            self._maps[filename] = mapped
+            while len(self._maps) > max(self.maxsize, 1):
+                self._maps.popitem(last=False)
+        return mapped
+
+    def view(self, filename, dtype, shape, offset, order="C"):
+        """
+        Return an array of the given *dtype* and *shape* stored at *offset* in
+        the memory map of *filename*.
+        """
+        return np.ndarray(
+            shape, dtype=dtype, buffer=self.get(filename), offset=offset, order=order
+        )
+
+    def __len__(self):
+        return len(self._maps)
+
+    def close(self):
+        with self._lock:
+            self._maps.clear()
+
+
 class HDF5FileHandler:
     handle = None
 
@@ -1,12 +1,14 @@
 import os
 from collections import defaultdict
 from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import _make_key, lru_cache
 
 import numpy as np
 
 from yt._typing import FieldKey, ParticleCoordinateTuple
+from yt.config import ytcfg
 from yt.geometry.selection_routines import GridSelector
 from yt.utilities.on_demand_imports import _h5py as h5py
 
@@ -104,15 +106,25 @@ class BaseIOHandler:
         # the base class.
         rv = {}
         nodal_fields = []
+        dtype = self._output_dtype(getattr(self, "_field_dtype", "=f8"))
         for field in fields:
             finfo = self.ds.field_info[field]
             nodal_flag = finfo.nodal_flag
             if np.any(nodal_flag):
                 num_nodes = 2 ** sum(nodal_flag)
-                rv[field] = np.empty((size, num_nodes), dtype="=f8")
+                rv[field] = np.empty((size, num_nodes), dtype=dtype)
                 nodal_fields.append(field)
             else:
-                rv[field] = np.empty(size, dtype="=f8")
+                rv[field] = np.empty(size, dtype=dtype)
+        nthreads = ytcfg.get("yt", "io_threads")
+        if nthreads > 1 and not isinstance(selector, GridSelector):
+            chunks = list(chunks)
+            offsets = self._get_selection_offsets(chunks, selector)
+            if offsets is not None:
+                self._read_fluid_selection_threaded(
+                    chunks, selector, fields, rv, offsets, nthreads
+                )
+                return rv
         ind = {field: 0 for field in fields}
         for field, obj, data in self.io_iter(chunks, fields):
             if data is None:
@@ -124,6 +136,48 @@ class BaseIOHandler:
                 ind[field] += obj.select(selector, data, rv[field], ind[field])
         return rv
 
+    def _get_selection_offsets(self, chunks, selector):
+        # Compute where each object's selected values start in the output
+        # buffers, following the same order the serial read fills them in.
+        # Objects that can't report their count up front (octree subsets
+        # return -1) make this impossible, in which case we return None.
+        offsets = {}
+        ind = 0
+        for chunk in chunks:
+            for obj in chunk.objs:
+                count = obj.count(selector)
+                if count < 0:
+                    return None
+                offsets[obj.id] = ind
+                ind += count
+        return offsets
+
+    def _read_fluid_selection_threaded(
+        self, chunks, selector, fields: list[FieldKey], rv, offsets, nthreads
+    ):
+        # Objects are grouped by the file they live in, so that each task reads
+        # a disjoint set of files and scatters into a disjoint set of offsets.
+        # Note that h5py serializes calls into libhdf5, so HDF5-based
+        # frontends mostly overlap the selection and conversion work here.
+        from yt.geometry.geometry_handler import YTDataChunk
+
+        file_objs = defaultdict(list)
+        for chunk in chunks:
+            for obj in chunk.objs:
+                file_objs[getattr(obj, "filename", None)].append(obj)
+
+        def _read_file(objs):
+            sub_chunk = YTDataChunk(chunks[0].dobj, "io", objs, cache=False)
+            for field, obj, data in self.io_iter([sub_chunk], fields):
+                if data is None:
+                    continue
+                obj.select(selector, data, rv[field], offsets[obj.id])
+
+        with ThreadPoolExecutor(max_workers=nthreads) as executor:
+            futures = [executor.submit(_read_file, objs) for objs in file_objs.values()]
+            for future in futures:
+                future.result()
+
     def io_iter(self, chunks, fields: list[FieldKey]):
         raise NotImplementedError(
             "subclassing Dataset.io_iter this is required in order to use the default "
@@ -136,9 +190,18 @@ class BaseIOHandler:
         sl[axis] = slice(coord, coord + 1)
         tr = self._read_data_set(grid, field)[tuple(sl)]
         if tr.dtype == "float32":
-            tr = tr.astype("float64")
+            tr = tr.astype(self._output_dtype(tr.dtype))
         return tr
 
+    def _output_dtype(self, dtype) -> np.dtype:
+        # Values read from disk are returned as float64, unless the dataset
+        # was loaded with preserve_dtype=True, in which case floating point
+        # data keep the precision they are stored with.
+        dtype = np.dtype(dtype)
+        if dtype.kind == "f" and getattr(self.ds, "preserve_dtype", False):
+            return dtype.newbyteorder("=")
+        return np.dtype("float64")
+
     def _read_field_names(self, grid):
         pass
 
@@ -190,6 +253,11 @@ class BaseIOHandler:
                 field_maps[field].append(field)
             data[field] = []
 
+        if ytcfg.get("yt", "two_pass_particle_reads"):
+            return self._read_particle_selection_two_pass(
+                chunks, selector, fields, ptf, field_maps
+            )
+
         # Now we read.
         for field_r, vals in self._read_particle_fields(chunks, ptf, selector):
             # Note that we now need to check the mappings
@@ -204,22 +272,95 @@ class BaseIOHandler:
             total = sum(_.size for _ in data[field_f])
             if total > 0:
                 vals = data.pop(field_f)
+                dtype = self._output_dtype(np.result_type(*vals))
                 # note: numpy.concatenate has a dtype argument that would avoid
                 # a copy using .astype(...), available in numpy>=1.20
-                rv[field_f] = np.concatenate(vals, axis=0).astype("float64")
+                rv[field_f] = np.concatenate(vals, axis=0).astype(dtype, copy=False)
             else:
-                shape = [0]
-                if field_f[1] in self._vector_fields:
-                    shape.append(self._vector_fields[field_f[1]])
-                elif field_f[1] in self._array_fields:
-                    shape.append(self._array_fields[field_f[1]])
-                rv[field_f] = np.empty(shape, dtype="float64")
+                rv[field_f] = self._empty_particle_field(field_f)
+        return rv
+
+    def _empty_particle_field(self, field: FieldKey) -> np.ndarray:
+        shape = [0]
+        if field[1] in self._vector_fields:
+            shape.append(self._vector_fields[field[1]])
+        elif field[1] in self._array_fields:
+            shape.append(self._array_fields[field[1]])
+        return np.empty(shape, dtype="float64")
+
+    def _count_selected_particles(self, chunks, ptf, selector) -> dict[str, int]:
+        # First pass of the two-pass read: count the selected particles of
+        # each type.  When everything is selected, the data files already
+        # know their particle counts and no coordinates need to be read.
+        psize: defaultdict[str, int] = defaultdict(int)
+        if getattr(selector, "is_all_data", False) and all(
+            hasattr(obj, "data_files") for chunk in chunks for obj in chunk.objs
+        ):
+            for data_file in self._get_data_files(chunks):
+                for ptype in ptf:
+                    psize[ptype] += data_file.total_particles[ptype]
+            return psize
+        for ptype, (x, y, z), hsml in self._read_particle_coords(chunks, ptf):
+            psize[ptype] += selector.count_points(x, y, z, hsml)
+        return psize
+
+    def _read_particle_selection_two_pass(
+        self, chunks, selector, fields: list[FieldKey], ptf, field_maps
+    ) -> dict[FieldKey, np.ndarray]:
+        # Instead of accumulating the values read from each data file and
+        # concatenating them at the end, we count the selected particles first
+        # and fill preallocated arrays in place, in the same order.
+        psize = self._count_selected_particles(chunks, ptf, selector)
+        sizes = dict.fromkeys(fields, 0)
+        for field_r, fields_f in field_maps.items():
+            for field_f in fields_f:
+                sizes[field_f] += psize[field_r[0]]
+        rv: dict[FieldKey, np.ndarray] = {}
+        ind = dict.fromkeys(fields, 0)
+        for field_r, vals in self._read_particle_fields(chunks, ptf, selector):
+            nvals = vals.shape[0]
+            if nvals == 0:
+                continue
+            for field_f in field_maps[field_r]:
+                if field_f not in rv:
+                    shape = (max(sizes[field_f], nvals),) + vals.shape[1:]
+                    dtype = self._output_dtype(vals.dtype)
+                    rv[field_f] = np.empty(shape, dtype=dtype)
+                arr = rv[field_f]
+                i0 = ind[field_f]
+                if i0 + nvals > arr.shape[0]:
+                    # The counting pass came up short (which happens if a
+                    # frontend selects particles differently when reading
+                    # fields), so we have to grow the output array.
+                    new_arr = np.empty((i0 + nvals,) + arr.shape[1:], dtype=arr.dtype)
+                    new_arr[:i0] = arr[:i0]
+                    arr = rv[field_f] = new_arr
+                arr[i0 : i0 + nvals] = vals
+                ind[field_f] += nvals
+        for field_f in fields:
+            if field_f not in rv:
+                rv[field_f] = self._empty_particle_field(field_f)
+            elif ind[field_f] < rv[field_f].shape[0]:
+                rv[field_f] = rv[field_f][: ind[field_f]]
         return rv
 
     def _read_particle_fields(self, chunks, ptf, selector):
         # Now we have all the sizes, and we can allocate
+        chunks = list(chunks)
+        file_ptypes = self._get_data_file_ptypes(chunks)
         for data_file in self._sorted_chunk_iterator(chunks):
-            data_file_data = self._read_particle_data_file(data_file, ptf, selector)
+            ptypes = file_ptypes.get(data_file)
+            if ptypes is None:
+                file_ptf = ptf
+            else:
+                # skip the particle types whose index does not select this file
+                file_ptf = defaultdict(list)
+                file_ptf.update((pt, f) for pt, f in ptf.items() if pt in ptypes)
+                if not file_ptf:
+                    continue
+            data_file_data = self._read_particle_data_file(
+                data_file, file_ptf, selector
+            )
             # temporary trickery so it's still an iterator, need to adjust
             # the io_handler.BaseIOHandler.read_particle_selection() method
             # to not use an iterator.
@@ -234,6 +375,20 @@ class BaseIOHandler:
                 data_files.update(obj.data_files)
         return data_files
 
+    @staticmethod
+    def _get_data_file_ptypes(chunks):
+        # the particle types to read from each data file, or None for all
+        file_ptypes = {}
+        for chunk in chunks:
+            for obj in chunk.objs:
+                ptypes = getattr(obj, "ptypes", None)
+                for data_file in getattr(obj, "data_files", ()):
+                    if ptypes is None or file_ptypes.get(data_file, ()) is None:
+                        file_ptypes[data_file] = None
+                    else:
+                        file_ptypes.setdefault(data_file, set()).update(ptypes)
+        return file_ptypes
+
     def _sorted_chunk_iterator(self, chunks):
         data_files = self._get_data_files(chunks)
         yield from sorted(data_files, key=lambda x: (x.filename, x.start))